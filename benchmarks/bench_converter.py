@@ -0,0 +1,115 @@
+# benchmarks/bench_converter.py
+"""
+Compare the row-by-row and vectorized UPS workbook conversions.
+
+Builds synthetic tracking workbook sheets with the same names and columns as the
+UPS Project Tracking sheet, checks both engines produce the same CSV and
+prints the conversion time of each.
+
+Usage:
+    python benchmarks/bench_converter.py [--sizes 1000 10000 100000] [--rowwise-max 10000]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from data_converter import build_gantt_frame, build_gantt_frame_rowwise
+
+
+def make_workbook(n_sites, seed=0, dated_share=0.9):
+    """
+    Create synthetic 'Project status', 'school with issues' and 'Schools to be revisted' sheets.
+
+    Like a real tracking sheet, most schools have a Deployment Date. The
+    converter chains undated schools, issues and revisits one after another,
+    so a workbook with mostly undated schools would be scheduled centuries
+    ahead (past the year 2262 at 100k sites).
+
+    Parameters:
+    n_sites (int): Number of school rows in the project sheet
+    seed (int): Random seed
+    dated_share (float): Share of schools with a Deployment Date
+
+    Returns:
+    tuple: (project_df, issues_df, revisits_df)
+    """
+    rng = np.random.default_rng(seed)
+
+    sites = np.array([f"School {i:06d}" for i in range(n_sites)], dtype=object)
+    # Section header rows like the real sheet
+    sites[0] = 'ELEMENTARY SCHOOLS'
+    sites[n_sites // 2] = 'SECONDARY SCHOOLS'
+
+    zones = rng.integers(1, 13, n_sites).astype(float)
+    zones[rng.random(n_sites) < 0.05] = np.nan
+
+    status = rng.choice(np.array(['Done', 'Started', 'Not Started', None], dtype=object), n_sites, p=[0.4, 0.1, 0.4, 0.1])
+
+    deployment = pd.Timestamp('2023-03-01') + pd.to_timedelta(rng.integers(0, 700, n_sites), unit='D')
+    deployment = pd.Series(deployment).where(rng.random(n_sites) < dated_share)
+
+    notes = rng.choice(np.array(['', 'No portable', '2 portables', None], dtype=object), n_sites)
+
+    project_df = pd.DataFrame({
+        'Sites': sites,
+        'Trustee Zones': zones,
+        'UPS Replacement Status': status,
+        'Deployment Date': deployment,
+        'Notes': notes,
+    })
+
+    n_issues = max(n_sites // 10, 1)
+    issues_df = pd.DataFrame({
+        'School ': rng.choice(sites[1:], n_issues),
+        'Issues': rng.choice(np.array(['Wall mounted rack', 'Power issue', None], dtype=object), n_issues),
+        'Status': rng.choice(np.array(['Pending', 'Resolved', 'In progress', None], dtype=object), n_issues),
+    })
+
+    n_revisits = max(n_sites // 20, 1)
+    revisits_df = pd.DataFrame({
+        'School': rng.choice(sites[1:], n_revisits),
+        'Issues': rng.choice(np.array(['Faulty UPS', 'Unused UPS', None], dtype=object), n_revisits),
+        'Status': rng.choice(np.array(['pending', 'resolved', 'done', None], dtype=object), n_revisits),
+        'Team member assigned': rng.choice(np.array(['Vishal', 'Richard', '', None], dtype=object), n_revisits),
+    })
+
+    return project_df, issues_df, revisits_df
+
+
+def time_call(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--rowwise-max', type=int, default=10000,
+                        help='Largest workbook to run the row-by-row engine on (it is quadratic)')
+    args = parser.parse_args()
+
+    today = pd.Timestamp('2025-03-10').date()
+
+    print(f"{'sites':>8} {'tasks':>8} {'rowwise (s)':>12} {'vectorized (s)':>15} {'speedup':>8}  identical")
+    for n_sites in args.sizes:
+        sheets = make_workbook(n_sites)
+        vectorized, vectorized_time = time_call(build_gantt_frame, *sheets, today)
+
+        if n_sites <= args.rowwise_max:
+            rowwise, rowwise_time = time_call(build_gantt_frame_rowwise, *sheets, today)
+            identical = rowwise.to_csv(index=False) == vectorized.drop(columns='Task_ID').to_csv(index=False)
+            print(f"{n_sites:>8} {len(vectorized):>8} {rowwise_time:>12.3f} {vectorized_time:>15.3f} "
+                  f"{rowwise_time / vectorized_time:>7.0f}x  {identical}")
+        else:
+            print(f"{n_sites:>8} {len(vectorized):>8} {'skipped':>12} {vectorized_time:>15.3f} {'-':>8}  -")
+
+
+if __name__ == "__main__":
+    main()
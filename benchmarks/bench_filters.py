@@ -0,0 +1,61 @@
+# benchmarks/bench_filters.py
+"""
+Time the Gantt chart sidebar filters on large synthetic task tables.
+
+Builds a task table from a synthetic tracking workbook, then times building
+the FilterIndex and one sidebar interaction (date window, option lists,
+category/zone/school/completion masks and taking the filtered rows).
+
+Usage:
+    python benchmarks/bench_filters.py [--sites 10000 50000]
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from bench_converter import make_workbook
+from data_converter import build_gantt_frame
+from filter_index import FilterIndex
+from task_schema import apply_task_schema
+
+
+def interaction(index, df):
+    """One rerun of the sidebar filters with a 90 day window and a few schools selected."""
+    start = date(2024, 1, 1)
+    rows = index.date_window(start, start + timedelta(days=90))
+    categories = index.options('Category', rows)
+    zones = index.options('Trustee_Zone', rows)
+    schools = index.options('School', rows)
+    rows = index.select(rows, Category=categories, Trustee_Zone=zones[:6], School=schools[:50])
+    rows &= index.incomplete
+    return df[rows]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sites', type=int, nargs='+', default=[10000, 50000])
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'sites':>8} {'tasks':>8} {'index (ms)':>11} {'filter (ms)':>12} {'rows':>8}")
+    for n_sites in args.sites:
+        df = apply_task_schema(build_gantt_frame(*make_workbook(n_sites), date(2025, 3, 10)))
+
+        start = time.perf_counter()
+        index = FilterIndex(df)
+        index_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            filtered = interaction(index, df)
+        filter_time = (time.perf_counter() - start) / args.repeat
+
+        print(f"{n_sites:>8} {len(df):>8} {index_time * 1000:>11.1f} {filter_time * 1000:>12.2f} {len(filtered):>8}")
+
+
+if __name__ == "__main__":
+    main()
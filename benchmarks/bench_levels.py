@@ -0,0 +1,72 @@
+# benchmarks/bench_levels.py
+"""
+Time the Gantt chart's level of detail on large synthetic task tables.
+
+Builds a task table from a synthetic tracking workbook and its
+TimelineLevels, then for zoom windows from the whole span down to one week
+picks the level that fits the bar budget, builds its bars and the figure,
+and reports the number of bars drawn next to the number of tasks in the
+window.
+
+Usage:
+    python benchmarks/bench_levels.py [--sites 10000 60000] [--budget 400]
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from bench_converter import make_workbook
+from data_converter import build_gantt_frame
+from filter_index import FilterIndex
+from gantt_renderer import build_gantt_figure, build_summary_figure
+from task_schema import apply_task_schema
+from timeline_levels import DEFAULT_BAR_BUDGET, TimelineLevels
+
+# Zoom windows in days from 2023-03-01; None is the whole span
+WINDOWS = [None, 3650, 365, 90, 7]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sites', type=int, nargs='+', default=[10000, 60000])
+    parser.add_argument('--budget', type=int, default=DEFAULT_BAR_BUDGET)
+    args = parser.parse_args()
+
+    today = date(2025, 3, 10)
+    first_day = date(2023, 3, 1)
+
+    print(f"{'sites':>8} {'window':>8} {'tasks':>8} {'level':>7} {'bars':>6} {'bars (s)':>9} {'figure (s)':>11}")
+    for n_sites in args.sites:
+        df = apply_task_schema(build_gantt_frame(*make_workbook(n_sites), today))
+        index = FilterIndex(df)
+
+        start = time.perf_counter()
+        levels = TimelineLevels(df, index)
+        print(f"{n_sites:>8} {'index':>8} {len(df):>8} {'':>7} {'':>6} {time.perf_counter() - start:>9.3f}")
+
+        for days in WINDOWS:
+            rows = index.date_window(first_day, first_day + timedelta(days=days)) if days else \
+                index.date_window(df['Start'].min().date(), df['Finish'].max().date())
+
+            start = time.perf_counter()
+            level = levels.choose_level(rows, args.budget)
+            bars = df[rows] if level == 'Task' else levels.summary(level, rows)
+            bars_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            if level == 'Task':
+                build_gantt_figure(bars)
+            else:
+                build_summary_figure(bars, level)
+            figure_time = time.perf_counter() - start
+
+            print(f"{n_sites:>8} {days or 'all':>8} {int(rows.sum()):>8} {level:>7} {len(bars):>6} "
+                  f"{bars_time:>9.3f} {figure_time:>11.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+# benchmarks/bench_memory.py
+"""
+Compare the memory held by the task table in the legacy and compact layouts.
+
+Builds a task table from a synthetic tracking workbook and reports bytes per
+task for one table, then for several sessions: in the legacy layout every
+session holds its own deep copy, in the compact layout sessions share the
+base table's columns and only own the columns they edited.
+
+Usage:
+    python benchmarks/bench_memory.py [--sites 10000 50000] [--sessions 10]
+"""
+import argparse
+import os
+import sys
+from datetime import date
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from bench_converter import make_workbook
+from data_converter import build_gantt_frame
+from memory_report import legacy_layout, total_bytes
+from task_schema import apply_task_schema, update_tasks
+from task_store import with_row_keys
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sites', type=int, nargs='+', default=[10000, 50000])
+    parser.add_argument('--sessions', type=int, default=10)
+    args = parser.parse_args()
+
+    pd.set_option('mode.copy_on_write', True)
+
+    print(f"{'sites':>8} {'tasks':>8} {'legacy B/task':>14} {'compact B/task':>15} "
+          f"{'legacy x' + str(args.sessions):>12} {'shared x' + str(args.sessions):>12}")
+    for n_sites in args.sites:
+        base = apply_task_schema(with_row_keys(build_gantt_frame(*make_workbook(n_sites), date(2025, 3, 10))))
+        legacy = legacy_layout(base)
+        n_tasks = len(base)
+
+        # Every session edits one note of its own
+        sessions = [
+            update_tasks(base.copy(deep=False), pd.DataFrame({'Notes': [f'session {i}']}, index=[base.index[i]]))
+            for i in range(args.sessions)
+        ]
+        legacy_sessions = [legacy.copy(deep=True) for _ in range(args.sessions)]
+
+        print(f"{n_sites:>8} {n_tasks:>8} {total_bytes([legacy]) / n_tasks:>14.1f} "
+              f"{total_bytes([base]) / n_tasks:>15.1f} "
+              f"{total_bytes(legacy_sessions) / n_tasks:>12.1f} {total_bytes([base] + sessions) / n_tasks:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+# benchmarks/bench_reruns.py
+"""
+Measure the rerun latency of each view of the app.
+
+Runs the app headless with streamlit's AppTest, once per view in a fresh
+Python process so module imports are counted. The store is seeded with a
+synthetic task table in a temporary directory. For each view it reports:
+the first page load (the Gantt Chart view, imports included), the switch
+to the view, and the median of later reruns of the view (e.g. after a
+widget change).
+
+Pass --app to measure another copy of main.py, e.g. an older checkout,
+to compare before and after a change.
+
+Usage:
+    python benchmarks/bench_reruns.py [--sites 2000] [--reruns 5] [--app path/to/main.py]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT)
+
+VIEWS = ["Gantt Chart", "Data Editor", "Project Summary", "Resource Load"]
+
+
+def measure(app, view, sites, reruns):
+    """Time one view in this process; returns the timings in seconds."""
+    app_dir = os.path.dirname(os.path.abspath(app))
+    sys.path.insert(0, app_dir)
+    sys.path.insert(0, os.path.join(ROOT, 'benchmarks'))
+
+    from bench_converter import make_workbook
+    from data_converter import build_gantt_frame
+    from streamlit.testing.v1 import AppTest
+    from task_repository import get_task_repository
+
+    # A fresh store in a scratch directory, seeded with a synthetic table
+    os.chdir(tempfile.mkdtemp())
+    os.environ['GANTT_TASK_STORE'] = os.path.abspath('bench_tasks.db')
+    get_task_repository(os.environ['GANTT_TASK_STORE']).replace_all(
+        build_gantt_frame(*make_workbook(sites), date(2025, 3, 10))
+    )
+
+    at = AppTest.from_file(os.path.abspath(app), default_timeout=600)
+    start = time.perf_counter()
+    at.run()
+    first_page = time.perf_counter() - start
+
+    start = time.perf_counter()
+    at.sidebar.radio[0].set_value(view).run()
+    switch = time.perf_counter() - start
+
+    times = []
+    for _ in range(reruns):
+        start = time.perf_counter()
+        at.run()
+        times.append(time.perf_counter() - start)
+
+    errors = [str(e.value) for e in at.exception]
+    return {'first_page': first_page, 'switch': switch, 'rerun': statistics.median(times), 'errors': errors}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--app', default=os.path.join(ROOT, 'main.py'))
+    parser.add_argument('--sites', type=int, default=2000)
+    parser.add_argument('--reruns', type=int, default=5)
+    parser.add_argument('--view', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.view:
+        print(json.dumps(measure(args.app, args.view, args.sites, args.reruns)))
+        return
+
+    print(f"{'view':>16} {'first page (s)':>15} {'switch (s)':>11} {'rerun (s)':>10}")
+    for view in VIEWS:
+        output = subprocess.run(
+            [sys.executable, __file__, '--app', args.app, '--sites', str(args.sites),
+             '--reruns', str(args.reruns), '--view', view],
+            capture_output=True, text=True, check=True
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        print(f"{view:>16} {result['first_page']:>15.2f} {result['switch']:>11.2f} {result['rerun']:>10.3f}"
+              + (f"  errors: {result['errors']}" if result['errors'] else ''))
+
+
+if __name__ == "__main__":
+    main()
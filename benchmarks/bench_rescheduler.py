@@ -0,0 +1,76 @@
+# benchmarks/bench_rescheduler.py
+"""
+Time the incremental rescheduler against a full conversion.
+
+Converts a synthetic tracking workbook, builds the rescheduler's dependencies
+and its graph for the planned dates once (the app builds the graph again for
+every shift), then slips single tasks by one day (or lengthens them) and
+times how long pushing back the tasks that follow takes, next to the time to
+convert the whole workbook again.
+
+Usage:
+    python benchmarks/bench_rescheduler.py [--sites 10000 60000] [--slips 200] [--days 1]
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from bench_converter import make_workbook
+from data_converter import build_gantt_frame
+from scheduler import Rescheduler
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sites', type=int, nargs='+', default=[10000, 60000])
+    parser.add_argument('--slips', type=int, default=200, help="Number of single-task slips to time")
+    parser.add_argument('--days', type=int, default=1, help="Days each task finishes later")
+    args = parser.parse_args()
+
+    today = date(2025, 3, 10)
+    rng = np.random.default_rng(0)
+    delay = np.timedelta64(args.days, 'D').astype('timedelta64[ns]')
+
+    print(f"{'sites':>8} {'tasks':>8} {'convert (s)':>12} {'build (s)':>10} {'graph (ms)':>11} "
+          f"{'slip median (ms)':>17} {'slip max (ms)':>14} {'moved median':>13} {'moved max':>10}")
+    for n_sites in args.sites:
+        sheets = make_workbook(n_sites)
+
+        start = time.perf_counter()
+        df = build_gantt_frame(*sheets, today)
+        convert_time = time.perf_counter() - start
+        df = df.set_index(pd.Index(df['Task_ID'].to_numpy()))
+
+        starts = df['Start'].to_numpy(dtype='datetime64[ns]')
+        finishes = df['Finish'].to_numpy(dtype='datetime64[ns]')
+        start = time.perf_counter()
+        rescheduler = Rescheduler(df)
+        build_time = time.perf_counter() - start
+        # The date-dependent graph is built again for every shift
+        start = time.perf_counter()
+        graph = rescheduler.graph(starts, finishes)
+        graph_time = time.perf_counter() - start
+
+        times, moved = [], []
+        for position in rng.choice(len(df), size=min(args.slips, len(df)), replace=False):
+            finish = finishes.copy()
+            finish[position] += delay
+            start = time.perf_counter()
+            _, _, pushed = rescheduler.propagate(graph, starts, finish, [position])
+            times.append(time.perf_counter() - start)
+            moved.append(len(pushed))
+
+        print(f"{n_sites:>8} {len(df):>8} {convert_time:>12.2f} {build_time:>10.2f} {graph_time * 1000:>11.1f} "
+              f"{np.median(times) * 1000:>17.2f} {max(times) * 1000:>14.2f} "
+              f"{int(np.median(moved)):>13} {max(moved):>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+# benchmarks/bench_resource_load.py
+"""
+Time the daily resource load and the overallocation checks on large task tables.
+
+Converts a synthetic tracking workbook (its dated schools span several years
+and its undated ones are chained for decades), then times building the
+daily load per resource, the per-resource summary, the overallocated
+periods and the weekly heatmap bins.
+
+Usage:
+    python benchmarks/bench_resource_load.py [--sites 10000 60000]
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import date
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from bench_converter import make_workbook
+from data_converter import build_gantt_frame
+from resource_load import ResourceLoad
+
+CAPACITIES = {'Delivery Team': 3, 'Installation Team': 2, 'Specialized Team': 2}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sites', type=int, nargs='+', default=[10000, 60000])
+    args = parser.parse_args()
+
+    today = date(2025, 3, 10)
+
+    print(f"{'sites':>8} {'tasks':>8} {'days':>8} {'load (s)':>9} {'summary (s)':>12} "
+          f"{'periods (s)':>12} {'heatmap (s)':>12} {'overallocated':>14}")
+    for n_sites in args.sites:
+        df = build_gantt_frame(*make_workbook(n_sites), today)
+
+        start = time.perf_counter()
+        load = ResourceLoad(df)
+        load_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        summary = load.summary(CAPACITIES)
+        summary_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        runs = load.overallocations(CAPACITIES)
+        runs_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        load.binned('Week', CAPACITIES)
+        binned_time = time.perf_counter() - start
+
+        print(f"{n_sites:>8} {len(df):>8} {len(load.days):>8} {load_time:>9.3f} {summary_time:>12.3f} "
+              f"{runs_time:>12.3f} {binned_time:>12.3f} {int(summary['Overallocated Days'].sum()):>14}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+# benchmarks/bench_scheduler.py
+"""
+Time the resource-constrained scheduler and the critical path analysis on
+large synthetic task tables.
+
+Converts a synthetic tracking workbook with and without a scheduler that has a
+few crews per team, and compares the conversion time and the project end date
+of the resource-constrained schedule with the one-after-another schedule. Then
+times the CPM passes over the scheduled table.
+
+Usage:
+    python benchmarks/bench_scheduler.py [--sites 10000 60000]
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import date
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from bench_converter import make_workbook
+from data_converter import build_gantt_frame
+from dependency_graph import CriticalPath
+from scheduler import Scheduler
+
+CAPACITIES = {'Delivery Team': 3, 'Installation Team': 2, 'Specialized Team': 2}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sites', type=int, nargs='+', default=[10000, 60000])
+    args = parser.parse_args()
+
+    today = date(2025, 3, 10)
+    scheduler = Scheduler(CAPACITIES)
+
+    print(f"{'sites':>8} {'tasks':>8} {'chained (s)':>12} {'scheduled (s)':>14} {'chained end':>12} {'scheduled end':>14} {'cpm (s)':>8} {'critical':>9}")
+    for n_sites in args.sites:
+        sheets = make_workbook(n_sites)
+
+        start = time.perf_counter()
+        chained = build_gantt_frame(*sheets, today)
+        chained_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        scheduled = build_gantt_frame(*sheets, today, scheduler=scheduler)
+        scheduled_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        cpm = CriticalPath(scheduled)
+        cpm_time = time.perf_counter() - start
+
+        print(f"{n_sites:>8} {len(scheduled):>8} {chained_time:>12.2f} {scheduled_time:>14.2f} "
+              f"{chained['Finish'].max():%Y-%m-%d}   {scheduled['Finish'].max():%Y-%m-%d} "
+              f"{cpm_time:>8.2f} {int(cpm.critical.sum()):>9}")
+
+
+if __name__ == "__main__":
+    main()
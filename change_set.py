@@ -0,0 +1,166 @@
+# change_set.py
+import numpy as np
+import pandas as pd
+
+from task_schema import concat_tasks, drop_rows, update_tasks
+from task_store import TASK_ID, next_row_key
+
+
+def _editor_rows(added_rows, like):
+    """
+    Rows added in a data editor, read from its widget state.
+
+    Parameters:
+    added_rows (list): The state's added_rows, one {column: value} dict per row
+    like (pandas.DataFrame): The editor's return value, for the columns and their types
+
+    Returns:
+    pandas.DataFrame: The rows with the editor's columns. Dates and numbers
+        are parsed from the values the editor sends; values that do not
+        parse are left missing, as the editor does.
+    """
+    rows = pd.DataFrame(list(added_rows), columns=like.columns, index=pd.RangeIndex(len(added_rows)))
+    for col in rows.columns:
+        if pd.api.types.is_datetime64_any_dtype(like[col]):
+            rows[col] = pd.to_datetime(rows[col], errors='coerce')
+        elif pd.api.types.is_numeric_dtype(like[col]) and not pd.api.types.is_bool_dtype(like[col]):
+            rows[col] = pd.to_numeric(rows[col], errors='coerce')
+    return rows
+
+
+class ChangeSet:
+    """
+    Row-level changes made to the task table in st.data_editor.
+
+    Built from the editor's own record of edited, added and deleted rows,
+    so saving touches only those rows: the table is patched instead of
+    replaced, and the task store writes only the changed rows.
+
+    Parameters:
+    edited (pandas.DataFrame): New values of the edited cells (edited columns only), indexed by row key
+    added (pandas.DataFrame): New rows, indexed by their new task IDs
+    deleted (pandas.Index): Keys of the deleted rows
+    cells (pandas.DataFrame, optional): Shaped like edited, True for the
+        cells that were changed (default: all of them). edited holds every
+        column changed in any row, so the other cells hold current values.
+    """
+
+    def __init__(self, edited, added, deleted, cells=None):
+        self.edited = edited
+        self.added = added
+        self.deleted = deleted
+        if cells is None:
+            cells = pd.DataFrame(True, index=edited.index, columns=edited.columns)
+        self.cells = cells
+
+    @classmethod
+    def from_editor(cls, state, keys, edited_df, next_key):
+        """
+        Read the changes from a data editor's widget state.
+
+        The editor must be given the rows with a RangeIndex (their positions),
+        as it reports every change by position. New rows are read from the
+        widget state rather than from edited_df: the editor only appends them
+        to its return value while the index is still a RangeIndex, which a
+        row deleted in the same edit breaks.
+
+        Parameters:
+        state (dict): st.session_state value of the editor's key
+        keys (pandas.Index): Row key of each row shown in the editor, in order
+        edited_df (pandas.DataFrame): The editor's return value
+        next_key (int): Task ID for the first added row
+
+        Returns:
+        ChangeSet: The changes
+        """
+        deleted_positions = sorted({int(p) for p in state.get('deleted_rows', [])})
+        deleted = set(deleted_positions)
+        edited_positions = sorted(int(p) for p in state.get('edited_rows', {}) if int(p) not in deleted)
+
+        columns = []
+        for position in edited_positions:
+            for col in state['edited_rows'][position]:
+                # Task IDs are fixed once assigned
+                if col in edited_df.columns and col != TASK_ID and col not in columns:
+                    columns.append(col)
+        edited = edited_df.loc[edited_positions, columns].set_axis(keys[edited_positions])
+        cells = pd.DataFrame(
+            [[col in state['edited_rows'][position] for col in columns] for position in edited_positions],
+            index=edited.index, columns=columns, dtype=bool
+        )
+
+        added = _editor_rows(state.get('added_rows', []), edited_df)
+        new_ids = np.arange(next_key, next_key + len(added), dtype='int64')
+        added = added.set_axis(new_ids).assign(**{TASK_ID: new_ids})
+
+        return cls(edited, added, keys[deleted_positions], cells)
+
+    def __bool__(self):
+        return bool(len(self.edited) and len(self.edited.columns)) or bool(len(self.added)) or bool(len(self.deleted))
+
+    @property
+    def columns(self):
+        """Columns changed by in-place edits, or None when rows were added or deleted."""
+        if len(self.added) or len(self.deleted):
+            return None
+        return list(self.edited.columns)
+
+    def rebase(self, df):
+        """
+        Return the changes adjusted to a newer version of the task table.
+
+        Edits and deletions of rows that are no longer in df are dropped, and
+        added rows are renumbered after the largest task ID in df.
+
+        Parameters:
+        df (pandas.DataFrame): The table the changes will be applied to
+
+        Returns:
+        ChangeSet: The adjusted changes
+        """
+        kept = self.edited.index.isin(df.index)
+        new_ids = np.arange(next_row_key(df), next_row_key(df) + len(self.added), dtype='int64')
+        added = self.added.set_axis(new_ids).assign(**{TASK_ID: new_ids})
+        return ChangeSet(self.edited[kept], added, self.deleted[self.deleted.isin(df.index)], self.cells[kept])
+
+    def apply(self, df):
+        """
+        Return the task table with the changes applied.
+
+        Parameters:
+        df (pandas.DataFrame): The typed task table, indexed by row key
+
+        Returns:
+        pandas.DataFrame: The changed table
+        """
+        if len(self.deleted):
+            positions = df.index.get_indexer(self.deleted)
+            df = drop_rows(df, positions[positions >= 0])
+        if len(self.edited) and len(self.edited.columns):
+            df = update_tasks(df, self.edited)
+        if len(self.added):
+            df = concat_tasks(df, self.added)
+        return df
+
+    def save(self, store, df):
+        """
+        Write only the changed rows to the task store.
+
+        Parameters:
+        store (TaskStore): The task store
+        df (pandas.DataFrame): The table returned by apply
+        """
+        if len(self.deleted):
+            store.delete(self.deleted)
+        if len(self.edited):
+            store.update(df.loc[self.edited.index])
+        if len(self.added):
+            store.append(df.loc[self.added.index])
+
+    def removed_rows(self, before):
+        """Old values of the rows the change removed or edited, for set_tasks."""
+        return before.loc[self.edited.index.append(self.deleted)]
+
+    def added_rows(self, after):
+        """New values of the rows the change added or edited, for set_tasks."""
+        return after.loc[self.edited.index.append(self.added.index)]
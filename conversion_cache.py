@@ -0,0 +1,150 @@
+# conversion_cache.py
+import hashlib
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from datetime import datetime
+
+import pandas as pd
+
+from data_converter import CONVERTER_VERSION
+
+# Default location and limits of the shared conversion cache
+DEFAULT_CACHE_DIR = '.conversion_cache'
+DEFAULT_MEMORY_ENTRIES = 16
+DEFAULT_DISK_BYTES = 256 * 1024 * 1024
+
+
+class ConversionCache:
+    """
+    Two-level cache of converted workbooks keyed by their content.
+
+    Results are kept in an in-memory LRU and in an on-disk store. The disk
+    store is trimmed least-recently-used first whenever it grows past its
+    size cap. Keys combine the SHA-256 of the workbook bytes with the
+    converter version, so a converter change never serves stale results,
+    and with the conversion date: undated tasks are scheduled from the day
+    of the conversion, so the same workbook converts to other dates on
+    another day.
+
+    Parameters:
+    cache_dir (str): Directory of the on-disk store
+    max_memory_entries (int): Number of results kept in memory
+    max_disk_bytes (int): Size cap of the on-disk store
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_memory_entries=DEFAULT_MEMORY_ENTRIES,
+                 max_disk_bytes=DEFAULT_DISK_BYTES):
+        self.cache_dir = cache_dir
+        self.max_memory_entries = max_memory_entries
+        self.max_disk_bytes = max_disk_bytes
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(data, today=None, version=CONVERTER_VERSION):
+        """
+        Return the cache key for the raw bytes of an uploaded workbook.
+
+        Parameters:
+        data (bytes): Raw bytes of the workbook
+        today (datetime.date, optional): Date the workbook is converted as of. If None, uses today
+        version (int): Converter version
+        """
+        if today is None:
+            today = datetime.now().date()
+        digest = hashlib.sha256(data).hexdigest()
+        return f"{digest}-{today.isoformat()}-v{version}"
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.pkl")
+
+    def get(self, key):
+        """
+        Look up a converted task table.
+
+        Parameters:
+        key (str): Key from ConversionCache.key
+
+        Returns:
+        pandas.DataFrame or None: A copy of the cached table, or None on a miss
+        """
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return self._memory[key].copy()
+
+        path = self._path(key)
+        try:
+            df = pd.read_pickle(path)
+            # Touch the file so disk eviction sees it as recently used
+            os.utime(path)
+        except (OSError, EOFError, ValueError, pickle.UnpicklingError):
+            return None
+
+        self._remember(key, df)
+        return df.copy()
+
+    def put(self, key, df):
+        """
+        Store a converted task table in memory and on disk.
+
+        Parameters:
+        key (str): Key from ConversionCache.key
+        df (pandas.DataFrame): The converted task table
+        """
+        df = df.copy()
+        self._remember(key, df)
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Write to a temporary file first so readers never see a partial pickle
+            tmp_path = f"{self._path(key)}.{os.getpid()}.{threading.get_ident()}.tmp"
+            df.to_pickle(tmp_path)
+            os.replace(tmp_path, self._path(key))
+            self._evict_disk()
+        except OSError as e:
+            print(f"Could not write conversion cache entry: {e}")
+
+    def _remember(self, key, df):
+        with self._lock:
+            self._memory[key] = df
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_memory_entries:
+                self._memory.popitem(last=False)
+
+    def _evict_disk(self):
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith('.pkl'):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_disk_bytes:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def get_conversion_cache():
+    """Return the process-wide conversion cache shared by all sessions."""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = ConversionCache()
+        return _default_cache
@@ -0,0 +1,207 @@
+# conversion_jobs.py
+import multiprocessing
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import CancelledError, ProcessPoolExecutor
+from datetime import datetime
+
+from data_converter import convert_ups_data
+
+# Default number of worker processes and of conversions allowed to wait for one
+DEFAULT_WORKERS = min(4, os.cpu_count() or 1)
+DEFAULT_QUEUE_DEPTH = 8
+
+# Finished jobs kept so their sessions can still collect the result
+MAX_FINISHED_JOBS = 32
+
+
+class ConversionCancelled(Exception):
+    """Raised inside a worker to stop a conversion that was cancelled."""
+
+
+class ConversionQueueFull(RuntimeError):
+    """Raised when a conversion is submitted while the queue is full."""
+
+
+def _convert_in_worker(data, today, progress, cancel):
+    """Convert workbook bytes as of `today` in a worker process, reporting rows read per sheet."""
+    def report(sheet_name, rows):
+        if cancel.is_set():
+            raise ConversionCancelled()
+        progress[sheet_name] = rows
+
+    return convert_ups_data(data, save_csv=False, progress=report, today=today)
+
+
+class ConversionJob:
+    """
+    One workbook conversion submitted to a ConversionPool.
+
+    Parameters:
+    job_id (str): Unique ID of the job
+    name (str): Name of the uploaded file, for display
+    today (datetime.date): Date the workbook is converted as of
+    future (concurrent.futures.Future): The running conversion
+    progress (dict): Shared dict of rows read so far per sheet
+    cancel (multiprocessing.Event): Set to stop the conversion
+    """
+
+    def __init__(self, job_id, name, today, future, progress, cancel):
+        self.job_id = job_id
+        self.name = name
+        self.today = today
+        self.future = future
+        self.progress = progress
+        self.cancel_event = cancel
+        self.submitted = time.time()
+        self.finished = None
+
+    @property
+    def status(self):
+        """One of 'queued', 'running', 'done', 'failed' or 'cancelled'."""
+        if self.future.cancelled():
+            return 'cancelled'
+        if not self.future.done():
+            return 'running' if self.future.running() else 'queued'
+        if isinstance(self.future.exception(), ConversionCancelled):
+            return 'cancelled'
+        return 'failed' if self.future.exception() is not None else 'done'
+
+    def done(self):
+        return self.future.done()
+
+    def rows_read(self):
+        """Return {sheet name: rows read so far} (empty until the first chunk)."""
+        try:
+            return dict(self.progress)
+        except (OSError, EOFError):
+            # The manager process has shut down
+            return {}
+
+    def cancel(self):
+        """Cancel the job: a queued job never starts, a running one stops at its next chunk."""
+        if not self.future.cancel():
+            self.cancel_event.set()
+
+    def result(self):
+        """
+        Return the converted task table of a finished job.
+
+        Raises the conversion's error if it failed, and CancelledError if it
+        was cancelled.
+        """
+        try:
+            return self.future.result()
+        except ConversionCancelled:
+            raise CancelledError() from None
+
+
+class ConversionPool:
+    """
+    Bounded pool of worker processes converting uploaded workbooks.
+
+    Conversions are CPU-bound Python, so they run in separate processes:
+    they do not hold the GIL of the Streamlit server, and several uploads
+    convert in parallel across cores. A submitted conversion gets a job ID
+    that sessions poll for progress (rows read per sheet) and completion.
+    At most `max_workers` conversions run at once and at most `queue_depth`
+    more wait for a worker; submitting beyond that raises ConversionQueueFull.
+
+    Workers are started with 'spawn', which is safe from the server's
+    threads. Progress and cancellation go through a multiprocessing manager.
+
+    Parameters:
+    max_workers (int): Number of worker processes
+    queue_depth (int): Number of conversions allowed to wait for a worker
+    on_result (callable, optional): Called as on_result(data, today, df) when a conversion
+        succeeds, with the date it was converted as of
+    """
+
+    def __init__(self, max_workers=DEFAULT_WORKERS, queue_depth=DEFAULT_QUEUE_DEPTH, on_result=None):
+        self.max_workers = max_workers
+        self.queue_depth = queue_depth
+        self.on_result = on_result
+        context = multiprocessing.get_context('spawn')
+        self._executor = ProcessPoolExecutor(max_workers=max_workers, mp_context=context)
+        self._manager = context.Manager()
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    def pending(self):
+        """Number of conversions queued or running."""
+        with self._lock:
+            return sum(not job.done() for job in self._jobs.values())
+
+    def submit(self, data, name='', today=None):
+        """
+        Queue the conversion of an uploaded workbook.
+
+        Parameters:
+        data (bytes): Raw bytes of the workbook
+        name (str): Name of the uploaded file, for display
+        today (datetime.date, optional): Date to convert the workbook as of. If None,
+            uses the day it is submitted, even if it only runs after midnight
+
+        Returns:
+        str: The job ID
+        """
+        with self._lock:
+            self._forget_finished()
+            if sum(not job.done() for job in self._jobs.values()) >= self.max_workers + self.queue_depth:
+                raise ConversionQueueFull(
+                    f"{self.max_workers + self.queue_depth} conversions are already queued or running"
+                )
+
+            if today is None:
+                today = datetime.now().date()
+            job_id = uuid.uuid4().hex
+            progress = self._manager.dict()
+            cancel = self._manager.Event()
+            future = self._executor.submit(_convert_in_worker, data, today, progress, cancel)
+            job = ConversionJob(job_id, name, today, future, progress, cancel)
+            self._jobs[job_id] = job
+        future.add_done_callback(lambda f: self._finished(job, data))
+        return job_id
+
+    def get(self, job_id):
+        """Return the job with this ID, or None if it is unknown or was forgotten."""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def cancel(self, job_id):
+        """Cancel a job by ID (no effect if it already finished)."""
+        job = self.get(job_id)
+        if job is not None:
+            job.cancel()
+
+    def _finished(self, job, data):
+        job.finished = time.time()
+        if self.on_result is not None and job.status == 'done':
+            self.on_result(data, job.today, job.future.result())
+
+    def _forget_finished(self):
+        finished = sorted(
+            (job.finished, job_id) for job_id, job in self._jobs.items() if job.done() and job.finished
+        )
+        for _, job_id in finished[:max(0, len(finished) - MAX_FINISHED_JOBS)]:
+            del self._jobs[job_id]
+
+
+_default_pool = None
+_default_pool_lock = threading.Lock()
+
+
+def get_conversion_pool(max_workers=DEFAULT_WORKERS, queue_depth=DEFAULT_QUEUE_DEPTH, on_result=None):
+    """
+    Return the process-wide conversion pool shared by all sessions.
+
+    The pool is created on first use with the given settings; later calls
+    return the same pool.
+    """
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = ConversionPool(max_workers, queue_depth, on_result)
+        return _default_pool
@@ -1,54 +1,552 @@
 # data_converter.py
 import pandas as pd
+import numpy as np
 from datetime import datetime, timedelta
+from numbers import Number
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import functools
+import glob
+import io
 import os
+import sys
+import time
 
-def convert_ups_data(excel_file_path, output_csv_path=None):
+from workbook_reader import WorkbookReader
+
+# Bump whenever a change alters the converted output, so cached conversions are not reused
+CONVERTER_VERSION = 3
+
+# Sheets of the UPS Project Tracking workbook and the columns read from each
+PROJECT_SHEET = 'Project status'
+ISSUES_SHEET = 'school with issues'
+REVISITS_SHEET = 'Schools to be revisted'
+
+PROJECT_COLUMNS = ['Sites', 'UPS Replacement Status', 'Trustee Zones', 'Notes', 'Deployment Date']
+ISSUES_COLUMNS = ['School ', 'School', 'Issues', 'Status']
+REVISITS_COLUMNS = ['School', 'Issues', 'Status', 'Team member assigned']
+
+# Columns of the task table produced by the converter, in output order.
+# Task_ID numbers the tasks 0, 1, 2, ... and the app keeps it as each task's stable ID.
+TASK_COLUMNS = [
+    'Task_ID', 'Task', 'Resource', 'Start', 'Duration', 'Finish',
+    'Completion_pct', 'Trustee_Zone', 'Category', 'Notes'
+]
+
+# Default resource for each task category
+RESOURCES = {
+    'Planning': 'Project Manager',
+    'Delivery': 'Delivery Team',
+    'Installation': 'Installation Team',
+    'Issue Resolution': 'Specialized Team',
+    'Revisit': 'Maintenance Team',
+    'Closeout': 'Project Manager'
+}
+
+# Fixed planning phase tasks that open every converted project
+PLANNING_TASKS = [
+    {'Task': 'Planning & Preparation', 'Duration': 2, 'Completion_pct': 100},
+    {'Task': 'Data Closet Assessment', 'Duration': 3, 'Completion_pct': 80},
+    {'Task': 'Team Assignments', 'Duration': 1, 'Completion_pct': 100}
+]
+
+# Section header rows in the 'Sites' column that are not schools
+SECTION_HEADERS = ['ELEMENTARY SCHOOLS', 'SECONDARY SCHOOLS']
+
+ISSUE_DURATION = 2  # Issues typically take 2 days
+REVISIT_DURATION = 1  # Revisits typically take 1 day
+
+
+def get_resource(category):
+    return RESOURCES.get(category, 'Unassigned')
+
+
+def convert_ups_data(excel_file, output_csv_path=None, save_csv=True, progress=None, scheduler=None, today=None):
     """
     Convert UPS project Excel spreadsheet data into format for Gantt chart application.
-    
+
+    The workbook is opened once and each sheet is streamed in chunks, so the
+    whole tracking sheet is never held in memory.
+
     Parameters:
-    excel_file_path (str): Path to the UPS Project Excel file
+    excel_file (str, bytes or file-like): Path, raw bytes or binary buffer of the UPS Project Excel file
     output_csv_path (str, optional): Path where to save the output CSV. If None, uses 'gantt_data.csv'
-    
+    save_csv (bool): Whether to write the output CSV at all
+    progress (callable, optional): Called as progress(sheet_name, rows) after each
+        chunk with the rows read from that sheet so far (see build_gantt_frame)
+    scheduler (scheduler.Scheduler, optional): Schedules the undated tasks by
+        resource capacity and dependencies instead of one after another
+    today (datetime.date, optional): Planning reference date. If None, uses today
+
     Returns:
     pandas.DataFrame: The converted data ready for Gantt chart import
     """
-    
+
     if output_csv_path is None:
         output_csv_path = 'gantt_data.csv'
-        
-    print(f"Reading Excel file: {excel_file_path}")
-    
-    # Read the main project status sheet
-    project_df = pd.read_excel(excel_file_path, sheet_name='Project status')
-    
-    # Read the issues sheet
-    try:
-        issues_df = pd.read_excel(excel_file_path, sheet_name='school with issues')
-        has_issues_sheet = True
-        print(f"Found issues sheet with {len(issues_df)} records")
-    except:
-        has_issues_sheet = False
-        print("No issues sheet found")
-        issues_df = pd.DataFrame()
-    
-    # Read the revisits sheet
-    try:
-        revisits_df = pd.read_excel(excel_file_path, sheet_name='Schools to be revisted')
-        has_revisits_sheet = True
-        print(f"Found revisits sheet with {len(revisits_df)} records")
-    except:
-        has_revisits_sheet = False
-        print("No revisits sheet found")
-        revisits_df = pd.DataFrame()
-    
+
+    if isinstance(excel_file, (bytes, bytearray)):
+        excel_file = io.BytesIO(excel_file)
+
+    if isinstance(excel_file, (str, os.PathLike)):
+        print(f"Reading Excel file: {excel_file}")
+    else:
+        print(f"Reading Excel file: {getattr(excel_file, 'name', 'in-memory workbook')}")
+
+    with WorkbookReader(excel_file) as workbook:
+        # The main project status sheet is required
+        project_rows = workbook.iter_frames(PROJECT_SHEET, columns=PROJECT_COLUMNS)
+
+        if workbook.has_sheet(ISSUES_SHEET):
+            print("Found issues sheet")
+            issues_rows = workbook.iter_frames(ISSUES_SHEET, columns=ISSUES_COLUMNS)
+        else:
+            print("No issues sheet found")
+            issues_rows = None
+
+        if workbook.has_sheet(REVISITS_SHEET):
+            print("Found revisits sheet")
+            revisits_rows = workbook.iter_frames(REVISITS_SHEET, columns=REVISITS_COLUMNS)
+        else:
+            print("No revisits sheet found")
+            revisits_rows = None
+
+        result_df = build_gantt_frame(project_rows, issues_rows, revisits_rows, today=today,
+                                      progress=progress, scheduler=scheduler)
+
+    print(f"Conversion complete. {len(result_df)} tasks generated.")
+
+    # Save to CSV
+    if save_csv:
+        result_df.to_csv(output_csv_path, index=False)
+        print(f"Output saved to: {output_csv_path}")
+
+    return result_df
+
+
+# Column helpers for the vectorized engine
+
+def _column(df, name, default):
+    """Return column `name` of df, or a column filled with `default` if the sheet lacks it."""
+    if name in df.columns:
+        return df[name]
+    return pd.Series([default] * len(df), index=df.index, dtype=object)
+
+
+def _text(values):
+    """Return the string cells of a column; every non-string cell becomes NaN."""
+    values = values.astype(object)
+    is_text = np.fromiter((isinstance(v, str) for v in values), dtype=bool, count=len(values))
+    return values.where(is_text)
+
+
+def _chunks(sheet):
+    """Iterate a sheet given as a DataFrame, an iterable of DataFrame chunks or None."""
+    if sheet is None:
+        return []
+    if isinstance(sheet, pd.DataFrame):
+        return [sheet]
+    return sheet
+
+
+class _ValueKind:
+    """
+    Track the dtype pandas would infer for a column that is read in chunks.
+
+    A numeric column becomes float64 as soon as any cell is missing or
+    fractional, which changes how its values are written to CSV.
+    """
+
+    def __init__(self):
+        self.numeric = True
+        self.floating = False
+
+    def update(self, values):
+        if len(values) == 0:
+            return
+        inferred = pd.api.types.infer_dtype(values, skipna=True)
+        if inferred not in ('integer', 'floating', 'mixed-integer-float', 'empty'):
+            self.numeric = False
+        elif inferred != 'integer' or values.isna().any():
+            self.floating = True
+
+    def cast(self, values):
+        """Cast the numeric cells of an output column to the type inferred for the whole sheet."""
+        if not self.numeric:
+            return values
+        if pd.api.types.is_numeric_dtype(values):
+            return values.astype(float if self.floating else 'int64')
+        to_number = float if self.floating else int
+        return values.map(
+            lambda v: to_number(v) if isinstance(v, Number) and not isinstance(v, bool) else v
+        ).infer_objects()
+
+
+def _days(n):
+    """Convert an integer day-offset array to timedelta64 values."""
+    return pd.to_timedelta(np.asarray(n, dtype='int64'), unit='D')
+
+
+def _datetime_cells(values):
+    """Return the cells holding real datetimes normalized to midnight, NaT elsewhere."""
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values.dt.normalize()
+    is_datetime = values.map(lambda v: isinstance(v, datetime) and not pd.isna(v)).astype(bool)
+    return pd.to_datetime(values.where(is_datetime)).dt.normalize()
+
+
+def _task_block(task, resource, start, duration, completion, zone, category, notes):
+    """Assemble one block of output rows from aligned column arrays."""
+    start = pd.DatetimeIndex(start)
+    duration = np.asarray(duration, dtype='int64')
+    block = pd.DataFrame({
+        'Task': np.asarray(task, dtype=object),
+        'Resource': resource,
+        'Start': start,
+        'Duration': duration,
+        'Finish': start + _days(duration),
+        'Completion_pct': np.asarray(completion, dtype='int64'),
+        'Trustee_Zone': zone,
+        'Category': category,
+        'Notes': notes
+    })
+    return block
+
+
+def build_zone_index(project_df):
+    """
+    Build a Sites -> Trustee Zones lookup from the project status sheet.
+
+    The first row for a site wins and a missing zone maps to 0, matching the
+    original scan over the project sheet.
+
+    Parameters:
+    project_df (pandas.DataFrame): The 'Project status' sheet
+
+    Returns:
+    pandas.Series: Zones indexed by the raw 'Sites' value
+    """
+    if 'Sites' not in project_df.columns:
+        return pd.Series(dtype=object)
+    sites = project_df['Sites']
+    zones = _column(project_df, 'Trustee Zones', 0)
+    zones = zones.where(zones.notna(), 0)
+    first = sites.notna() & ~sites.duplicated(keep='first')
+    return pd.Series(zones[first].to_numpy(), index=pd.Index(sites[first].to_numpy(), dtype=object))
+
+
+def _lookup_zones(names, zone_index):
+    """Map stripped school names to their Trustee Zone, 0 when the school is unknown."""
+    if zone_index.empty:
+        return pd.Series(0, index=names.index)
+    zones = names.map(zone_index)
+    return zones.where(zones.notna(), 0)
+
+
+def _within_date_range(build):
+    """
+    Report a block of tasks dated past the last date pandas can store as a ValueError.
+
+    Undated tasks are chained one after another, so tens of thousands of
+    them run past the year 2262, the end of datetime64[ns], and pandas
+    would raise a bare overflow error.
+    """
+    @functools.wraps(build)
+    def wrapper(*args, **kwargs):
+        try:
+            return build(*args, **kwargs)
+        except (OverflowError, pd.errors.OutOfBoundsDatetime) as e:
+            raise ValueError(
+                f"The undated tasks, scheduled one after another, run past {pd.Timestamp.max.date()}, "
+                "the last date a task table can hold. Give more schools a Deployment Date."
+            ) from e
+    return wrapper
+
+
+def _planning_block(today):
+    start_date = pd.Timestamp(today) - timedelta(days=5)  # Planning started a few days ago
+    return _task_block(
+        task=[task['Task'] for task in PLANNING_TASKS],
+        resource=get_resource('Planning'),
+        start=[start_date + timedelta(days=i) for i in range(len(PLANNING_TASKS))],
+        duration=[task['Duration'] for task in PLANNING_TASKS],
+        completion=[task['Completion_pct'] for task in PLANNING_TASKS],
+        zone=0,  # 0 for non-school tasks
+        category='Planning',
+        notes=''
+    )
+
+
+@_within_date_range
+def _project_block(project_df, next_task_date):
+    """
+    Delivery and Installation tasks for every school in the project sheet.
+
+    Returns the block and the date the last undated school finishes on.
+    """
+    sites = _text(_column(project_df, 'Sites', None))
+    school_names = sites.str.strip()
+    keep = sites.notna() & ~sites.str.upper().isin(SECTION_HEADERS) & (school_names != '')
+
+    status = _text(_column(project_df, 'UPS Replacement Status', 'Not Started')).str.lower().str.strip()
+    completion = pd.Series(np.select([status == 'done', status == 'started'], [100, 50], 0), index=project_df.index)
+
+    zones = _column(project_df, 'Trustee Zones', 0)
+    zones = zones.where(zones.notna(), 0)
+    notes = _column(project_df, 'Notes', '')
+    notes = notes.where(notes.notna(), '')
+
+    deployment = _datetime_cells(_column(project_df, 'Deployment Date', None))
+    dated = deployment.notna()
+
+    # Schools without a deployment date are only scheduled while not started;
+    # each one takes the next two free days after the previous one
+    keep &= dated | (completion == 0)
+    undated = keep & ~dated
+    slot = undated.astype('int64').cumsum().to_numpy() * 2
+
+    keep = keep.to_numpy()
+    dated = dated.to_numpy()[keep]
+    slot = slot[keep]
+    installation_date = np.where(
+        dated,
+        deployment.to_numpy()[keep],
+        (pd.Timestamp(next_task_date) + _days(slot)).to_numpy()
+    )
+    delivery_date = installation_date - np.timedelta64(1, 'D')
+
+    n = int(keep.sum())
+    names = school_names.to_numpy()[keep]
+    zones = zones[keep]
+    notes = notes[keep]
+    completion = completion.to_numpy()[keep]
+
+    delivery = _task_block(names + ': Delivery', get_resource('Delivery'), delivery_date,
+                           np.ones(n), completion, zones.to_numpy(), 'Delivery', notes.to_numpy())
+    installation = _task_block(names + ': Installation', get_resource('Installation'), installation_date,
+                               np.ones(n), completion, zones.to_numpy(), 'Installation', notes.to_numpy())
+
+    # Interleave so each school's Delivery is followed by its Installation
+    delivery.index = np.arange(n) * 2
+    installation.index = np.arange(n) * 2 + 1
+    block = pd.concat([delivery, installation]).sort_index(kind='stable')
+    block['Floating'] = np.repeat(~dated, 2)
+
+    undated_count = int(undated.sum())
+    return block, pd.Timestamp(next_task_date) + timedelta(days=2 * undated_count)
+
+
+@_within_date_range
+def _issues_block(issues_df, zone_index, next_task_date):
+    """Issue Resolution tasks, chained back to back after the school deliveries."""
+    school_col = 'School ' if 'School ' in issues_df.columns else 'School'
+    if school_col not in issues_df.columns:
+        return None, next_task_date
+
+    rows = issues_df[issues_df[school_col].notna()]
+    names = rows[school_col].astype(str).str.strip()
+
+    issue = _column(rows, 'Issues', '')
+    issue = issue.where(issue.notna(), '')
+
+    status = _text(_column(rows, 'Status', '')).str.lower()
+    completion = np.select(
+        [status.isna(), status.isin(['done', 'resolved']), status == 'pending'],
+        [0, 100, 30],
+        50
+    )
+
+    k = np.arange(1, len(rows) + 1)
+    start = pd.Timestamp(next_task_date) + _days(k * (ISSUE_DURATION + 1) - ISSUE_DURATION)
+
+    block = _task_block(names.to_numpy() + ': Issue Resolution', get_resource('Issue Resolution'), start,
+                        np.full(len(rows), ISSUE_DURATION), completion,
+                        _lookup_zones(names, zone_index).to_numpy(), 'Issue Resolution', issue.to_numpy())
+    return block, pd.Timestamp(next_task_date) + timedelta(days=len(rows) * (ISSUE_DURATION + 1))
+
+
+@_within_date_range
+def _revisits_block(revisits_df, zone_index, next_task_date):
+    """Revisit tasks, chained back to back after the issue resolutions."""
+    if 'School' not in revisits_df.columns:
+        return None, next_task_date
+
+    rows = revisits_df[revisits_df['School'].notna()]
+    names = rows['School'].astype(str).str.strip()
+
+    issue = _column(rows, 'Issues', '')
+    issue = issue.where(issue.notna(), '')
+
+    status = _text(_column(rows, 'Status', '')).str.lower()
+    completion = np.select(
+        [status.isna(), status.isin(['done', 'completed']), status == 'pending'],
+        [0, 100, 0],
+        50
+    )
+
+    # Use the assigned team member if there is one
+    team = _column(rows, 'Team member assigned', '').astype(object)
+    unassigned = team.isna() | ~team.astype(bool)
+    resource = team.where(~unassigned, get_resource('Revisit'))
+
+    k = np.arange(1, len(rows) + 1)
+    start = pd.Timestamp(next_task_date) + _days(k * (REVISIT_DURATION + 1) - REVISIT_DURATION)
+
+    block = _task_block(names.to_numpy() + ': Revisit', resource.to_numpy(), start,
+                        np.full(len(rows), REVISIT_DURATION), completion,
+                        _lookup_zones(names, zone_index).to_numpy(), 'Revisit', issue.to_numpy())
+    return block, pd.Timestamp(next_task_date) + timedelta(days=len(rows) * (REVISIT_DURATION + 1))
+
+
+@_within_date_range
+def _closeout_block(next_task_date):
+    closeout_start = pd.Timestamp(next_task_date) + timedelta(days=3)
+    return _task_block(
+        task=['Final Documentation', 'Project Review'],
+        resource=get_resource('Closeout'),
+        start=[closeout_start, closeout_start + timedelta(days=4)],
+        duration=[3, 1],
+        completion=[0, 0],
+        zone=0,
+        category='Closeout',
+        notes=''
+    )
+
+
+def _ignore_progress(sheet_name, rows):
+    pass
+
+
+def _sheet_blocks(blocks, kinds):
+    """Concatenate the blocks built from one sheet and apply its column kinds."""
+    blocks = [b for b in blocks if b is not None and len(b)]
+    if not blocks:
+        return None
+    frame = pd.concat(blocks, ignore_index=True)
+    for column, kind in kinds.items():
+        frame[column] = kind.cast(frame[column])
+    return frame
+
+
+def build_gantt_frame(project_sheet, issues_sheet, revisits_sheet, today=None, progress=None, scheduler=None):
+    """
+    Build the Gantt task table from the workbook sheets with column operations.
+
+    Zones for issues and revisits come from a Sites -> Trustee Zones index built
+    once, and undated tasks are scheduled with cumulative day offsets instead of
+    advancing a date row by row. Each sheet can be a whole DataFrame or a stream
+    of DataFrame chunks (see WorkbookReader.iter_frames); the schedule carries
+    over from one chunk to the next. Apart from the Task_ID column the result
+    matches build_gantt_frame_rowwise.
+
+    Parameters:
+    project_sheet (pandas.DataFrame or iterable): The 'Project status' sheet
+    issues_sheet (pandas.DataFrame or iterable): The 'school with issues' sheet, or None
+    revisits_sheet (pandas.DataFrame or iterable): The 'Schools to be revisted' sheet, or None
+    today (datetime.date, optional): Planning reference date. If None, uses today
+    progress (callable, optional): Called as progress(sheet_name, rows) after each
+        chunk with the rows processed from that sheet so far. An exception it
+        raises stops the conversion, which is how running conversions are cancelled.
+    scheduler (scheduler.Scheduler, optional): Reschedules the tasks without a
+        date from the sheet (undated schools, issues, revisits and closeout)
+        by resource capacity and dependencies, starting after planning
+
+    Returns:
+    pandas.DataFrame: The task table with datetime64 Start and Finish columns
+
+    Raises:
+    ValueError: If the undated tasks, chained one after another, run past
+        the last date pandas can store (in the year 2262)
+    """
+    if progress is None:
+        progress = _ignore_progress
+    if today is None:
+        today = datetime.now().date()
+
+    # Floating marks the tasks the sheets give no date for, which a scheduler may move
+    planning = _planning_block(today).assign(Floating=False)
+    next_task_date = planning['Finish'].iloc[-1]
+
+    # Process main project status sheet, collecting the zone index as we go
+    zone_kind = _ValueKind()
+    notes_kind = _ValueKind()
+    zone_index_parts = []
+    project_blocks = []
+    rows = 0
+    for chunk in _chunks(project_sheet):
+        zone_kind.update(_column(chunk, 'Trustee Zones', 0))
+        notes_kind.update(_column(chunk, 'Notes', ''))
+        zone_index_parts.append(build_zone_index(chunk))
+        block, next_task_date = _project_block(chunk, next_task_date)
+        project_blocks.append(block)
+        rows += len(chunk)
+        progress(PROJECT_SHEET, rows)
+    project = _sheet_blocks(project_blocks, {'Trustee_Zone': zone_kind, 'Notes': notes_kind})
+
+    zone_index = pd.concat(zone_index_parts) if zone_index_parts else pd.Series(dtype=object)
+    zone_index = zone_index[~zone_index.index.duplicated(keep='first')]
+
+    # Process schools with issues
+    issue_kind = _ValueKind()
+    issue_blocks = []
+    rows = 0
+    for chunk in _chunks(issues_sheet):
+        issue_kind.update(_column(chunk, 'Issues', ''))
+        block, next_task_date = _issues_block(chunk, zone_index, next_task_date)
+        issue_blocks.append(None if block is None else block.assign(Floating=True))
+        rows += len(chunk)
+        progress(ISSUES_SHEET, rows)
+    issues = _sheet_blocks(issue_blocks, {'Trustee_Zone': zone_kind, 'Notes': issue_kind})
+
+    # Process schools needing revisits
+    revisit_kind = _ValueKind()
+    revisit_blocks = []
+    rows = 0
+    for chunk in _chunks(revisits_sheet):
+        revisit_kind.update(_column(chunk, 'Issues', ''))
+        block, next_task_date = _revisits_block(chunk, zone_index, next_task_date)
+        revisit_blocks.append(None if block is None else block.assign(Floating=True))
+        rows += len(chunk)
+        progress(REVISITS_SHEET, rows)
+    revisits = _sheet_blocks(revisit_blocks, {'Trustee_Zone': zone_kind, 'Notes': revisit_kind})
+
+    closeout = _closeout_block(next_task_date).assign(Floating=True)
+
+    # Empty blocks are left out so they cannot change the inferred column dtypes
+    blocks = [b for b in [planning, project, issues, revisits, closeout] if b is not None and len(b)]
+    gantt = pd.concat(blocks, ignore_index=True)
+    gantt['Task_ID'] = np.arange(len(gantt), dtype='int64')
+    if scheduler is not None:
+        gantt = scheduler.schedule(gantt, floating=gantt['Floating'].to_numpy(dtype=bool), start=today)
+    return gantt[TASK_COLUMNS]
+
+
+def build_gantt_frame_rowwise(project_df, issues_df, revisits_df, today=None):
+    """
+    Reference row-by-row implementation of build_gantt_frame.
+
+    This is the original iterrows conversion, kept to check the vectorized
+    engine against and to benchmark it.
+
+    Parameters:
+    project_df (pandas.DataFrame): The 'Project status' sheet
+    issues_df (pandas.DataFrame): The 'school with issues' sheet (may be empty)
+    revisits_df (pandas.DataFrame): The 'Schools to be revisted' sheet (may be empty)
+    today (datetime.date, optional): Planning reference date. If None, uses today
+
+    Returns:
+    pandas.DataFrame: The task table with datetime.date Start and Finish values
+    """
+    has_issues_sheet = not issues_df.empty
+    has_revisits_sheet = not revisits_df.empty
+
     # Initialize output dataframe
     gantt_data = []
-    
+
     # Set current date for planning new tasks
-    today = datetime.now().date()
-    
+    if today is None:
+        today = datetime.now().date()
+
     # Helper function to map status to completion percentage
     def map_status_to_completion(status):
         if not isinstance(status, str):
@@ -60,32 +558,13 @@ def convert_ups_data(excel_file_path, output_csv_path=None):
             return 50
         else:
             return 0
-    
-    # Helper function to get resource by category
-    def get_resource(category):
-        resources = {
-            'Planning': 'Project Manager',
-            'Delivery': 'Delivery Team',
-            'Installation': 'Installation Team',
-            'Issue Resolution': 'Specialized Team',
-            'Revisit': 'Maintenance Team',
-            'Closeout': 'Project Manager'
-        }
-        return resources.get(category, 'Unassigned')
-    
-    # Add planning phase tasks
-    planning_tasks = [
-        {'Task': 'Planning & Preparation', 'Duration': 2, 'Completion_pct': 100},
-        {'Task': 'Data Closet Assessment', 'Duration': 3, 'Completion_pct': 80},
-        {'Task': 'Team Assignments', 'Duration': 1, 'Completion_pct': 100}
-    ]
-    
+
     start_date = today - timedelta(days=5)  # Planning started a few days ago
-    
-    for i, task in enumerate(planning_tasks):
+
+    for i, task in enumerate(PLANNING_TASKS):
         task_start = start_date + timedelta(days=i)
         task_finish = task_start + timedelta(days=task['Duration'])
-        
+
         gantt_data.append({
             'Task': task['Task'],
             'Resource': get_resource('Planning'),
@@ -97,34 +576,34 @@ def convert_ups_data(excel_file_path, output_csv_path=None):
             'Category': 'Planning',
             'Notes': ''
         })
-    
+
     last_planning_date = gantt_data[-1]['Finish']
     next_task_date = last_planning_date
-    
+
     # Process main project status sheet
     for idx, row in project_df.iterrows():
         # Skip header or empty rows
         if not isinstance(row.get('Sites'), str) or row['Sites'].upper() == 'ELEMENTARY SCHOOLS' or row['Sites'].upper() == 'SECONDARY SCHOOLS':
             continue
-        
+
         school_name = row['Sites'].strip()
         if pd.isna(school_name) or not school_name:
             continue
-            
+
         # Get status and convert to completion percentage
         status = row.get('UPS Replacement Status', 'Not Started')
         completion = map_status_to_completion(status)
-        
+
         # Get zone information
         zone = row.get('Trustee Zones', 0)
         if pd.isna(zone):
             zone = 0
-        
+
         # Get notes
         notes = row.get('Notes', '')
         if pd.isna(notes):
             notes = ''
-        
+
         # Try to get deployment date, if available
         has_deployment_date = False
         deployment_date = row.get('Deployment Date')
@@ -133,7 +612,7 @@ def convert_ups_data(excel_file_path, output_csv_path=None):
                 delivery_date = deployment_date.date() - timedelta(days=1)
                 installation_date = deployment_date.date()
                 has_deployment_date = True
-        
+
         # If no deployment date, use next available date
         if not has_deployment_date:
             # For remaining schools, schedule from the next day
@@ -145,7 +624,7 @@ def convert_ups_data(excel_file_path, output_csv_path=None):
                 # For completed or started schools, use a past date
                 # Skip these if you only want to include remaining work
                 continue
-        
+
         # Add delivery task
         gantt_data.append({
             'Task': f"{school_name}: Delivery",
@@ -158,7 +637,7 @@ def convert_ups_data(excel_file_path, output_csv_path=None):
             'Category': 'Delivery',
             'Notes': notes
         })
-        
+
         # Add installation task
         gantt_data.append({
             'Task': f"{school_name}: Installation",
@@ -171,7 +650,7 @@ def convert_ups_data(excel_file_path, output_csv_path=None):
             'Category': 'Installation',
             'Notes': notes
         })
-    
+
     # Process schools with issues
     if has_issues_sheet:
         for idx, row in issues_df.iterrows():
@@ -179,14 +658,14 @@ def convert_ups_data(excel_file_path, output_csv_path=None):
             school_col = 'School ' if 'School ' in issues_df.columns else 'School'
             if school_col not in row or pd.isna(row[school_col]):
                 continue
-                
+
             school_name = row[school_col].strip()
-            
+
             # Get issue details
             issue = row.get('Issues', '')
             if pd.isna(issue):
                 issue = ''
-            
+
             # Get status if available
             issue_status = row.get('Status', '')
             if pd.isna(issue_status) or not isinstance(issue_status, str):
@@ -197,7 +676,7 @@ def convert_ups_data(excel_file_path, output_csv_path=None):
                 completion = 30
             else:
                 completion = 50
-            
+
             # Find zone from main project data
             zone = 0
             for project_row in project_df.iterrows():
@@ -206,11 +685,11 @@ def convert_ups_data(excel_file_path, output_csv_path=None):
                     if not pd.isna(z):
                         zone = z
                     break
-            
+
             # Schedule for issue resolution
             issue_start_date = next_task_date + timedelta(days=1)
-            issue_duration = 2  # Issues typically take 2 days
-            
+            issue_duration = ISSUE_DURATION
+
             gantt_data.append({
                 'Task': f"{school_name}: Issue Resolution",
                 'Resource': get_resource('Issue Resolution'),
@@ -222,22 +701,22 @@ def convert_ups_data(excel_file_path, output_csv_path=None):
                 'Category': 'Issue Resolution',
                 'Notes': issue
             })
-            
+
             next_task_date = issue_start_date + timedelta(days=issue_duration)
-    
+
     # Process schools needing revisits
     if has_revisits_sheet:
         for idx, row in revisits_df.iterrows():
             if 'School' not in row or pd.isna(row['School']):
                 continue
-                
+
             school_name = row['School'].strip()
-            
+
             # Get issue details
             issue = row.get('Issues', '')
             if pd.isna(issue):
                 issue = ''
-            
+
             # Get status if available
             revisit_status = row.get('Status', '')
             if pd.isna(revisit_status) or not isinstance(revisit_status, str):
@@ -248,12 +727,12 @@ def convert_ups_data(excel_file_path, output_csv_path=None):
                 completion = 0
             else:
                 completion = 50
-            
+
             # Get assigned team member if available
             resource = row.get('Team member assigned', '')
             if pd.isna(resource) or not resource:
                 resource = get_resource('Revisit')
-            
+
             # Find zone from main project data
             zone = 0
             for project_row in project_df.iterrows():
@@ -262,11 +741,11 @@ def convert_ups_data(excel_file_path, output_csv_path=None):
                     if not pd.isna(z):
                         zone = z
                     break
-            
+
             # Schedule for revisit
             revisit_start_date = next_task_date + timedelta(days=1)
-            revisit_duration = 1  # Revisits typically take 1 day
-            
+            revisit_duration = REVISIT_DURATION
+
             gantt_data.append({
                 'Task': f"{school_name}: Revisit",
                 'Resource': resource,
@@ -278,12 +757,12 @@ def convert_ups_data(excel_file_path, output_csv_path=None):
                 'Category': 'Revisit',
                 'Notes': issue
             })
-            
+
             next_task_date = revisit_start_date + timedelta(days=revisit_duration)
-    
+
     # Add project closeout tasks
     closeout_start = next_task_date + timedelta(days=3)
-    
+
     gantt_data.append({
         'Task': 'Final Documentation',
         'Resource': get_resource('Closeout'),
@@ -295,7 +774,7 @@ def convert_ups_data(excel_file_path, output_csv_path=None):
         'Category': 'Closeout',
         'Notes': ''
     })
-    
+
     gantt_data.append({
         'Task': 'Project Review',
         'Resource': get_resource('Closeout'),
@@ -307,29 +786,178 @@ def convert_ups_data(excel_file_path, output_csv_path=None):
         'Category': 'Closeout',
         'Notes': ''
     })
-    
+
     # Convert to DataFrame
-    result_df = pd.DataFrame(gantt_data)
-    
-    # Save to CSV
-    result_df.to_csv(output_csv_path, index=False)
-    print(f"Conversion complete. {len(result_df)} tasks generated.")
-    print(f"Output saved to: {output_csv_path}")
-    
-    return result_df
+    return pd.DataFrame(gantt_data)
+
+# Batch conversion of one tracking sheet per region
+
+# Task categories made once per workbook rather than per school
+PROJECT_CATEGORIES = ['Planning', 'Closeout']
+
+
+def find_workbooks(inputs):
+    """
+    Expand directories and glob patterns into a sorted list of .xlsx files.
+
+    Parameters:
+    inputs (list): Paths of workbooks or directories, or glob patterns
+
+    Returns:
+    list: Paths of the workbooks, without duplicates or Excel lock files
+    """
+    paths = []
+    for item in inputs:
+        if os.path.isdir(item):
+            matches = glob.glob(os.path.join(item, '*.xlsx'))
+        else:
+            matches = glob.glob(item) or [item]
+        paths.extend(sorted(matches))
+
+    seen = set()
+    workbooks = []
+    for path in paths:
+        if os.path.basename(path).startswith('~$') or os.path.abspath(path) in seen:
+            continue
+        seen.add(os.path.abspath(path))
+        workbooks.append(path)
+    return workbooks
+
+
+def region_name(path):
+    """Region of a tracking sheet: its file name without the extension."""
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+def _convert_region(path):
+    """Convert one regional workbook in a worker process; returns (task table, sheet rows read)."""
+    rows_read = {}
+    df = convert_ups_data(path, save_csv=False, progress=rows_read.__setitem__)
+    return df, sum(rows_read.values())
+
+
+def merge_region_tables(tables):
+    """
+    Merge the task tables of several regions into one table.
+
+    Every task gets a Region column naming the workbook it came from.
+    Schools listed in more than one region keep one Delivery and one
+    Installation task: the most complete one, then the latest finishing,
+    then the first region's. Issue and revisit tasks repeated in another
+    region with the same notes are kept once. The per-workbook Planning and Closeout tasks are
+    kept once, Planning first and Closeout (after the latest region) last.
+    Tasks are renumbered with new Task_IDs.
+
+    Parameters:
+    tables (list): (region name, task table) pairs, in region order
+
+    Returns:
+    pandas.DataFrame: The merged task table
+    """
+    merged = pd.concat(
+        [df.assign(Region=region) for region, df in tables],
+        ignore_index=True
+    )
+
+    per_task = merged['Category'].isin(['Issue Resolution', 'Revisit'])
+    key = merged['Category'].astype(str) + '\0' + merged['Task'].astype(str)
+    key = key.where(~per_task, key + '\0' + merged['Notes'].astype(str))
+    # Repeats of a task within one region are kept: the n-th repeat only
+    # matches the n-th repeat of the same task in other regions
+    key = key + '\0' + key.groupby([merged['Region'], key]).cumcount().astype(str)
+
+    preferred = merged.assign(_key=key).sort_values(
+        ['Completion_pct', 'Finish'], ascending=False, kind='stable'
+    )
+    merged = merged.loc[np.sort(preferred.drop_duplicates('_key').index.to_numpy())]
+
+    # Planning tasks open the project and Closeout tasks end it
+    group = np.select([merged['Category'] == 'Planning', merged['Category'] == 'Closeout'], [0, 2], 1)
+    merged = merged.iloc[np.argsort(group, kind='stable')].reset_index(drop=True)
+    merged['Task_ID'] = np.arange(len(merged), dtype='int64')
+    return merged[TASK_COLUMNS + ['Region']]
+
+
+def convert_workbooks(paths, workers=None):
+    """
+    Convert regional workbooks in parallel worker processes.
+
+    Parameters:
+    paths (list): Paths of the workbooks
+    workers (int, optional): Number of worker processes (default: one per CPU)
+
+    Returns:
+    tuple: (list, dict, int) (region, task table) pairs of the converted
+        workbooks in input order, {path: error} of those that failed and the
+        number of sheet rows read
+    """
+    tables = []
+    errors = {}
+    rows_read = 0
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [(path, executor.submit(_convert_region, path)) for path in paths]
+        for path, future in futures:
+            try:
+                df, rows = future.result()
+            except Exception as e:
+                errors[path] = e
+                continue
+            tables.append((region_name(path), df))
+            rows_read += rows
+    return tables, errors, rows_read
+
+
+def write_tasks(df, path):
+    """Write a task table as Parquet (.parquet/.pq paths) or CSV (anything else)."""
+    if path.lower().endswith(('.parquet', '.pq')):
+        # Mixed number/text columns are stored as text, as in the CSV output;
+        # missing values stay null rather than becoming the text 'nan'
+        df = df.astype({col: 'string' for col in df.columns if df[col].dtype == object})
+        df.to_parquet(path, index=False)
+    else:
+        df.to_csv(path, index=False)
+
+
+def main(argv=None):
+    """
+    Command line entry point: convert and merge one or more tracking sheets.
+
+    Returns:
+    int: Exit status (1 if any workbook failed or none were found)
+    """
+    parser = argparse.ArgumentParser(
+        description="Convert UPS Project Tracking workbooks (one per region) into one Gantt task table."
+    )
+    parser.add_argument('inputs', nargs='*', default=['UPS Project Tracking sheet.xlsx'],
+                        help="Workbooks, directories of .xlsx files or glob patterns")
+    parser.add_argument('-o', '--output', default='gantt_data.csv',
+                        help="Output file; a .parquet extension writes Parquet, anything else CSV")
+    parser.add_argument('-j', '--workers', type=int, default=None,
+                        help="Number of worker processes (default: one per CPU)")
+    args = parser.parse_args(argv)
+
+    paths = [path for path in find_workbooks(args.inputs) if os.path.isfile(path)]
+    if not paths:
+        print(f"No workbooks found in: {', '.join(args.inputs)}", file=sys.stderr)
+        return 1
+
+    started = time.perf_counter()
+    tables, errors, rows_read = convert_workbooks(paths, args.workers)
+    for path, error in errors.items():
+        print(f"Error converting {path}: {error}", file=sys.stderr)
+    if not tables:
+        return 1
+
+    df = merge_region_tables(tables) if len(tables) > 1 else tables[0][1].assign(Region=tables[0][0])
+    write_tasks(df, args.output)
+    elapsed = time.perf_counter() - started
+
+    print(f"Converted {len(tables)} of {len(paths)} workbooks into {len(df)} tasks: {args.output}")
+    print(f"Task categories: {df['Category'].value_counts().to_dict()}")
+    print(f"Throughput: {len(paths) / elapsed:.2f} files/s, {rows_read / elapsed:,.0f} sheet rows/s, "
+          f"{len(df) / elapsed:,.0f} tasks/s ({elapsed:.2f} s, {args.workers or os.cpu_count()} worker processes)")
+    return 1 if errors else 0
+
 
-# Example usage
 if __name__ == "__main__":
-    # Check if file exists in current directory
-    excel_file = "UPS Project Tracking sheet.xlsx"
-    if not os.path.exists(excel_file):
-        excel_file = input("Enter the path to your Excel file: ")
-    
-    output_file = "gantt_data.csv"
-    
-    try:
-        df = convert_ups_data(excel_file, output_file)
-        print(f"Generated {len(df)} tasks from the UPS project data")
-        print(f"Task categories: {df['Category'].value_counts().to_dict()}")
-    except Exception as e:
-        print(f"Error converting data: {e}")
\ No newline at end of file
+    sys.exit(main())
@@ -0,0 +1,285 @@
+# dependency_graph.py
+import itertools
+
+import numpy as np
+import pandas as pd
+
+from filter_index import school_names
+
+# Column listing the task IDs a task waits for, e.g. "12, 15"
+PREDECESSORS = 'Predecessors'
+
+# Nanoseconds per day, for float in days
+DAY_NS = 24 * 60 * 60 * 10**9
+
+# Milestone nodes infer_dependencies numbers after the task rows: Planning
+# done, and ready for Closeout
+MILESTONES = 2
+
+# Categories each school task waits for, among the tasks of the same school
+DEPENDENCY_RULES = {
+    'Installation': ['Delivery'],
+    'Issue Resolution': ['Installation'],
+    'Revisit': ['Installation', 'Issue Resolution']
+}
+
+
+def explicit_dependencies(df):
+    """
+    Dependencies listed in the Predecessors column.
+
+    Each cell holds the task IDs the task waits for, separated by commas,
+    spaces or semicolons ('#12' is accepted too). Each distinct cell value
+    is parsed once. IDs of tasks that do not exist and self-references are
+    ignored.
+
+    Parameters:
+    df (pandas.DataFrame): The task table, indexed by task ID
+
+    Returns:
+    tuple: (numpy.ndarray, numpy.ndarray) Row positions of the predecessor
+        and of the successor of each dependency
+    """
+    if PREDECESSORS not in df.columns:
+        return np.empty(0, dtype='int64'), np.empty(0, dtype='int64')
+
+    codes, values = pd.factorize(df[PREDECESSORS])
+    id_lists = pd.Series(values, dtype=object).astype(str).str.findall(r'\d+').to_numpy()
+    counts = np.array([len(ids) for ids in id_lists], dtype='int64')
+    per_row = np.where(codes >= 0, counts[codes] if len(counts) else 0, 0)
+    listed = np.flatnonzero(per_row)
+
+    succs = np.repeat(listed, per_row[listed])
+    ids = np.fromiter(itertools.chain.from_iterable(id_lists[codes[listed]]), dtype='int64', count=len(succs))
+    preds = df.index.get_indexer(ids)
+    keep = (preds >= 0) & (preds != succs)
+    return preds[keep].astype('int64'), succs[keep]
+
+
+def infer_dependencies(df):
+    """
+    Dependencies implied by the task categories.
+
+    Within each school (the part of the task name before the colon), tasks
+    wait for the school's tasks of the categories in DEPENDENCY_RULES:
+    Delivery comes before Installation, and Issue Resolution comes after
+    Installation. Every other task starts after the Planning tasks. The
+    Closeout tasks follow every other task, and each other in table order.
+
+    The Planning and Closeout dependencies go through two milestone nodes
+    numbered after the rows (see MILESTONES): the Planning tasks come before
+    the first and every other task after it, and every other task comes
+    before the second, which comes before the Closeout tasks. This keeps
+    the number of dependencies linear in the number of tasks.
+
+    Parameters:
+    df (pandas.DataFrame): The task table
+
+    Returns:
+    tuple: (numpy.ndarray, numpy.ndarray) Row (or milestone) positions of
+        the predecessor and of the successor of each dependency
+    """
+    category = df['Category'].astype(str).to_numpy()
+    positions = np.arange(len(df))
+    school, _ = school_names(df['Task'])
+
+    preds, succs = [], []
+    by_school = pd.DataFrame({'school': school, 'category': category, 'position': positions})
+    by_school = by_school[by_school['school'] >= 0]
+    for successor, predecessors in DEPENDENCY_RULES.items():
+        after = by_school[by_school['category'] == successor]
+        before = by_school[by_school['category'].isin(predecessors)]
+        pairs = after.merge(before, on='school', suffixes=('_succ', '_pred'))
+        preds.append(pairs['position_pred'].to_numpy())
+        succs.append(pairs['position_succ'].to_numpy())
+
+    planning = positions[category == 'Planning']
+    closeout = positions[category == 'Closeout']
+    middle = positions[(category != 'Planning') & (category != 'Closeout')]
+    planning_done, closeout_ready = len(df), len(df) + 1
+    if len(planning) and len(middle):
+        preds += [planning, np.full(len(middle), planning_done)]
+        succs += [np.full(len(planning), planning_done), middle]
+    if len(middle) and len(closeout):
+        preds += [middle, np.full(len(closeout), closeout_ready)]
+        succs += [np.full(len(middle), closeout_ready), closeout]
+    preds.append(closeout[:-1])
+    succs.append(closeout[1:])
+    return np.concatenate(preds).astype('int64'), np.concatenate(succs).astype('int64')
+
+
+def graph_size(n, preds, succs):
+    """Number of nodes of a dependency graph over n tasks: the tasks and any milestones after them."""
+    return max(n, int(preds.max()) + 1 if len(preds) else 0, int(succs.max()) + 1 if len(succs) else 0)
+
+
+def task_dependencies(df):
+    """
+    All dependencies of the task table: the Predecessors column plus the
+    inferred per-school chains and milestones, each pair listed once.
+
+    Returns:
+    tuple: (numpy.ndarray, numpy.ndarray) Predecessor and successor
+        positions; positions from len(df) on are the milestones of
+        infer_dependencies
+    """
+    explicit = explicit_dependencies(df)
+    inferred = infer_dependencies(df)
+    nodes = len(df) + MILESTONES
+    pairs = np.unique(np.concatenate([explicit[0], inferred[0]]) * nodes + np.concatenate([explicit[1], inferred[1]]))
+    return pairs // nodes, pairs % nodes
+
+
+def _adjacency(sources, targets, n):
+    """Compressed adjacency lists: targets grouped by source, and each source's offset."""
+    order = np.argsort(sources, kind='stable')
+    offsets = np.concatenate([[0], np.cumsum(np.bincount(sources, minlength=n))])
+    return targets[order], offsets
+
+
+def _edges_from(offsets, nodes):
+    """Positions in the adjacency list of every edge leaving `nodes`."""
+    lengths = offsets[nodes + 1] - offsets[nodes]
+    starts = np.repeat(offsets[nodes] - np.concatenate([[0], np.cumsum(lengths)[:-1]]), lengths)
+    return starts + np.arange(lengths.sum())
+
+
+class CriticalPath:
+    """
+    Critical path analysis (CPM) of the task table.
+
+    The forward pass gives each task an early start: the later of its
+    planned Start and the early finish of its predecessors. The backward
+    pass gives the late finish: the earliest late start of its successors,
+    or the project finish. Total float is late start minus early start, and
+    tasks without float are critical. Both passes visit the tasks one
+    topological level at a time with array operations, so they take time
+    linear in the number of tasks and dependencies.
+
+    Durations are the planned bar lengths (Finish - Start). Milestones take
+    no time. Tasks caught in a dependency cycle, and the tasks after them,
+    get no dates (in_cycle) and are never critical.
+
+    Parameters:
+    df (pandas.DataFrame): The task table, indexed by task ID
+    dependencies (tuple, optional): (predecessor, successor) positions;
+        positions past the rows are milestones (default: task_dependencies(df))
+    """
+
+    # Task table columns the analysis is built from
+    COLUMNS = ('Task_ID', 'Task', 'Category', PREDECESSORS, 'Start', 'Finish')
+
+    def __init__(self, df, dependencies=None):
+        preds, succs = task_dependencies(df) if dependencies is None else dependencies
+        self.preds, self.succs = preds, succs
+        # Milestones after the task rows take no time and have no planned Start
+        tasks, n = len(df), graph_size(len(df), preds, succs)
+
+        start = df['Start'].to_numpy(dtype='datetime64[ns]').view('int64')
+        finish = df['Finish'].to_numpy(dtype='datetime64[ns]').view('int64')
+        missing = np.isnat(df['Start'].to_numpy(dtype='datetime64[ns]'))
+        first_start = start[~missing].min() if (~missing).any() else 0
+        release = np.concatenate([np.where(missing, first_start, start), np.full(n - tasks, first_start)])
+        duration = np.concatenate([
+            np.where(missing | np.isnat(df['Finish'].to_numpy(dtype='datetime64[ns]')), 0, np.maximum(finish - start, 0)),
+            np.zeros(n - tasks, dtype='int64')
+        ])
+
+        successors, succ_offsets = _adjacency(preds, succs, n)
+        predecessors, pred_offsets = _adjacency(succs, preds, n)
+
+        # Forward pass, one topological level at a time
+        early_start = release.copy()
+        early_finish = np.zeros(n, dtype='int64')
+        waiting = np.bincount(succs, minlength=n)
+        levels = []
+        level = np.flatnonzero(waiting == 0)
+        while len(level):
+            levels.append(level)
+            early_finish[level] = early_start[level] + duration[level]
+            edges = _edges_from(succ_offsets, level)
+            targets = successors[edges]
+            np.maximum.at(early_start, targets, np.repeat(early_finish[level], np.diff(succ_offsets)[level]))
+            np.subtract.at(waiting, targets, 1)
+            level = np.unique(targets[waiting[targets] == 0])
+
+        in_cycle = np.ones(n, dtype=bool)
+        if levels:
+            in_cycle[np.concatenate(levels)] = False
+        done = ~in_cycle
+        project_finish = early_finish[done].max() if done.any() else 0
+
+        # Backward pass over the same levels in reverse
+        late_finish = np.full(n, project_finish, dtype='int64')
+        late_start = np.zeros(n, dtype='int64')
+        for level in reversed(levels):
+            late_start[level] = late_finish[level] - duration[level]
+            edges = _edges_from(pred_offsets, level)
+            np.minimum.at(late_finish, predecessors[edges], np.repeat(late_start[level], np.diff(pred_offsets)[level]))
+
+        # The attributes cover the tasks; chain also walks through the milestones
+        critical = done & (late_start <= early_start)
+        self.in_cycle = in_cycle[:tasks]
+        self.duration = duration[:tasks]
+        self.project_finish = np.int64(project_finish).view('datetime64[ns]') if done.any() else np.datetime64('NaT')
+        self.early_start = self._dates(early_start[:tasks])
+        self.early_finish = self._dates(early_finish[:tasks])
+        self.late_start = self._dates(late_start[:tasks])
+        self.late_finish = self._dates(late_finish[:tasks])
+        self.total_float = np.where(done[:tasks], (late_start[:tasks] - early_start[:tasks]) / DAY_NS, np.nan)
+        self.critical = critical[:tasks]
+        self._nodes = (critical, early_start, early_finish)
+        self._predecessor_lists = (predecessors, pred_offsets)
+
+    def _dates(self, values):
+        dates = values.view('datetime64[ns]').copy()
+        dates[self.in_cycle] = np.datetime64('NaT')
+        return dates
+
+    def chain(self):
+        """
+        Row positions of one critical path, first task first.
+
+        Starts from the critical task that finishes the project and walks back
+        through the critical predecessor whose early finish set its early start.
+        Milestones on the way are passed through and left out.
+        """
+        ends = np.flatnonzero(self.critical & (self.early_finish == self.early_finish[self.critical].max())) \
+            if self.critical.any() else []
+        if not len(ends):
+            return np.empty(0, dtype='int64')
+        critical, early_start, early_finish = self._nodes
+        predecessors, offsets = self._predecessor_lists
+        path = [int(ends[-1])]
+        while True:
+            current = path[-1]
+            candidates = predecessors[offsets[current]:offsets[current + 1]]
+            driving = candidates[critical[candidates] & (early_finish[candidates] == early_start[current])]
+            if not len(driving):
+                break
+            path.append(int(driving.max()))
+        path = np.array(path[::-1], dtype='int64')
+        return path[path < len(self.critical)]
+
+    def table(self, df, rows=None):
+        """
+        The CPM dates and float of tasks, for display.
+
+        Parameters:
+        df (pandas.DataFrame): The task table the analysis was built from
+        rows (numpy.ndarray, optional): Row positions to include (default: all)
+
+        Returns:
+        pandas.DataFrame: Task, Category, early/late start and finish, float in days
+        """
+        rows = np.arange(len(df)) if rows is None else rows
+        return pd.DataFrame({
+            'Task_ID': df.index.to_numpy()[rows],
+            'Task': df['Task'].to_numpy()[rows],
+            'Category': df['Category'].astype(object).to_numpy()[rows],
+            'Early Start': self.early_start[rows],
+            'Early Finish': self.early_finish[rows],
+            'Late Start': self.late_start[rows],
+            'Late Finish': self.late_finish[rows],
+            'Float (days)': self.total_float[rows]
+        })
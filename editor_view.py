@@ -0,0 +1,420 @@
+# editor_view.py
+import base64
+from concurrent.futures import CancelledError
+from datetime import datetime, timedelta
+import os
+
+import pandas as pd
+import streamlit as st
+
+# The Excel converter is optional; the conversion workers import data_converter
+try:
+    from conversion_cache import get_conversion_cache
+    from conversion_jobs import DEFAULT_QUEUE_DEPTH, DEFAULT_WORKERS, ConversionQueueFull, get_conversion_pool
+    has_converter = True
+except ImportError:
+    has_converter = False
+
+from change_set import ChangeSet
+from interval_index import tasks_active_in_window
+from scheduler import DEFAULT_CAPACITY, Scheduler
+from session_data import filter_index, repository, rescheduler, task_intervals, task_lookup
+from task_pages import PAGE_SIZES, SORT_COLUMNS, select_page, sort_order
+from task_schema import editable
+from task_state import adopt_commit, derived, tasks_version
+from task_store import next_row_key, read_tasks_csv
+
+# Worker processes converting uploaded workbooks, and conversions allowed to wait for one
+if has_converter:
+    CONVERSION_WORKERS = int(os.environ.get('GANTT_CONVERSION_WORKERS', DEFAULT_WORKERS))
+    CONVERSION_QUEUE_DEPTH = int(os.environ.get('GANTT_CONVERSION_QUEUE_DEPTH', DEFAULT_QUEUE_DEPTH))
+
+# How often a page checks on its running conversion
+CONVERSION_POLL_SECONDS = 1
+
+# Days offered as working days by the scheduler
+WEEKDAYS = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+
+def get_csv_download_link(df, filename="gantt_tasks.csv", label="Download CSV File"):
+    csv = df.to_csv(index=False)
+    b64 = base64.b64encode(csv.encode()).decode()
+    href = f'<a href="data:file/csv;base64,{b64}" download="{filename}">{label}</a>'
+    return href
+
+
+def upcoming_download_link(tasks, today):
+    """Download link for the tasks active in the 30 days from today."""
+    upcoming = tasks_active_in_window(tasks, today, today + timedelta(days=30), task_intervals())
+    return get_csv_download_link(upcoming, "gantt_tasks_next_30_days.csv",
+                                 f"Download Tasks Active in the Next 30 Days ({len(upcoming)})")
+
+
+def working_calendar():
+    """
+    Working days and holidays chosen in the Schedule Tasks tab, as Scheduler arguments.
+
+    Returns:
+    dict: weekmask and holidays (the default calendar until the tab is shown)
+    """
+    work_days = st.session_state.get('schedule_work_days', WEEKDAYS[:5])
+    holiday_text = st.session_state.get('schedule_holidays', '')
+    return {
+        'weekmask': ' '.join(day[:3] for day in work_days),
+        'holidays': [line.strip() for line in holiday_text.splitlines() if line.strip()]
+    }
+
+
+def conversion_pool():
+    """The process-wide pool converting uploaded workbooks; results go into the conversion cache."""
+    cache = get_conversion_cache()
+    return get_conversion_pool(
+        CONVERSION_WORKERS, CONVERSION_QUEUE_DEPTH,
+        on_result=lambda data, today, df: cache.put(cache.key(data, today), df)
+    )
+
+
+
+@st.fragment(run_every=CONVERSION_POLL_SECONDS)
+def conversion_progress():
+    """Show the progress of this session's conversion and load its result when it finishes."""
+    job = conversion_pool().get(st.session_state.conversion_job)
+    if job is None:
+        del st.session_state.conversion_job
+        st.session_state.conversion_message = ('error', "The conversion job is no longer available.")
+        st.rerun()
+
+    if not job.done():
+        rows = job.rows_read()
+        read = "; ".join(f"{sheet}: {n:,} rows" for sheet, n in rows.items()) or "waiting for the first rows"
+        st.info(f"Converting {job.name} ({job.status}): {read}")
+        if st.button("Cancel Conversion"):
+            job.cancel()
+        return
+
+    del st.session_state.conversion_job
+    try:
+        df = job.result()
+        adopt_commit(repository.replace_all(df))
+        st.session_state.conversion_message = ('success', f"Excel data converted successfully! Generated {len(df)} tasks.")
+    except CancelledError:
+        st.session_state.conversion_message = ('warning', "Excel conversion cancelled.")
+    except Exception as e:
+        st.session_state.conversion_message = ('error', f"Error converting Excel data: {e}")
+    st.rerun()
+
+
+def render():
+    """The Data Editor view: edit, add, delete, upload/download and schedule tasks."""
+    st.subheader("Task Data")
+    
+    # Tab layout for different operations
+    tab1, tab2, tab3, tab4, tab5 = st.tabs(["Edit Data", "Add Task", "Delete Task", "Upload/Download", "Schedule"])
+    
+    with tab1:
+        # Edit existing data one page at a time; filtering, sorting and
+        # paging happen here so only the visible rows go to the browser
+        tasks = st.session_state.tasks_data
+        index = filter_index()
+        
+        filter_col1, filter_col2, filter_col3 = st.columns(3)
+        with filter_col1:
+            page_categories = st.multiselect("Category", options=index.options('Category'), key="editor_categories")
+        with filter_col2:
+            page_zones = st.multiselect("Trustee Zone", options=index.options('Trustee_Zone'), key="editor_zones")
+        with filter_col3:
+            page_search = st.text_input("School search", key="editor_search")
+        
+        sort_col1, sort_col2, sort_col3, sort_col4 = st.columns(4)
+        with sort_col1:
+            sort_by = st.selectbox("Sort by", options=["Row order"] + SORT_COLUMNS, key="editor_sort")
+        with sort_col2:
+            descending = st.checkbox("Descending", key="editor_descending")
+        with sort_col3:
+            page_size = st.selectbox("Rows per page", options=PAGE_SIZES, index=1, key="editor_page_size")
+        
+        rows = index.select(
+            Category=page_categories or None,
+            Trustee_Zone=page_zones or None,
+            School=index.search('School', page_search) if page_search else None
+        )
+        # Sort orders are computed once per version of the sorted column
+        order = None
+        if sort_by != "Row order":
+            order = derived(f"sort_order_{sort_by}", lambda df: sort_order(df, sort_by), columns=[sort_by])
+        
+        with sort_col4:
+            page = st.number_input("Page", min_value=1, value=1, step=1, key="editor_page")
+        positions, n_matching, n_pages = select_page(rows, order, int(page), page_size, descending)
+        page_tasks = tasks.iloc[positions]
+        
+        first_row = (min(int(page), n_pages) - 1) * page_size
+        st.caption(
+            f"Rows {first_row + 1 if len(positions) else 0}-{first_row + len(positions)} "
+            f"of {n_matching} matching tasks ({len(tasks)} in total), page {min(int(page), n_pages)} of {n_pages}"
+        )
+        
+        # The editor gets row positions as its index and records which rows
+        # changed; they are merged back by row key. The key changes with
+        # every version of the table so edits that were saved are not replayed
+        editor_key = f"task_editor_{tasks_version()}"
+        edited_df = st.data_editor(
+            editable(page_tasks).reset_index(drop=True),
+            key=editor_key,
+            use_container_width=True,
+            hide_index=True,
+            num_rows="dynamic",
+            column_config={
+                "Task_ID": st.column_config.NumberColumn(
+                    "Task ID",
+                    disabled=True,
+                    help="Assigned automatically"
+                ),
+                "Start": st.column_config.DatetimeColumn(
+                    "Start Date",
+                    format="MM/DD/YYYY",
+                ),
+                "Finish": st.column_config.DatetimeColumn(
+                    "Finish Date",
+                    format="MM/DD/YYYY",
+                ),
+                "Completion_pct": st.column_config.ProgressColumn(
+                    "Completion %",
+                    min_value=0,
+                    max_value=100,
+                    format="%d%%",
+                ),
+                "Trustee_Zone": st.column_config.SelectboxColumn(
+                    "Trustee Zone",
+                    options=[0, 1, 2, 3, 4, 5, 6, 7],
+                    help="0 for non-zone tasks"
+                ),
+                "Category": st.column_config.SelectboxColumn(
+                    "Category",
+                    options=[
+                        "Planning", "Delivery", "Installation", 
+                        "Issue Resolution", "Revisit", "Closeout"
+                    ]
+                ),
+                "Predecessors": st.column_config.TextColumn(
+                    "Predecessors",
+                    help="IDs of the tasks this task waits for, e.g. 12, 15"
+                )
+            }
+        )
+        
+        push_followers = st.checkbox(
+            "Push back the tasks that follow a moved or longer task",
+            value=True,
+            help="Dependent tasks and the next tasks of the same resource move only as far as the change delays them"
+        )
+        
+        if st.button("Update Data"):
+            changes = ChangeSet.from_editor(
+                st.session_state[editor_key], page_tasks.index, edited_df, next_row_key(tasks)
+            )
+            pushed = tasks.index[:0]
+            try:
+                if changes and push_followers:
+                    changes, pushed = rescheduler().shift(tasks, changes, Scheduler(**working_calendar()))
+                if changes:
+                    # Apply and store only the edited, added and deleted rows
+                    adopt_commit(repository.apply_changes(changes))
+                st.success("Data updated successfully!")
+            except ValueError as e:
+                st.error(f"Could not push back the following tasks: {e}")
+            if len(pushed):
+                st.info(f"Pushed back {len(pushed)} following tasks.")
+                moved = tasks.loc[pushed, ['Task', 'Start', 'Finish']].join(
+                    changes.edited.loc[pushed, ['Start', 'Finish']], rsuffix=' (new)'
+                )
+                st.dataframe(moved, use_container_width=True)
+    
+    with tab2:
+        # Add new task
+        st.subheader("Add New Task")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            new_task = st.text_input("Task Name")
+            new_resource = st.text_input("Resource")
+            new_start = st.date_input("Start Date")
+            new_duration = st.number_input("Duration (Days)", min_value=1, value=1)
+            
+        with col2:
+            new_completion = st.slider("Completion %", 0, 100, 0)
+            new_zone = st.selectbox("Trustee Zone", options=[0, 1, 2, 3, 4, 5, 6, 7])
+            new_category = st.selectbox("Category", options=[
+                "Planning", "Delivery", "Installation", 
+                "Issue Resolution", "Revisit", "Closeout"
+            ])
+            new_notes = st.text_input("Notes")
+            new_predecessors = st.text_input("Predecessors", help="IDs of the tasks this task waits for, e.g. 12, 15")
+        
+        if st.button("Add Task"):
+            if new_task:
+                new_start_datetime = datetime.combine(new_start, datetime.min.time())
+                new_finish = new_start_datetime + timedelta(days=new_duration)
+                
+                # The repository assigns the task ID when it stores the row
+                new_row = pd.DataFrame({
+                    'Task': [new_task],
+                    'Resource': [new_resource],
+                    'Start': [new_start_datetime],
+                    'Duration': [new_duration],
+                    'Finish': [new_finish],
+                    'Completion_pct': [new_completion],
+                    'Trustee_Zone': [new_zone],
+                    'Category': [new_category],
+                    'Notes': [new_notes],
+                    'Predecessors': [new_predecessors]
+                })
+                
+                # Store only the new row
+                commit = repository.append(new_row)
+                adopt_commit(commit)
+                new_id = commit.added.index[0]
+                st.success(f"Task '{new_task}' added successfully! (Task ID {new_id})")
+            else:
+                st.error("Task name is required!")
+    
+    with tab3:
+        # Delete task
+        st.subheader("Delete Task")
+        
+        tasks = st.session_state.tasks_data
+        lookup = task_lookup()
+        
+        # Only the first matches of the search are listed
+        delete_search = st.text_input("Search tasks by name or ID", key="delete_search")
+        positions, n_found = lookup.search(delete_search)
+        labels = {
+            task_id: f"#{task_id} - {name}"
+            for task_id, name in zip(tasks.index[positions].tolist(), tasks['Task'].iloc[positions].tolist())
+        }
+        if n_found > len(positions):
+            st.caption(f"Showing the first {len(positions)} of {n_found} matching tasks; refine the search to see others.")
+        
+        task_to_delete = st.selectbox(
+            "Select Task to Delete",
+            options=list(labels),
+            format_func=labels.get
+        )
+        
+        if st.button("Delete Selected Task") and task_to_delete is not None:
+            # Only the selected task is removed, even if others share its name
+            deleted_name = tasks['Task'].iloc[lookup.position(task_to_delete)]
+            adopt_commit(repository.delete([task_to_delete]))
+            st.success(f"Task '{deleted_name}' deleted successfully!")
+    
+    with tab4:
+        # File upload/download
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.subheader("Upload Data")
+            
+            # Excel converter (if available)
+            if has_converter:
+                st.write("### Convert UPS Project Excel File")
+                uploaded_excel = st.file_uploader("Upload Excel Spreadsheet", type=["xlsx"])
+                
+                if uploaded_excel is not None:
+                    if st.button("Convert Excel Data") and 'conversion_job' not in st.session_state:
+                        data = uploaded_excel.getvalue()
+                        # Undated tasks are scheduled from today, so conversions are cached per day
+                        today = datetime.now().date()
+                        cache = get_conversion_cache()
+                        df = cache.get(cache.key(data, today))
+                        if df is not None:
+                            adopt_commit(repository.replace_all(df))
+                            st.success(f"Excel data loaded from a previous conversion! Generated {len(df)} tasks.")
+                        else:
+                            # Convert in a worker process; the page polls the job below
+                            try:
+                                st.session_state.conversion_job = conversion_pool().submit(data, uploaded_excel.name, today)
+                            except ConversionQueueFull as e:
+                                st.warning(f"The converter is busy ({e}). Please try again shortly.")
+
+                if 'conversion_job' in st.session_state:
+                    conversion_progress()
+                if 'conversion_message' in st.session_state:
+                    kind, message = st.session_state.pop('conversion_message')
+                    getattr(st, kind)(message)
+            
+            # CSV upload
+            st.write("### Upload CSV directly")
+            uploaded_csv = st.file_uploader("Upload CSV", type="csv")
+            
+            # The uploader keeps its file across reruns; store each upload once
+            if uploaded_csv is not None and st.session_state.get('stored_csv_upload') != uploaded_csv.file_id:
+                try:
+                    df = read_tasks_csv(uploaded_csv)
+                    adopt_commit(repository.replace_all(df))
+                    st.session_state.stored_csv_upload = uploaded_csv.file_id
+                    st.success("Data uploaded successfully!")
+                except Exception as e:
+                    st.error(f"Error: {e}")
+        
+        with col2:
+            st.subheader("Download Data")
+            
+            # The CSV exports are built once per version of the tasks, not on every rerun
+            st.markdown(derived('csv_download_link', get_csv_download_link), unsafe_allow_html=True)
+            
+            # Tasks active in the next 30 days, e.g. to share with the field teams
+            today = datetime.now().date()
+            st.markdown(
+                derived('upcoming_csv_download_link', lambda tasks: upcoming_download_link(tasks, today), key=today),
+                unsafe_allow_html=True
+            )
+
+    with tab5:
+        # Reschedule the tasks that have not started by crew capacity and dependencies
+        st.subheader("Schedule Tasks")
+        st.write(
+            "Tasks that have not started are rescheduled so that each resource's crews work one task "
+            "at a time, Installations follow their school's Delivery, and Issue Resolutions and "
+            "Revisits follow the Installation. Started and completed tasks keep their dates."
+        )
+        
+        tasks = st.session_state.tasks_data
+        resources = pd.Series(tasks['Resource'].astype(str).unique()).sort_values(ignore_index=True)
+        crews = st.data_editor(
+            pd.DataFrame({'Resource': resources, 'Crews': DEFAULT_CAPACITY}),
+            column_config={
+                'Resource': st.column_config.TextColumn("Resource", disabled=True),
+                'Crews': st.column_config.NumberColumn("Crews", min_value=1, step=1)
+            },
+            hide_index=True,
+            key="schedule_crews"
+        )
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            schedule_start = st.date_input("Earliest start", value=datetime.now().date(), key="schedule_start")
+            st.multiselect(
+                "Working days", WEEKDAYS, default=WEEKDAYS[:5], key="schedule_work_days"
+            )
+        with col2:
+            st.text_area("Holidays (one date per line, YYYY-MM-DD)", key="schedule_holidays")
+        
+        if st.button("Reschedule Tasks"):
+            try:
+                scheduler = Scheduler(
+                    dict(zip(crews['Resource'], crews['Crews'].fillna(DEFAULT_CAPACITY).astype(int))),
+                    **working_calendar()
+                )
+                scheduled = scheduler.schedule(tasks, start=schedule_start)
+                moved = (scheduled['Start'] != tasks['Start']) | (scheduled['Finish'] != tasks['Finish'])
+                if moved.any():
+                    # Only the Start and Finish of the moved tasks are written
+                    changes = ChangeSet(scheduled.loc[moved, ['Start', 'Finish']], tasks.iloc[:0], tasks.index[:0])
+                    adopt_commit(repository.apply_changes(changes))
+                st.success(
+                    f"Rescheduled {int(moved.sum())} tasks. "
+                    f"The project now ends on {scheduled['Finish'].max():%Y-%m-%d}."
+                )
+            except ValueError as e:
+                st.error(f"Could not schedule the tasks: {e}")
@@ -0,0 +1,152 @@
+# filter_index.py
+import numpy as np
+import pandas as pd
+
+from interval_index import TaskIntervals, day_window
+
+# Columns with at most this many values keep one boolean mask per value;
+# larger ones (schools) are filtered through their codes instead
+MAX_MASKED_VALUES = 64
+
+# Task names look like "School Name: Action"
+SCHOOL_PATTERN = r'^([^:]+):'
+
+
+def school_names(tasks):
+    """
+    Return the school of each task as (codes, labels).
+
+    The school is the part of the task name before the first colon, or the
+    whole name when there is no colon. The pattern is only matched against
+    the distinct task names.
+    """
+    task_codes, unique_tasks = pd.factorize(tasks)
+    unique_tasks = pd.Series(unique_tasks, dtype=object)
+    names = unique_tasks.str.extract(SCHOOL_PATTERN, expand=False).fillna(unique_tasks)
+    school_codes, schools = pd.factorize(names)
+    return _remap(task_codes, school_codes), np.asarray(schools, dtype=object)
+
+
+def _remap(codes, mapping):
+    """Translate codes through mapping, keeping -1 for missing values."""
+    return np.where(codes >= 0, mapping[codes], -1) if len(mapping) else codes
+
+
+class _Column:
+    """Codes, labels and (for small columns) per-value masks of one filter column."""
+
+    def __init__(self, codes, labels):
+        self.codes = codes
+        self.labels = labels
+        self.positions = {label: i for i, label in enumerate(labels)}
+        self.masks = None
+        if len(labels) <= MAX_MASKED_VALUES:
+            self.masks = codes[np.newaxis, :] == np.arange(len(labels))[:, np.newaxis]
+
+    def mask(self, values):
+        positions = [self.positions[v] for v in values if v in self.positions]
+        if self.masks is not None:
+            return np.logical_or.reduce(self.masks[positions], axis=0) if positions else \
+                np.zeros(len(self.codes), dtype=bool)
+        # One extra False slot so that code -1 (missing) never matches
+        allowed = np.zeros(len(self.labels) + 1, dtype=bool)
+        allowed[positions] = True
+        return allowed[self.codes]
+
+    def counts(self, rows=None):
+        codes = self.codes if rows is None else self.codes[rows]
+        return np.bincount(codes[codes >= 0], minlength=len(self.labels))
+
+
+class FilterIndex:
+    """
+    Precomputed lookups for the Gantt chart sidebar filters.
+
+    Built once per version of the task table. School names, Trustee_Zone
+    labels and Category are stored as integer codes, with one boolean mask
+    per value for the small columns, and the completion buckets are stored
+    as masks. Filtering is then a few boolean ANDs over arrays instead of
+    string operations and copies of the whole table.
+
+    Zones are matched by their text, as the sidebar lists them. Date
+    windows are answered by a TaskIntervals index.
+
+    Parameters:
+    df (pandas.DataFrame): The task table
+    intervals (TaskIntervals, optional): Interval index already built for df
+    """
+
+    # Task table columns the index is built from
+    COLUMNS = ('Task', 'Category', 'Trustee_Zone', 'Completion_pct', 'Start', 'Finish')
+
+    def __init__(self, df, intervals=None):
+        self.size = len(df)
+        self.intervals = TaskIntervals.from_frame(df) if intervals is None else intervals
+
+        category_codes, categories = pd.factorize(df['Category'])
+        zone_codes, zones = pd.factorize(df['Trustee_Zone'])
+        # Zones like 1 and '1' share a label
+        zone_label_codes, zone_labels = pd.factorize(pd.Index(zones, dtype=object).astype(str))
+        school_codes, schools = school_names(df['Task'])
+
+        self.columns = {
+            'Category': _Column(category_codes, np.asarray(categories, dtype=object)),
+            'Trustee_Zone': _Column(_remap(zone_codes, zone_label_codes), np.asarray(zone_labels, dtype=object)),
+            'School': _Column(school_codes, schools),
+        }
+
+        completion = pd.to_numeric(df['Completion_pct'], errors='coerce').to_numpy(dtype=float)
+        self.complete = completion == 100
+        self.incomplete = completion < 100
+
+    def date_window(self, start_date, end_date):
+        """
+        Mask of tasks that overlap the days from start_date to end_date inclusive.
+
+        Parameters:
+        start_date (datetime.date): First day of the window
+        end_date (datetime.date): Last day of the window
+
+        Returns:
+        numpy.ndarray: Boolean mask over the task table
+        """
+        return self.intervals.mask(*day_window(start_date, end_date))
+
+    def options(self, column, rows=None):
+        """Sorted values of `column` that occur in the rows selected by the mask `rows`."""
+        column = self.columns[column]
+        return sorted(column.labels[column.counts(rows) > 0])
+
+    def value_counts(self, column, rows=None):
+        """Number of tasks per value of `column` in the selected rows, largest first."""
+        column = self.columns[column]
+        counts = pd.Series(column.counts(rows), index=column.labels)
+        return counts[counts > 0].sort_values(ascending=False, kind='stable')
+
+    def search(self, column, text, rows=None):
+        """Sorted values of `column` containing `text` (case-insensitive) in the selected rows."""
+        text = text.lower()
+        return [value for value in self.options(column, rows) if text in str(value).lower()]
+
+    def labels(self, column, rows):
+        """Values of `column` for the selected rows."""
+        column = self.columns[column]
+        return column.labels[column.codes[rows]]
+
+    def select(self, rows=None, **values):
+        """
+        Combine the filters into one mask.
+
+        Parameters:
+        rows (numpy.ndarray, optional): Mask to start from, e.g. a date window
+        **values: Allowed values per column (Category, Trustee_Zone, School);
+            None leaves the column unfiltered
+
+        Returns:
+        numpy.ndarray: Boolean mask over the task table
+        """
+        mask = np.ones(self.size, dtype=bool) if rows is None else rows.copy()
+        for column, allowed in values.items():
+            if allowed is not None:
+                mask &= self.columns[column].mask(allowed)
+        return mask
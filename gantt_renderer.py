@@ -0,0 +1,281 @@
+# gantt_renderer.py
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+# Bar colour for each task category
+CATEGORY_COLORS = {
+    'Planning': 'rgb(46, 137, 205)',
+    'Delivery': 'rgb(114, 44, 121)',
+    'Installation': 'rgb(198, 47, 105)',
+    'Issue Resolution': 'rgb(58, 149, 136)',
+    'Revisit': 'rgb(214, 39, 40)',
+    'Closeout': 'rgb(31, 119, 180)'
+}
+
+BAR_WIDTH = 0.4
+
+# Summary bars: the whole span, and the completed share drawn over it
+SUMMARY_COLOR = 'rgb(189, 201, 225)'
+PROGRESS_COLOR = 'rgb(58, 149, 136)'
+
+# Chart height per row of bars, and its bounds, in pixels
+ROW_HEIGHT = 22
+MIN_HEIGHT = 400
+MAX_HEIGHT = 1600
+
+# Heatmap colours for load per crew: green up to 1 (fully booked), then orange to red
+LOAD_COLORSCALE = [
+    [0.0, 'rgb(247, 252, 245)'],
+    [0.5, 'rgb(58, 149, 136)'],
+    [0.5, 'rgb(253, 174, 97)'],
+    [1.0, 'rgb(215, 48, 39)']
+]
+
+# Outline drawn around critical tasks
+CRITICAL_LINE = dict(color='rgb(255, 191, 0)', width=3)
+
+# Same range buttons as plotly's figure_factory Gantt chart
+RANGE_BUTTONS = [
+    dict(count=7, label='1w', step='day', stepmode='backward'),
+    dict(count=1, label='1m', step='month', stepmode='backward'),
+    dict(count=6, label='6m', step='month', stepmode='backward'),
+    dict(count=1, label='YTD', step='year', stepmode='todate'),
+    dict(count=1, label='1y', step='year', stepmode='backward'),
+    dict(step='all')
+]
+
+
+HOVER_TEMPLATE = (
+    "Task: %{customdata[0]}<br>"
+    "Resource: %{customdata[1]}<br>"
+    "Date: %{customdata[2]} to %{customdata[3]}<br>"
+    "Completion: %{customdata[4]}%<br>"
+    "Zone: %{customdata[5]}<br>"
+    "%{customdata[6]}"
+    "<extra></extra>"
+)
+
+
+def _text_column(values):
+    """Column values as an object array of strings."""
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        # Format each category once; code -1 (missing) picks the trailing 'nan'
+        labels = np.append(values.cat.categories.astype(str).to_numpy(dtype=object), 'nan')
+        return labels[values.cat.codes.to_numpy()]
+    return values.astype(str).to_numpy(dtype=object)
+
+
+def hover_data(df):
+    """
+    Build the hover payload for every task in one vectorized pass.
+
+    Parameters:
+    df (pandas.DataFrame): Tasks to describe
+
+    Returns:
+    numpy.ndarray: One row of HOVER_TEMPLATE fields per task
+    """
+    start = df['Start'].to_numpy(dtype='datetime64[ns]')
+    finish = df['Finish'].to_numpy(dtype='datetime64[ns]')
+
+    notes = df['Notes'].astype(object)
+    has_notes = notes.notna() & (notes != '')
+    notes_line = np.where(has_notes, 'Notes: ' + notes.where(has_notes, '').astype(str), '')
+
+    return np.column_stack([
+        _text_column(df['Task']),
+        _text_column(df['Resource']),
+        np.datetime_as_string(start, unit='D').astype(object),
+        np.datetime_as_string(finish, unit='D').astype(object),
+        _text_column(df['Completion_pct']),
+        _text_column(df['Trustee_Zone']),
+        notes_line.astype(object)
+    ])
+
+
+def build_gantt_figure(df, colors=CATEGORY_COLORS, title='UPS Installation Project Schedule', critical=None):
+    """
+    Build a Gantt chart with one horizontal bar trace per task category.
+
+    Bars are drawn straight from the Start/Finish arrays (base = Start,
+    length = Finish - Start), so the figure size grows with the number of
+    categories rather than the number of tasks. Each trace carries the hover
+    fields of its own tasks as customdata. Tasks with the same name
+    share a row, and the first task is at the top, as in
+    plotly.figure_factory.create_gantt(group_tasks=True).
+
+    Parameters:
+    df (pandas.DataFrame): Tasks with Task, Start, Finish and Category columns
+    colors (dict): Bar colour for each category
+    title (str): Chart title
+    critical (numpy.ndarray, optional): Boolean mask of the tasks to outline as critical
+
+    Returns:
+    plotly.graph_objects.Figure: The Gantt chart
+    """
+    dated = (df['Start'].notna() & df['Finish'].notna()).to_numpy()
+    df = df[dated]
+    if critical is not None:
+        critical = np.asarray(critical, dtype=bool)[dated]
+
+    row_codes, row_labels = pd.factorize(df['Task'])
+    n_rows = len(row_labels)
+    # First task on top
+    y = n_rows - 1 - row_codes
+
+    start = df['Start'].to_numpy(dtype='datetime64[ns]')
+    finish = df['Finish'].to_numpy(dtype='datetime64[ns]')
+    # Date axes measure bar lengths in milliseconds
+    length_ms = (finish - start) / np.timedelta64(1, 'ms')
+    customdata = hover_data(df)
+
+    category_codes, categories = pd.factorize(df['Category'].astype(object), sort=False)
+    ordered = [c for c in colors if c in set(categories)] + [c for c in categories if c not in colors]
+    positions = {category: i for i, category in enumerate(categories)}
+
+    fig = go.Figure()
+    for category in ordered:
+        mask = category_codes == positions[category]
+        fig.add_trace(go.Bar(
+            name=str(category),
+            orientation='h',
+            base=start[mask],
+            x=length_ms[mask],
+            y=y[mask],
+            width=BAR_WIDTH * 2,
+            marker_color=colors.get(category),
+            customdata=customdata[mask],
+            hovertemplate=HOVER_TEMPLATE,
+        ))
+        if critical is not None:
+            fig.data[-1].marker.line = dict(
+                color=CRITICAL_LINE['color'],
+                width=np.where(critical[mask], CRITICAL_LINE['width'], 0)
+            )
+
+    fig.update_layout(
+        title=title,
+        barmode='overlay',
+        showlegend=True,
+        hovermode='closest',
+        height=600,
+        xaxis=dict(type='date', showgrid=True, zeroline=False, rangeselector=dict(buttons=RANGE_BUTTONS)),
+        yaxis=dict(
+            showgrid=True,
+            zeroline=False,
+            tickvals=np.arange(n_rows)[::-1],
+            ticktext=np.asarray(row_labels, dtype=object),
+            range=[-1, n_rows + 1],
+            autorange=False
+        )
+    )
+    return fig
+
+
+def chart_height(n_rows):
+    """Height in pixels for a chart with n_rows rows of bars."""
+    return int(min(MAX_HEIGHT, max(MIN_HEIGHT, ROW_HEIGHT * n_rows + 200)))
+
+
+def build_summary_figure(bars, level, title='UPS Installation Project Schedule'):
+    """
+    Build a Gantt chart of summary bars, one per zone or school.
+
+    Each bar spans its tasks from the earliest Start to the latest Finish,
+    with the completed share (Completion_pct of the span) drawn over it.
+
+    Parameters:
+    bars (pandas.DataFrame): Label, Zone, Start, Finish, Completion_pct and
+        Tasks of each bar (see TimelineLevels.summary)
+    level (str): 'Zone' or 'School', for the hover text
+    title (str): Chart title
+
+    Returns:
+    plotly.graph_objects.Figure: The Gantt chart
+    """
+    n_rows = len(bars)
+    # First bar on top
+    y = n_rows - 1 - np.arange(n_rows)
+    start = bars['Start'].to_numpy(dtype='datetime64[ns]')
+    length_ms = (bars['Finish'].to_numpy(dtype='datetime64[ns]') - start) / np.timedelta64(1, 'ms')
+    completion = bars['Completion_pct'].to_numpy(dtype=float)
+    customdata = np.column_stack([
+        bars['Label'].to_numpy(dtype=object),
+        bars['Tasks'].to_numpy(),
+        np.datetime_as_string(start, unit='D').astype(object),
+        np.datetime_as_string(bars['Finish'].to_numpy(dtype='datetime64[ns]'), unit='D').astype(object),
+        completion,
+        bars['Zone'].to_numpy(dtype=object)
+    ])
+    hover = (
+        f"{level}: %{{customdata[0]}}<br>"
+        "Tasks: %{customdata[1]}<br>"
+        "Date: %{customdata[2]} to %{customdata[3]}<br>"
+        "Completion: %{customdata[4]}%<br>"
+        "Zone: %{customdata[5]}"
+        "<extra></extra>"
+    )
+
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        name=f"{level} span", orientation='h', base=start, x=length_ms, y=y, width=BAR_WIDTH * 2,
+        marker_color=SUMMARY_COLOR, customdata=customdata, hovertemplate=hover
+    ))
+    fig.add_trace(go.Bar(
+        name='Completed', orientation='h', base=start, x=length_ms * completion / 100, y=y, width=BAR_WIDTH,
+        marker_color=PROGRESS_COLOR, customdata=customdata, hovertemplate=hover
+    ))
+    fig.update_layout(
+        title=title,
+        barmode='overlay',
+        showlegend=True,
+        hovermode='closest',
+        height=chart_height(n_rows),
+        xaxis=dict(type='date', showgrid=True, zeroline=False, rangeselector=dict(buttons=RANGE_BUTTONS)),
+        yaxis=dict(
+            showgrid=True,
+            zeroline=False,
+            tickvals=y,
+            ticktext=bars['Label'].to_numpy(dtype=object),
+            range=[-1, n_rows],
+            autorange=False
+        )
+    )
+    return fig
+
+
+def build_load_heatmap(resources, periods, peak, utilization, title='Resource Load'):
+    """
+    Build a heatmap of each resource's load over time.
+
+    Cells are coloured by peak tasks per crew, capped at 2: green while the
+    crews keep up, orange to red when the resource is overallocated.
+
+    Parameters:
+    resources (pandas.Index): Resource names, one heatmap row each
+    periods (numpy.ndarray): datetime64 first day of each column
+    peak (numpy.ndarray): Peak tasks per resource and period
+    utilization (numpy.ndarray): peak divided by the resource's crews
+
+    Returns:
+    plotly.graph_objects.Figure: The heatmap
+    """
+    fig = go.Figure(go.Heatmap(
+        x=periods,
+        y=np.asarray(resources, dtype=object),
+        z=np.minimum(utilization, 2),
+        zmin=0,
+        zmax=2,
+        colorscale=LOAD_COLORSCALE,
+        customdata=peak,
+        colorbar=dict(title='Tasks per crew'),
+        hovertemplate='%{y}<br>%{x|%Y-%m-%d}<br>Peak tasks: %{customdata}<extra></extra>'
+    ))
+    fig.update_layout(
+        title=title,
+        height=max(300, 40 * len(resources) + 150),
+        xaxis=dict(type='date', showgrid=False, rangeselector=dict(buttons=RANGE_BUTTONS)),
+        yaxis=dict(autorange='reversed')
+    )
+    return fig
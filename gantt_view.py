@@ -0,0 +1,281 @@
+# gantt_view.py
+from datetime import datetime, timedelta
+
+import pandas as pd
+import streamlit as st
+
+from gantt_renderer import build_gantt_figure, build_summary_figure, chart_height
+from memory_report import memory_report
+from session_data import critical_path, filter_index, repository, timeline_levels
+from task_state import get_tasks
+from timeline_levels import DEFAULT_BAR_BUDGET, LEVELS, box_window
+
+
+def render():
+    """The Gantt Chart view, with the sidebar filters and level of detail."""
+    df = get_tasks()
+    
+    # School names, zone labels and category codes are indexed once per version of the table
+    index = filter_index()
+    
+    # Rows inside the selected time period (None means all dates)
+    date_rows = None
+    
+    # ADVANCED FILTERING OPTIONS
+    with st.sidebar:
+        st.subheader("Filter Options")
+        
+        # Filter by time period
+        st.write("### Time Period")
+        date_filter_option = st.radio(
+            "Select date range:",
+            ["All Dates", "Next 30 Days", "Next 90 Days", "Custom Range"]
+        )
+        
+        if date_filter_option == "Custom Range":
+            min_date = df['Start'].min().date()
+            max_date = df['Finish'].max().date()
+            
+            date_range = st.date_input(
+                "Select date range:",
+                value=(min_date, min_date + timedelta(days=30)),
+                min_value=min_date,
+                max_value=max_date
+            )
+            
+            if len(date_range) == 2:
+                start_date, end_date = date_range
+                date_rows = index.date_window(start_date, end_date)
+        elif date_filter_option == "Next 30 Days":
+            today = datetime.now().date()
+            date_rows = index.date_window(today, today + timedelta(days=30))
+        elif date_filter_option == "Next 90 Days":
+            today = datetime.now().date()
+            date_rows = index.date_window(today, today + timedelta(days=90))
+        
+        # Filter by category
+        st.write("### Categories")
+        all_categories = index.options('Category', date_rows)
+        selected_categories = st.multiselect(
+            "Filter by Category",
+            options=all_categories,
+            default=all_categories
+        )
+        
+        # Filter by zone
+        st.write("### Trustee Zones")
+        available_zones = index.options('Trustee_Zone', date_rows)
+        selected_zones = st.multiselect(
+            "Filter by Trustee Zone",
+            options=available_zones,
+            default=available_zones
+        )
+        
+        # Filter by school name using search
+        st.write("### Schools")
+        all_schools = index.options('School', date_rows)
+        
+        # Store if user has explicitly interacted with school selection
+        if 'school_selection_changed' not in st.session_state:
+            st.session_state.school_selection_changed = False
+            
+        school_search = st.text_input("Search for specific school:")
+        
+        # Set default schools - but we'll track if user changes this
+        default_schools = all_schools[:5] if len(all_schools) > 5 else all_schools
+        
+        if school_search:
+            matching_schools = index.search('School', school_search, date_rows)
+            selected_schools = st.multiselect(
+                "Select schools:",
+                options=all_schools,
+                default=matching_schools,
+                key="school_selector"
+            )
+            # User has explicitly searched, so mark as changed
+            st.session_state.school_selection_changed = True
+        else:
+            # Check if we should use "All Schools" option
+            use_all_schools = st.checkbox("Show all schools", value=False)
+            
+            if use_all_schools:
+                selected_schools = all_schools
+                st.session_state.school_selection_changed = True
+            else:
+                selected_schools = st.multiselect(
+                    "Select schools:",
+                    options=all_schools,
+                    default=default_schools,
+                    key="school_selector"
+                )
+                
+                # Check if the selection has changed from default
+                if set(selected_schools) != set(default_schools):
+                    st.session_state.school_selection_changed = True
+        
+        # Filter by completion status
+        st.write("### Status")
+        completion_options = {
+            "All Tasks": None,
+            "Incomplete Tasks": 99,
+            "Completed Tasks": 100
+        }
+        
+        selected_completion = st.radio(
+            "Filter by completion status:",
+            options=list(completion_options.keys())
+        )
+        
+        # Critical path from the task dependencies
+        st.write("### Critical Path")
+        highlight_critical = st.checkbox("Highlight critical tasks", value=False)
+        only_critical = st.checkbox("Show only critical tasks", value=False)
+        
+        # Summary bars per zone or school when there are too many tasks to draw
+        st.write("### Level of Detail")
+        detail = st.selectbox(
+            "Bars",
+            ["Auto"] + list(LEVELS),
+            help="Auto draws one bar per task, per school or per zone, the finest that fits the bar budget"
+        )
+        bar_budget = st.number_input(
+            "Bar budget", min_value=20, max_value=5000, value=DEFAULT_BAR_BUDGET, step=20,
+            help="Most bars Auto draws"
+        )
+    
+    # Debugging code - this helps identify why only some Issue Resolution tasks are showing
+    with st.expander("View Category Distribution", expanded=False):
+        # Check distribution by category
+        category_counts = index.value_counts('Category', date_rows).rename_axis('Category').reset_index(name='Count')
+        st.write("Tasks by category:")
+        st.dataframe(category_counts)
+        
+        # Check specifically for Issue Resolution tasks
+        issue_rows = index.select(date_rows, Category=['Issue Resolution'])
+        issue_tasks = df[issue_rows].assign(School=index.labels('School', issue_rows))
+        st.write(f"Issue Resolution tasks: {len(issue_tasks)}")
+        st.dataframe(issue_tasks[['Task', 'School', 'Category', 'Trustee_Zone', 'Completion_pct']])
+    
+    # Apply filters - empty category or zone selections leave that filter off,
+    # and schools are only filtered once the user has changed the selection
+    rows = index.select(
+        date_rows,
+        Category=selected_categories or None,
+        Trustee_Zone=selected_zones or None,
+        School=selected_schools if st.session_state.school_selection_changed else None
+    )
+    
+    # Apply completion status filter
+    if selected_completion != "All Tasks":
+        threshold = completion_options[selected_completion]
+        if threshold == 100:
+            rows &= index.complete
+        else:
+            rows &= index.incomplete
+    
+    # Zoom window picked by dragging a box over the chart
+    zoom = st.session_state.get('gantt_zoom')
+    if zoom is not None:
+        rows &= index.date_window(*zoom)
+        col1, col2 = st.columns([3, 1])
+        with col1:
+            st.write(f"Zoomed to {zoom[0]:%Y-%m-%d} - {zoom[1]:%Y-%m-%d}")
+        with col2:
+            if st.button("Reset zoom"):
+                st.session_state.gantt_zoom = None
+                st.rerun()
+    
+    critical = None
+    if highlight_critical or only_critical:
+        cpm = critical_path()
+        if only_critical:
+            rows &= cpm.critical
+        critical = cpm.critical[rows] if highlight_critical else None
+    
+    chart_data = df if rows.all() else df[rows]
+    
+    # Draw the finest level of detail that fits the bar budget
+    levels = timeline_levels()
+    level = levels.choose_level(rows, int(bar_budget)) if detail == "Auto" else detail
+    
+    if level == 'Task':
+        st.write(f"Displaying {len(chart_data)} tasks")
+        fig = build_gantt_figure(chart_data, critical=critical)
+        fig.update_layout(height=chart_height(chart_data['Task'].nunique()), yaxis_title="Tasks")
+    else:
+        bars = levels.summary(level, rows)
+        st.write(
+            f"Displaying {len(chart_data)} tasks as {len(bars)} {level.lower()} bars. "
+            "Drag a box over the chart to zoom in on its dates and see more detail."
+        )
+        fig = build_summary_figure(bars, level)
+        fig.update_layout(yaxis_title=f"{level}s")
+    
+    # Update layout for better display
+    fig.update_layout(
+        autosize=True,
+        margin=dict(l=50, r=50, b=100, t=100, pad=4),
+        xaxis_title="Timeline",
+        dragmode='select'
+    )
+    if zoom is not None:
+        fig.update_xaxes(range=[pd.Timestamp(zoom[0]), pd.Timestamp(zoom[1]) + timedelta(days=1)])
+    
+    # Plotly zooms are not sent back to the app, so a box selection sets the zoom window.
+    # The chart key changes with the window so the old selection is cleared.
+    event = st.plotly_chart(
+        fig,
+        use_container_width=True,
+        on_select="rerun",
+        selection_mode="box",
+        key=f"gantt_chart_{zoom}"
+    )
+    boxes = event.selection.box if event else []
+    window = box_window(boxes[0]) if boxes else None
+    if window is not None and window != zoom:
+        st.session_state.gantt_zoom = window
+        st.rerun()
+    
+    # Display filtered data in a table view
+    with st.expander("View Filtered Task Details"):
+        st.dataframe(
+            chart_data[['Task', 'Category', 'Start', 'Finish', 'Completion_pct', 'Trustee_Zone', 'Resource', 'Notes']],
+            use_container_width=True,
+            hide_index=True
+        )
+    
+    if highlight_critical or only_critical:
+        with st.expander("Critical Path Details"):
+            st.write(
+                f"{int(cpm.critical.sum())} critical tasks; the project finishes on "
+                f"{pd.Timestamp(cpm.project_finish):%Y-%m-%d}."
+            )
+            if cpm.in_cycle.any():
+                st.warning(f"{int(cpm.in_cycle.sum())} tasks are in or after a dependency cycle and were left out.")
+            st.write("Tasks driving the project finish:")
+            st.dataframe(cpm.table(df, cpm.chain()), use_container_width=True, hide_index=True)
+
+
+def show_debug_info():
+    """Sidebar checkbox for the Gantt Chart's debugging information."""
+    st.sidebar.markdown("---")
+    show_debug = st.sidebar.checkbox("Show Debugging Information", value=False)
+    
+    if show_debug:
+        st.sidebar.markdown("""
+        **Debugging Info:**
+        - The "View Category Distribution" expander shows raw data
+        - School filtering is only applied when explicitly changed
+        - Default is to show all Issue Resolution tasks
+        """)
+        
+        with st.expander("Memory Usage", expanded=False):
+            # Sessions share the columns of the repository's latest version
+            tasks = st.session_state.tasks_data
+            report = memory_report(tasks, repository.snapshot()[1])
+            col1, col2 = st.columns(2)
+            with col1:
+                st.metric("Before (bytes/task)", f"{report['Before (bytes/task)'].sum():.0f}")
+            with col2:
+                st.metric("After (bytes/task)", f"{report['After (bytes/task)'].sum():.0f}")
+            st.dataframe(report, hide_index=True, use_container_width=True)
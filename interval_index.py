@@ -0,0 +1,101 @@
+# interval_index.py
+import numpy as np
+
+
+def day_window(start_date, end_date):
+    """
+    Return the half-open datetime64 window covering the days start_date to end_date.
+
+    Parameters:
+    start_date (datetime.date): First day of the window
+    end_date (datetime.date): Last day of the window (inclusive)
+
+    Returns:
+    tuple: (numpy.datetime64, numpy.datetime64) Window start and end
+    """
+    return np.datetime64(start_date, 'D'), np.datetime64(end_date, 'D') + np.timedelta64(1, 'D')
+
+
+class TaskIntervals:
+    """
+    Interval index over the Start/Finish of every task.
+
+    Tasks are kept sorted by start time next to a running maximum of their
+    finish times. An overlap query finds the last task starting inside the
+    window and the first task whose running maximum finish reaches the
+    window with two binary searches. Only the tasks between those positions
+    are checked. Tasks with a missing Start or Finish never match.
+
+    A task is active in the window [window_start, window_end) when it starts
+    before window_end and finishes on or after window_start, the same rule
+    as the Gantt chart's time period filters.
+
+    Parameters:
+    start (numpy.ndarray): datetime64 start of each task
+    finish (numpy.ndarray): datetime64 finish of each task
+    """
+
+    # Task table columns the index is built from
+    COLUMNS = ('Start', 'Finish')
+
+    def __init__(self, start, finish):
+        start = np.asarray(start, dtype='datetime64[ns]')
+        finish = np.asarray(finish, dtype='datetime64[ns]')
+        self.size = len(start)
+
+        valid = np.flatnonzero(~np.isnat(start) & ~np.isnat(finish))
+        self.order = valid[np.argsort(start[valid], kind='stable')]
+        self.start = start[self.order]
+        self.finish = finish[self.order]
+        self.max_finish = np.maximum.accumulate(self.finish) if len(self.finish) else self.finish
+
+    @classmethod
+    def from_frame(cls, df):
+        """Build the index from a task table's Start and Finish columns."""
+        return cls(df['Start'].to_numpy(dtype='datetime64[ns]'), df['Finish'].to_numpy(dtype='datetime64[ns]'))
+
+    def overlapping(self, window_start, window_end):
+        """
+        Positions of the tasks active in [window_start, window_end).
+
+        Parameters:
+        window_start (numpy.datetime64): Start of the window
+        window_end (numpy.datetime64): End of the window (exclusive)
+
+        Returns:
+        numpy.ndarray: Row positions in ascending order
+        """
+        window_start = np.datetime64(window_start, 'ns')
+        window_end = np.datetime64(window_end, 'ns')
+        last = np.searchsorted(self.start, window_end, side='left')
+        first = np.searchsorted(self.max_finish[:last], window_start, side='left')
+        candidates = slice(first, last)
+        return np.sort(self.order[candidates][self.finish[candidates] >= window_start])
+
+    def mask(self, window_start, window_end):
+        """Boolean mask over the tasks of those active in [window_start, window_end)."""
+        mask = np.zeros(self.size, dtype=bool)
+        mask[self.overlapping(window_start, window_end)] = True
+        return mask
+
+    def count(self, window_start, window_end):
+        """Number of tasks active in [window_start, window_end)."""
+        return len(self.overlapping(window_start, window_end))
+
+
+def tasks_active_in_window(df, start_date, end_date, intervals=None):
+    """
+    Return the tasks active on any day from start_date to end_date.
+
+    Parameters:
+    df (pandas.DataFrame): The task table
+    start_date (datetime.date): First day of the window
+    end_date (datetime.date): Last day of the window (inclusive)
+    intervals (TaskIntervals, optional): Index already built for df
+
+    Returns:
+    pandas.DataFrame: The active tasks, in table order
+    """
+    if intervals is None:
+        intervals = TaskIntervals.from_frame(df)
+    return df.iloc[intervals.overlapping(*day_window(start_date, end_date))]
@@ -0,0 +1,85 @@
+# memory_report.py
+import numpy as np
+import pandas as pd
+
+
+def legacy_layout(df):
+    """
+    Return the task table in the layout the app used to hold it.
+
+    Text columns are Python strings (Trustee_Zone too, as the views used to
+    convert it) and numbers are 64-bit. Used as the "before" of the memory
+    report.
+    """
+    columns = {}
+    for col in df.columns:
+        values = df[col]
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            columns[col] = values.astype(object)
+        elif col == 'Trustee_Zone':
+            columns[col] = values.astype(str)
+        elif pd.api.types.is_integer_dtype(values.dtype):
+            columns[col] = values.astype('int64')
+    return df.assign(**columns)
+
+
+def _buffer(values):
+    """The array holding a column's data (the codes of a categorical), to spot columns shared between tables."""
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        return values.array.codes
+    return values.to_numpy()
+
+
+def column_bytes(df):
+    """Bytes held by each column, including the Python strings of object columns."""
+    return df.memory_usage(deep=True, index=False)
+
+
+def memory_report(df, base=None):
+    """
+    Bytes per task of each column, before and after the compact layout.
+
+    Parameters:
+    df (pandas.DataFrame): A session's task table
+    base (pandas.DataFrame, optional): The shared table sessions start from
+
+    Returns:
+    pandas.DataFrame: One row per column with its dtype, bytes per task in
+        the legacy layout and in the current one, and (when base is given)
+        whether the column is still shared with the base table
+    """
+    n_tasks = max(len(df), 1)
+    report = pd.DataFrame({
+        'Column': df.columns,
+        'Type': [str(dtype) for dtype in df.dtypes],
+        'Before (bytes/task)': (column_bytes(legacy_layout(df)) / n_tasks).round(1).to_numpy(),
+        'After (bytes/task)': (column_bytes(df) / n_tasks).round(1).to_numpy(),
+    })
+    if base is not None:
+        report['Shared with base'] = [
+            col in base.columns and np.shares_memory(_buffer(df[col]), _buffer(base[col]))
+            for col in df.columns
+        ]
+    return report
+
+
+def total_bytes(tables):
+    """
+    Bytes held by several task tables, counting every shared column once.
+
+    Parameters:
+    tables (list): Task tables, e.g. the shared base and each session's table
+
+    Returns:
+    int: Total bytes of the distinct column buffers
+    """
+    counted = []
+    total = 0
+    for df in tables:
+        for col, nbytes in column_bytes(df).items():
+            data = _buffer(df[col])
+            if not any(np.shares_memory(data, other) for other in counted):
+                counted.append(data)
+                total += nbytes
+    return int(total)
+
@@ -0,0 +1,197 @@
+# resource_load.py
+import numpy as np
+import pandas as pd
+
+# Heatmap periods: label -> numpy datetime unit
+PERIODS = {'Day': 'D', 'Week': 'W', 'Month': 'M'}
+
+
+def _task_days(df):
+    """
+    Day numbers each task occupies, as half-open [first, end) datetime64[D] bounds.
+
+    A task occupies every day from its Start up to the day its Finish falls
+    on, not counting a Finish at midnight (the converter's Finish is Start
+    plus Duration days). Tasks shorter than a day still occupy their first
+    day.
+    """
+    start = df['Start'].to_numpy(dtype='datetime64[ns]')
+    finish = df['Finish'].to_numpy(dtype='datetime64[ns]')
+    first = start.astype('datetime64[D]')
+    end = finish.astype('datetime64[D]')
+    end = end + (finish > end.astype('datetime64[ns]')).astype('timedelta64[D]')
+    end = np.maximum(end, first + np.timedelta64(1, 'D'))
+    return first, end
+
+
+class ResourceLoad:
+    """
+    Daily load of every resource: how many tasks it is booked on each day.
+
+    Built with a sweep line over difference arrays. Each task adds one at
+    its resource's first day and subtracts one at the day after its last,
+    all in one np.bincount over (resource, day) cells, and a cumulative sum
+    along the days turns the differences into loads. This takes O(tasks +
+    resources x days) time, so 100k tasks over several years take well
+    under a second. Tasks with a missing Start or Finish are left out.
+
+    A resource is overallocated on a day when it has more tasks than crews
+    (see Scheduler for the crews of each resource).
+
+    Parameters:
+    df (pandas.DataFrame): The task table
+
+    Attributes:
+    resources (pandas.Index): Resource names, one row of load each
+    days (numpy.ndarray): datetime64[D] date of each column of load
+    load (numpy.ndarray): Tasks per resource (rows) and day (columns)
+    """
+
+    # Task table columns the load is built from
+    COLUMNS = ('Resource', 'Start', 'Finish')
+
+    def __init__(self, df):
+        first, end = _task_days(df)
+        codes, resources = pd.factorize(df['Resource'].astype(str))
+        dated = ~np.isnat(first) & ~np.isnat(end) & (codes >= 0)
+        self.resources = pd.Index(resources, name='Resource')
+        self._codes = codes
+        self._first = first
+        self._end = end
+
+        if not dated.any():
+            self.days = np.empty(0, dtype='datetime64[D]')
+            self.load = np.zeros((len(resources), 0), dtype='int32')
+            return
+
+        origin = first[dated].min()
+        n_days = int((end[dated].max() - origin).astype('int64'))
+        width = n_days + 1
+        rows = codes[dated].astype('int64') * width
+        cells = np.concatenate([rows + (first[dated] - origin).astype('int64'),
+                                rows + (end[dated] - origin).astype('int64')])
+        weights = np.concatenate([np.ones(dated.sum()), -np.ones(dated.sum())])
+        changes = np.bincount(cells, weights=weights, minlength=len(resources) * width)
+        load = np.cumsum(changes.reshape(len(resources), width), axis=1)[:, :n_days]
+
+        self.days = origin + np.arange(n_days).astype('timedelta64[D]')
+        self.load = load.astype('int32')
+
+    def capacity(self, capacities=None, default_capacity=1):
+        """
+        Crews of each resource, in the order of resources.
+
+        Parameters:
+        capacities (dict, optional): Crews per Resource, e.g. {'Delivery Team': 3}
+        default_capacity (int): Crews of resources missing from `capacities`
+
+        Returns:
+        numpy.ndarray: Crews per resource
+        """
+        capacities = capacities or {}
+        return np.array([max(1, int(capacities.get(name, default_capacity))) for name in self.resources],
+                        dtype='int32')
+
+    def overallocated(self, capacities=None, default_capacity=1):
+        """Boolean array, like load, of the days each resource has more tasks than crews."""
+        return self.load > self.capacity(capacities, default_capacity)[:, None]
+
+    def summary(self, capacities=None, default_capacity=1):
+        """
+        Load of each resource over the whole span.
+
+        Utilization is the share of crew-days booked between the resource's
+        first and last booked day.
+
+        Returns:
+        pandas.DataFrame: Crews, tasks, booked days, peak tasks on one day,
+            overallocated days and utilization % per resource, busiest first
+        """
+        crews = self.capacity(capacities, default_capacity)
+        booked = self.load > 0
+        span = np.ones(len(self.resources), dtype='int64')
+        if booked.shape[1]:
+            first = booked.argmax(axis=1)
+            last = booked.shape[1] - 1 - booked[:, ::-1].argmax(axis=1)
+            span = np.maximum(last - first + 1, 1)
+        tasks = np.bincount(self._codes[self._codes >= 0], minlength=len(self.resources))
+        summary = pd.DataFrame({
+            'Crews': crews,
+            'Tasks': tasks,
+            'Booked Days': booked.sum(axis=1),
+            'Peak Tasks': self.load.max(axis=1, initial=0),
+            'Overallocated Days': (self.load > crews[:, None]).sum(axis=1),
+            'Utilization %': np.round(100 * self.load.sum(axis=1) / (span * crews), 1)
+        }, index=self.resources)
+        return summary.sort_values(['Overallocated Days', 'Tasks'], ascending=False, kind='stable')
+
+    def overallocations(self, capacities=None, default_capacity=1):
+        """
+        Runs of consecutive overallocated days, one row per resource and run.
+
+        Returns:
+        pandas.DataFrame: Resource, From, To (last day), Days, Peak Tasks
+            and Crews, in order of From
+        """
+        crews = self.capacity(capacities, default_capacity)
+        over = self.load > crews[:, None]
+        padded = np.pad(over, ((0, 0), (1, 1))).astype('int8')
+        edges = np.diff(padded, axis=1)
+        run_rows, run_starts = np.nonzero(edges == 1)
+        _, run_ends = np.nonzero(edges == -1)
+        # Both are in row-major order, so the n-th start pairs with the n-th end.
+        # The peak of each run is one maximum.reduceat over the flattened load.
+        width = self.load.shape[1]
+        bounds = np.column_stack([run_rows * width + run_starts, run_rows * width + run_ends]).ravel()
+        flat = np.append(self.load.ravel(), 0)
+        peaks = np.maximum.reduceat(flat, bounds)[::2] if len(bounds) else np.empty(0, dtype='int32')
+        runs = pd.DataFrame({
+            'Resource': self.resources[run_rows],
+            'From': self.days[run_starts] if len(run_starts) else np.empty(0, dtype='datetime64[D]'),
+            'To': self.days[run_ends - 1] if len(run_ends) else np.empty(0, dtype='datetime64[D]'),
+            'Days': run_ends - run_starts,
+            'Peak Tasks': peaks,
+            'Crews': crews[run_rows]
+        })
+        return runs.sort_values(['From', 'Resource'], kind='stable', ignore_index=True)
+
+    def tasks_between(self, resource, first_day, last_day):
+        """
+        Row positions of a resource's tasks booked on any day from first_day to last_day.
+
+        Parameters:
+        resource (str): The resource
+        first_day (numpy.datetime64): First day
+        last_day (numpy.datetime64): Last day (inclusive)
+
+        Returns:
+        numpy.ndarray: Row positions in ascending order
+        """
+        code = self.resources.get_loc(resource)
+        first_day = np.datetime64(first_day, 'D')
+        last_day = np.datetime64(last_day, 'D')
+        return np.flatnonzero((self._codes == code) & (self._first <= last_day) & (self._end > first_day))
+
+    def binned(self, period='Week', capacities=None, default_capacity=1):
+        """
+        Peak load per crew of each resource in each period, for the heatmap.
+
+        Parameters:
+        period (str): 'Day', 'Week' or 'Month' (see PERIODS)
+
+        Returns:
+        tuple: (numpy.ndarray, numpy.ndarray, numpy.ndarray) datetime64[D]
+            first day of each period, peak tasks per resource and period, and
+            the same divided by the resource's crews (above 1 is overallocated)
+        """
+        if not len(self.days):
+            empty = np.zeros((len(self.resources), 0))
+            return self.days, empty.astype('int32'), empty
+        unit = PERIODS[period]
+        # numpy weeks start on Thursday (1970-01-01); shift them to start on Monday
+        shift = np.timedelta64(3 if unit == 'W' else 0, 'D')
+        periods = (self.days + shift).astype(f'datetime64[{unit}]')
+        starts = np.flatnonzero(np.concatenate([[True], periods[1:] != periods[:-1]]))
+        peak = np.maximum.reduceat(self.load, starts, axis=1)
+        crews = self.capacity(capacities, default_capacity)
+        return self.days[starts], peak, peak / crews[:, None]
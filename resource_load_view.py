@@ -0,0 +1,80 @@
+# resource_load_view.py
+import pandas as pd
+import streamlit as st
+
+from gantt_renderer import build_load_heatmap
+from resource_load import PERIODS, ResourceLoad
+from scheduler import DEFAULT_CAPACITY
+from task_state import derived, get_tasks
+
+
+def render():
+    """The Resource Load view: daily load, overallocations and the heatmap."""
+    # Daily load is computed once per version of the Resource, Start and Finish columns
+    load = derived('resource_load', ResourceLoad, columns=ResourceLoad.COLUMNS)
+    df = get_tasks()
+    
+    st.subheader("Resource Load")
+    st.write(
+        "Tasks booked per day for each resource. A resource is overallocated on the days "
+        "it has more tasks than crews."
+    )
+    
+    if not len(load.days):
+        st.write("No dated tasks to show")
+        return
+    
+    col1, col2 = st.columns([2, 1])
+    with col1:
+        crews = st.data_editor(
+            pd.DataFrame({'Resource': load.resources, 'Crews': DEFAULT_CAPACITY}),
+            column_config={
+                'Resource': st.column_config.TextColumn("Resource", disabled=True),
+                'Crews': st.column_config.NumberColumn("Crews", min_value=1, step=1)
+            },
+            hide_index=True,
+            key="load_crews"
+        )
+    with col2:
+        period = st.selectbox("Heatmap period", list(PERIODS), index=1)
+    capacities = dict(zip(crews['Resource'], crews['Crews'].fillna(DEFAULT_CAPACITY).astype(int)))
+    
+    summary = load.summary(capacities)
+    overallocations = load.overallocations(capacities)
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Overallocated Resources", f"{int((summary['Overallocated Days'] > 0).sum())} of {len(summary)}")
+    with col2:
+        st.metric("Overallocated Days", f"{int(summary['Overallocated Days'].sum())}")
+    with col3:
+        st.metric("Busiest Day", f"{int(summary['Peak Tasks'].max())} tasks")
+    
+    periods, peak, utilization = load.binned(period, capacities)
+    st.plotly_chart(build_load_heatmap(load.resources, periods, peak, utilization), use_container_width=True)
+    
+    st.write("#### Load by Resource")
+    st.dataframe(summary, use_container_width=True)
+    
+    st.write("#### Overallocated Periods")
+    if overallocations.empty:
+        st.success("No resource has more tasks than crews on any day.")
+        return
+    st.dataframe(overallocations, hide_index=True, use_container_width=True)
+    
+    # List the tasks booked in one overallocated period
+    choice = st.selectbox(
+        "Show the tasks of an overallocated period",
+        overallocations.index,
+        format_func=lambda i: (
+            f"{overallocations.at[i, 'Resource']}: {overallocations.at[i, 'From']:%Y-%m-%d} "
+            f"to {overallocations.at[i, 'To']:%Y-%m-%d} ({overallocations.at[i, 'Peak Tasks']} tasks)"
+        )
+    )
+    run = overallocations.loc[choice]
+    rows = load.tasks_between(run['Resource'], run['From'], run['To'])
+    st.dataframe(
+        df.iloc[rows][['Task_ID', 'Task', 'Category', 'Start', 'Finish', 'Completion_pct']],
+        hide_index=True,
+        use_container_width=True
+    )
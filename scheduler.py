@@ -0,0 +1,379 @@
+# scheduler.py
+import heapq
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from change_set import ChangeSet
+from dependency_graph import PREDECESSORS, graph_size, task_dependencies
+
+# Working days of the default calendar (numpy busday weekmask)
+DEFAULT_WEEKMASK = 'Mon Tue Wed Thu Fri'
+
+# Crews per resource when none is configured
+DEFAULT_CAPACITY = 1
+
+
+class Scheduler:
+    """
+    Resource-constrained list scheduler for the task table.
+
+    Each resource has a number of crews (its capacity) that work one task at
+    a time. Tasks are scheduled in working days of a calendar (numpy busday
+    weekmask and holidays): Duration counts working days and Finish is the
+    working day after the last one worked. The scheduler keeps a priority
+    queue of tasks whose predecessors are all scheduled, ordered by the day
+    they become ready and then by table order. It assigns each task to the
+    crew of its resource that frees up first, so n tasks take O(n log n).
+
+    Only floating tasks are moved. Fixed tasks (already dated or started)
+    keep their dates and hold up their successors, but do not occupy crews.
+
+    Parameters:
+    capacities (dict, optional): Crews per Resource, e.g. {'Delivery Team': 3}
+    default_capacity (int): Crews of resources missing from `capacities`
+    weekmask (str): Working days, e.g. 'Mon Tue Wed Thu Fri'
+    holidays (list, optional): Dates that are not worked
+    """
+
+    def __init__(self, capacities=None, default_capacity=DEFAULT_CAPACITY, weekmask=DEFAULT_WEEKMASK, holidays=None):
+        self.capacities = dict(capacities or {})
+        self.default_capacity = default_capacity
+        self.calendar = np.busdaycalendar(
+            weekmask=weekmask,
+            holidays=np.array(holidays or [], dtype='datetime64[D]')
+        )
+
+    def capacity(self, resource):
+        return max(1, int(self.capacities.get(resource, self.default_capacity)))
+
+    def schedule(self, df, floating=None, dependencies=None, start=None):
+        """
+        Return df with new Start and Finish dates for the floating tasks.
+
+        Parameters:
+        df (pandas.DataFrame): The task table
+        floating (numpy.ndarray, optional): Boolean mask of the tasks to
+            schedule (default: tasks not started yet, apart from Planning)
+        dependencies (tuple, optional): (predecessor, successor) position
+            arrays; positions past the rows are milestones, which take no
+            time and no crew (default: task_dependencies(df))
+        start (datetime.date, optional): First day floating tasks may start (default: today)
+
+        Returns:
+        pandas.DataFrame: The scheduled table; other columns are unchanged
+
+        Raises:
+        ValueError: If the dependencies of floating tasks form a cycle
+        """
+        tasks = len(df)
+        if floating is None:
+            floating = ((df['Completion_pct'] == 0) & (df['Category'] != 'Planning')).to_numpy()
+        floating = np.asarray(floating, dtype=bool)
+        if dependencies is None:
+            dependencies = task_dependencies(df)
+        preds, succs = (np.asarray(a, dtype='int64') for a in dependencies)
+        if not floating.any():
+            return df
+        # Milestones are scheduled like floating tasks, so they pass on the finish of what they wait for
+        n = graph_size(tasks, preds, succs)
+        floating = np.concatenate([floating, np.ones(n - tasks, dtype=bool)])
+
+        # Work in working-day numbers counted from the first working day
+        start = np.datetime64(start or date.today(), 'D')
+        fixed_start = df['Start'].to_numpy(dtype='datetime64[D]')
+        fixed_finish = df['Finish'].to_numpy(dtype='datetime64[D]')
+        dated = np.concatenate([[start], fixed_start[~np.isnat(fixed_start)]])
+        origin = np.busday_offset(dated.min(), 0, roll='forward', busdaycal=self.calendar)
+        release = np.busday_count(origin, start, busdaycal=self.calendar)
+
+        finish_day = np.zeros(n, dtype='int64')
+        known = np.flatnonzero(~floating[:tasks] & ~np.isnat(fixed_finish))
+        finish_day[known] = np.busday_count(origin, fixed_finish[known], busdaycal=self.calendar)
+        durations = np.ceil(pd.to_numeric(df['Duration'], errors='coerce').fillna(1).clip(lower=0).to_numpy())
+        durations = np.concatenate([durations, np.zeros(n - tasks)])
+
+        # Fixed predecessors only delay their successors; floating ones are waited for
+        ready = np.full(n, release, dtype='int64')
+        from_fixed = ~floating[preds] & floating[succs]
+        np.maximum.at(ready, succs[from_fixed], finish_day[preds[from_fixed]])
+        edges = floating[preds] & floating[succs]
+        preds, succs = preds[edges], succs[edges]
+        waiting = np.bincount(succs, minlength=n)
+        order = np.argsort(preds, kind='stable')
+        successors = succs[order].tolist()
+        first = np.concatenate([[0], np.cumsum(np.bincount(preds, minlength=n))]).tolist()
+
+        resources, resource_names = pd.factorize(df['Resource'].astype(str))
+        crews = [[0] * self.capacity(name) for name in resource_names]
+        resources = resources.tolist()
+        durations = durations.astype('int64').tolist()
+        ready = ready.tolist()
+        waiting = waiting.tolist()
+
+        queue = [(ready[i], i) for i in np.flatnonzero(floating & (np.asarray(waiting) == 0)).tolist()]
+        heapq.heapify(queue)
+        starts = {}
+        while queue:
+            day, i = heapq.heappop(queue)
+            if i < tasks:
+                free = crews[resources[i]]
+                begin = max(day, free[0])
+                end = begin + durations[i]
+                heapq.heapreplace(free, end)
+                starts[i] = begin
+            else:
+                end = day
+            finish_day[i] = end
+            for j in successors[first[i]:first[i + 1]]:
+                if end > ready[j]:
+                    ready[j] = end
+                waiting[j] -= 1
+                if waiting[j] == 0:
+                    heapq.heappush(queue, (ready[j], j))
+
+        stuck = int(floating[:tasks].sum()) - len(starts)
+        if stuck:
+            raise ValueError(f"{stuck} tasks are in a dependency cycle and cannot be scheduled")
+
+        positions = np.fromiter(starts.keys(), dtype='int64', count=len(starts))
+        begin = np.fromiter(starts.values(), dtype='int64', count=len(starts))
+        new_start = df['Start'].to_numpy(dtype='datetime64[ns]').copy()
+        new_finish = df['Finish'].to_numpy(dtype='datetime64[ns]').copy()
+        new_start[positions] = self._dates(origin, begin)
+        new_finish[positions] = self._dates(origin, finish_day[positions])
+        return df.assign(Start=new_start, Finish=new_finish)
+
+    def _dates(self, origin, days):
+        """Dates of working-day numbers counted from origin."""
+        return np.busday_offset(origin, days, roll='forward', busdaycal=self.calendar).astype('datetime64[ns]')
+
+    def finish(self, start, duration):
+        """
+        Finish of tasks that start on `start` and take `duration` working days.
+
+        As in schedule, a task starting on a day off starts work on the next
+        working day, and Finish is the working day after the last one worked.
+
+        Parameters:
+        start (numpy.ndarray): Start of each task as datetime64
+        duration (numpy.ndarray): Duration of each task in working days
+
+        Returns:
+        numpy.ndarray: Finish of each task as datetime64[ns] (NaT without a Start)
+        """
+        first = np.busday_offset(np.asarray(start, dtype='datetime64[D]'), 0, roll='forward', busdaycal=self.calendar)
+        days = np.ceil(np.clip(np.asarray(duration, dtype='float64'), 0, None)).astype('int64')
+        return self._dates(first, days)
+
+
+def resource_queues(df):
+    """
+    Dependencies between the consecutive tasks of each resource's queue.
+
+    Tasks of a resource are taken in order of Start. A task follows the one
+    before it when it starts at or after that one finishes, i.e. the same
+    crew works them one after another. Overlapping tasks are worked by
+    separate crews and do not wait for each other.
+
+    Parameters:
+    df (pandas.DataFrame): The task table
+
+    Returns:
+    tuple: (numpy.ndarray, numpy.ndarray) Row positions of the predecessor
+        and of the successor of each dependency
+    """
+    resources, _ = pd.factorize(df['Resource'].astype(str))
+    return _queue_pairs(resources, df['Start'].to_numpy(dtype='datetime64[ns]'), df['Finish'].to_numpy(dtype='datetime64[ns]'))
+
+
+def _queue_pairs(resources, start, finish):
+    """resource_queues from resource codes and datetime64[ns] Start and Finish arrays."""
+    dated = np.flatnonzero(~np.isnat(start) & ~np.isnat(finish))
+    order = dated[np.lexsort((dated, start[dated], resources[dated]))]
+    before, after = order[:-1], order[1:]
+    queued = (resources[before] == resources[after]) & (start[after] >= finish[before])
+    return before[queued].astype('int64'), after[queued].astype('int64')
+
+
+class Rescheduler:
+    """
+    Incremental rescheduler that pushes back the tasks after a slipped task.
+
+    The graph holds the task dependencies (see task_dependencies) and each
+    resource's queue (see resource_queues). When some tasks move, only the
+    tasks reachable from them are visited: a worklist ordered by start date
+    takes the next moved task and pushes each successor that would now
+    start before the task finishes, keeping the successor's length. Slack
+    absorbs a slip, so the walk stops where it runs out, and a one-day slip
+    touches only the tasks it actually delays.
+
+    Only the task dependencies are built with the rescheduler, so editing
+    dates keeps it. The resource queues, and which dependencies the plan
+    meets, depend on the dates and are worked out from the planned dates
+    each time tasks are shifted (see graph).
+
+    Dependencies the plan already breaks (a task that starts before its
+    predecessor finishes, e.g. a Delivery dated before Planning ends) are
+    not enforced. Tasks are never pulled earlier; use Scheduler for a full
+    reschedule.
+
+    Milestones in the dependencies (see infer_dependencies) are dated at the
+    latest planned Finish of the tasks they wait for, and pass pushes on.
+
+    Parameters:
+    df (pandas.DataFrame): The task table, indexed by task ID
+    dependencies (tuple, optional): (predecessor, successor) positions;
+        positions past the rows are milestones (default: task_dependencies(df))
+    """
+
+    # Task table columns the dependencies are built from; dates are read when tasks are shifted
+    COLUMNS = ('Task_ID', 'Task', 'Category', PREDECESSORS, 'Resource')
+
+    def __init__(self, df, dependencies=None):
+        preds, succs = task_dependencies(df) if dependencies is None else dependencies
+        self.index = df.index
+        self._preds = np.asarray(preds, dtype='int64')
+        self._succs = np.asarray(succs, dtype='int64')
+        self._nodes = graph_size(len(df), self._preds, self._succs)
+        self._resources, _ = pd.factorize(df['Resource'].astype(str))
+
+    def graph(self, start, finish):
+        """
+        Successors of each task under the planned dates.
+
+        Parameters:
+        start (numpy.ndarray): Planned Start of every task as datetime64[ns]
+        finish (numpy.ndarray): Planned Finish of every task as datetime64[ns]
+
+        Returns:
+        tuple: (list, list, numpy.ndarray) Positions of the successors,
+            grouped by predecessor, the offset of each node's group, and the
+            planned dates of the milestones, for propagate
+        """
+        start = np.asarray(start, dtype='datetime64[ns]')
+        finish = np.asarray(finish, dtype='datetime64[ns]')
+        queue_preds, queue_succs = _queue_pairs(self._resources, start, finish)
+
+        # Milestones are due when the last task they wait for finishes (NaT sorts first)
+        tasks = len(self.index)
+        into = (self._succs >= tasks) & (self._preds < tasks)
+        milestones = np.full(self._nodes - tasks, np.datetime64('NaT'), dtype='datetime64[ns]').view('int64')
+        np.maximum.at(milestones, self._succs[into] - tasks, finish.view('int64')[self._preds[into]])
+        start = np.concatenate([start, milestones.view('datetime64[ns]')])
+        finish = np.concatenate([finish, milestones.view('datetime64[ns]')])
+
+        preds = np.concatenate([self._preds, queue_preds]).astype('int64')
+        succs = np.concatenate([self._succs, queue_succs]).astype('int64')
+
+        # Keep the dependencies the planned dates meet
+        met = (start[succs] >= finish[preds]) & ~np.isnat(start[succs]) & ~np.isnat(finish[preds])
+        preds, succs = preds[met], succs[met]
+
+        order = np.argsort(preds, kind='stable')
+        first = np.concatenate([[0], np.cumsum(np.bincount(preds, minlength=self._nodes))])
+        return succs[order].tolist(), first.tolist(), milestones.view('datetime64[ns]')
+
+    def propagate(self, graph, start, finish, changed):
+        """
+        Push back the successors of the changed tasks.
+
+        Parameters:
+        graph (tuple): Successor lists from graph, for the dates before the change
+        start (numpy.ndarray): Start of every task as datetime64[ns], with the changed tasks' new dates
+        finish (numpy.ndarray): Finish of every task as datetime64[ns], likewise
+        changed (array-like): Row positions of the changed tasks
+
+        Returns:
+        tuple: (numpy.ndarray, numpy.ndarray, numpy.ndarray) New Start and
+            Finish of every task, and the sorted row positions of the pushed tasks
+
+        Raises:
+        ValueError: If the pushes go round a dependency cycle
+        """
+        successors, first, milestones = graph
+        tasks = len(start)
+        start = np.concatenate([np.asarray(start, dtype='datetime64[ns]'), milestones]).view('int64')
+        finish = np.concatenate([np.asarray(finish, dtype='datetime64[ns]'), milestones]).view('int64')
+        queue = [(int(start[i]), int(i)) for i in changed]
+        heapq.heapify(queue)
+        pushed = set()
+        visits = 0
+        while queue:
+            day, i = heapq.heappop(queue)
+            if day != start[i]:
+                # Pushed again since it was queued
+                continue
+            visits += 1
+            if visits > len(start) + len(successors):
+                raise ValueError("The changed tasks are in a dependency cycle")
+            end = int(finish[i])
+            for j in successors[first[i]:first[i + 1]]:
+                if end > start[j]:
+                    finish[j] += end - start[j]
+                    start[j] = end
+                    pushed.add(j)
+                    heapq.heappush(queue, (end, j))
+
+        pushed = np.array(sorted(pushed), dtype='int64')
+        return start[:tasks].view('datetime64[ns]'), finish[:tasks].view('datetime64[ns]'), pushed[pushed < tasks]
+
+    def shift(self, df, changes, scheduler=None):
+        """
+        Add the pushed tasks to editor changes that move or resize tasks.
+
+        Only the cells the editor changed count (see ChangeSet.cells). A row
+        whose Start was edited but not its Finish keeps its bar length. A row
+        whose Duration was edited but not its Finish gets the Finish of that
+        many working days from its Start, in the scheduler's calendar.
+
+        Parameters:
+        df (pandas.DataFrame): The task table the rescheduler was built from, before the changes
+        changes (ChangeSet): The editor changes
+        scheduler (Scheduler, optional): Calendar for edited durations (default: Scheduler())
+
+        Returns:
+        tuple: (ChangeSet, pandas.Index) The changes with the new dates of the
+            pushed tasks, and the IDs of the pushed tasks
+        """
+        in_table = changes.edited.index.isin(df.index)
+        edited, cells = changes.edited[in_table], changes.cells[in_table]
+
+        def changed_cells(col):
+            return cells[col].to_numpy(dtype=bool) if col in cells.columns else np.zeros(len(cells), dtype=bool)
+
+        moved, resized, refinished = changed_cells('Start'), changed_cells('Duration'), changed_cells('Finish')
+        if not (moved | resized | refinished).any():
+            return changes, df.index[:0]
+
+        positions = df.index.get_indexer(edited.index)
+        planned_start = df['Start'].to_numpy(dtype='datetime64[ns]')
+        planned_finish = df['Finish'].to_numpy(dtype='datetime64[ns]')
+        start, finish = planned_start.copy(), planned_finish.copy()
+        if moved.any():
+            start[positions[moved]] = edited['Start'].to_numpy(dtype='datetime64[ns]')[moved]
+        if refinished.any():
+            finish[positions[refinished]] = edited['Finish'].to_numpy(dtype='datetime64[ns]')[refinished]
+        kept = positions[moved & ~resized & ~refinished]
+        finish[kept] = start[kept] + (planned_finish[kept] - planned_start[kept])
+        rescheduled = resized & ~refinished
+        if rescheduled.any():
+            days = pd.to_numeric(edited['Duration'], errors='coerce').fillna(1).to_numpy()[rescheduled]
+            finish[positions[rescheduled]] = (scheduler or Scheduler()).finish(start[positions[rescheduled]], days)
+
+        graph = self.graph(planned_start, planned_finish)
+        changed = positions[moved | resized | refinished]
+        new_start, new_finish, pushed = self.propagate(graph, start, finish, changed)
+        pushed = pushed[~df.index[pushed].isin(changes.deleted)]
+
+        # Edited rows first, then the pushed rows that were not edited
+        others = df.index[pushed].difference(edited.index)
+        updated = pd.concat([edited, df.loc[others, list(edited.columns)]])
+        dates = df.index.get_indexer(updated.index)
+        updated = updated.assign(Start=new_start[dates], Finish=new_finish[dates])
+        updated_cells = pd.concat([cells, pd.DataFrame(False, index=others, columns=cells.columns)])
+        updated_cells = updated_cells.reindex(columns=updated.columns, fill_value=False)
+        updated_cells['Start'] |= new_start[dates] != planned_start[dates]
+        updated_cells['Finish'] |= new_finish[dates] != planned_finish[dates]
+        return ChangeSet(updated, changes.added, changes.deleted, updated_cells), df.index[pushed]
@@ -0,0 +1,100 @@
+# session_data.py
+import os
+from datetime import datetime
+
+import pandas as pd
+import streamlit as st
+
+from dependency_graph import CriticalPath
+from filter_index import FilterIndex
+from interval_index import TaskIntervals
+from scheduler import Rescheduler
+from task_lookup import TaskLookup
+from task_repository import get_task_repository
+from task_schema import apply_task_schema
+from task_state import derived, set_tasks, sync_tasks, tasks_version
+from task_store import with_row_keys
+from timeline_levels import TimelineLevels
+
+# Sessions share versioned snapshots of one task table. Copy-on-write lets the
+# frames the views derive from a snapshot share its columns until they change them.
+pd.set_option('mode.copy_on_write', True)
+
+# Where the task table is persisted; a '.csv' path keeps the original single-file format
+TASK_STORE_PATH = os.environ.get('GANTT_TASK_STORE', 'gantt_data.db')
+repository = get_task_repository(TASK_STORE_PATH, import_csv='gantt_data.csv')
+
+# Example tasks: (task, resource, start day, duration, finish day, completion %, zone, category, notes)
+DEFAULT_TASKS = [
+    ('Planning & Preparation', 'Project Manager', 0, 2, 2, 100, 0, 'Planning', ''),
+    ('Data Closet Assessment', 'Technical Team', 1, 3, 4, 80, 0, 'Planning', ''),
+    ('Team Assignments', 'Project Manager', 2, 1, 3, 50, 0, 'Planning', ''),
+    ('Zone 1 - School A: Delivery', 'Delivery Team', 3, 1, 4, 0, 1, 'Delivery', ''),
+    ('Zone 1 - School A: Installation', 'Installation Team', 4, 1, 5, 0, 1, 'Installation', ''),
+    ('Zone 1 - School B: Delivery', 'Delivery Team', 5, 1, 6, 0, 1, 'Delivery', ''),
+    ('Zone 1 - School B: Installation', 'Installation Team', 6, 1, 7, 0, 1, 'Installation', ''),
+    ('Zone 2 - School C: Delivery', 'Delivery Team', 7, 1, 8, 0, 2, 'Delivery', ''),
+    ('Zone 2 - School C: Installation', 'Installation Team', 8, 1, 9, 0, 2, 'Installation', ''),
+    ('School with Issues - Arch St. PS', 'Specialized Team', 9, 2, 11, 30, 1, 'Issue Resolution',
+     'Wall mounted rack issue'),
+    ('School for Revisit - Dunlop PS', 'Maintenance Team', 10, 1, 11, 0, 3, 'Revisit', 'Faulty UPS replacement'),
+    ('Final Documentation', 'Project Manager', 15, 3, 18, 0, 0, 'Closeout', ''),
+]
+
+
+def default_tasks():
+    """Example tasks used when there is no stored task table yet, starting now."""
+    df = pd.DataFrame(DEFAULT_TASKS, columns=[
+        'Task', 'Resource', 'Start', 'Duration', 'Finish', 'Completion_pct', 'Trustee_Zone', 'Category', 'Notes'
+    ])
+    now = pd.Timestamp(datetime.now())
+    df['Start'] = now + pd.to_timedelta(df['Start'], unit='D')
+    df['Finish'] = now + pd.to_timedelta(df['Finish'], unit='D')
+    return apply_task_schema(with_row_keys(df))
+
+
+def load_tasks():
+    """Point the session at the latest version of the shared task table."""
+    try:
+        repository.initialize(default_tasks)
+        if sync_tasks(repository):
+            st.toast(f"The task data was changed by another user; now showing version {tasks_version()}.")
+    except Exception:
+        # Fall back to default data if the store can't be read
+        if 'tasks_data' not in st.session_state:
+            set_tasks(default_tasks())
+
+
+# Values derived from the session's tasks, built on first use by the views
+# that need them and kept until the task table changes (see derived)
+
+def critical_path():
+    """Critical path analysis of the session's tasks, shared by the views."""
+    return derived('critical_path', CriticalPath, columns=CriticalPath.COLUMNS)
+
+
+def rescheduler():
+    """Incremental rescheduler over the session's tasks."""
+    return derived('rescheduler', Rescheduler, columns=Rescheduler.COLUMNS)
+
+
+def task_intervals():
+    """Interval index over the session's tasks, shared by the views."""
+    return derived('task_intervals', TaskIntervals.from_frame, columns=TaskIntervals.COLUMNS)
+
+
+def filter_index():
+    """Filter index over the session's tasks, shared by the views."""
+    return derived('filter_index', lambda tasks: FilterIndex(tasks, task_intervals()), columns=FilterIndex.COLUMNS)
+
+
+def timeline_levels():
+    """Zone > School > Task summary index over the session's tasks."""
+    return derived(
+        'timeline_levels', lambda tasks: TimelineLevels(tasks, filter_index()), columns=TimelineLevels.COLUMNS
+    )
+
+
+def task_lookup():
+    """Task ID and name lookup over the session's tasks."""
+    return derived('task_lookup', TaskLookup, columns=TaskLookup.COLUMNS)
@@ -0,0 +1,223 @@
+# summary_stats.py
+import heapq
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+# Completion status buckets, in the order of the summary metrics
+STATUSES = ['Completed', 'In Progress', 'Not Started']
+
+
+def _status_codes(completion):
+    """0 = completed, 1 = in progress, 2 = not started, 3 = anything else (e.g. missing)."""
+    codes = np.full(len(completion), 3, dtype=np.int8)
+    codes[completion == 0] = 2
+    codes[(completion > 0) & (completion < 100)] = 1
+    codes[completion == 100] = 0
+    return codes
+
+
+def _value_counts(values):
+    """Counter of the values of an array (one vectorized np.unique pass)."""
+    values, counts = np.unique(values, return_counts=True)
+    return Counter(dict(zip(values.tolist(), counts.tolist())))
+
+
+def _labelled_counts(codes, labels):
+    """Counter of the labels of non-missing codes."""
+    counts = np.bincount(codes[codes >= 0], minlength=len(labels))
+    tally = Counter()
+    for label, count in zip(labels, counts.tolist()):
+        if count:
+            tally[label] += count
+    return tally
+
+
+def _tally(df):
+    """
+    Count the rows of a task table by every summary key.
+
+    Returns:
+    dict: Counters of completion status, category, zone label,
+        (start month, category) pairs, Start values and Finish values
+    """
+    completion = pd.to_numeric(df['Completion_pct'], errors='coerce').to_numpy(dtype=float)
+    status = np.bincount(_status_codes(completion), minlength=4)
+
+    category_codes, categories = pd.factorize(df['Category'])
+    categories = np.asarray(categories, dtype=object)
+
+    zone_codes, zones = pd.factorize(df['Trustee_Zone'])
+    zone_labels = np.asarray(pd.Index(zones, dtype=object).astype(str), dtype=object)
+
+    start = df['Start'].to_numpy(dtype='datetime64[ns]')
+    finish = df['Finish'].to_numpy(dtype='datetime64[ns]')
+
+    # Months as period codes (months since 1970-01) paired with the category code
+    dated = ~np.isnat(start) & (category_codes >= 0)
+    months = start[dated].astype('datetime64[M]').astype(np.int64)
+    pairs = months * len(categories) + category_codes[dated]
+    monthly = Counter()
+    for pair, count in _value_counts(pairs).items():
+        month, code = divmod(pair, len(categories))
+        monthly[(month, categories[code])] = count
+
+    return {
+        '_status': Counter({name: n for name, n in zip(STATUSES, status[:3].tolist()) if n}),
+        '_categories': _labelled_counts(category_codes, categories),
+        '_zones': _labelled_counts(zone_codes, zone_labels),
+        '_monthly': monthly,
+        '_starts': _value_counts(start[~np.isnat(start)].view(np.int64)),
+        '_finishes': _value_counts(finish[~np.isnat(finish)].view(np.int64)),
+    }
+
+
+def _sorted_counts(counter, exclude=()):
+    """Counter as a Series, largest first."""
+    counts = pd.Series({key: n for key, n in counter.items() if key not in exclude}, dtype='int64')
+    return counts.sort_values(ascending=False, kind='stable')
+
+
+class ProjectSummary:
+    """
+    Everything the Project Summary view shows, kept as running aggregates.
+
+    The first build counts the whole table in one vectorized pass: completion
+    status, category, zone label and start month are turned into codes and
+    counted, with months as datetime64[M] period codes instead of formatted
+    strings. After that, added, removed or edited rows are applied as deltas
+    (see apply_change), so a change costs O(changed rows). The earliest Start
+    and latest Finish come from heaps whose stale entries are dropped lazily.
+    The task table is only read, never modified.
+
+    Parameters:
+    df (pandas.DataFrame): The task table
+
+    Attributes:
+    total (int): Number of tasks
+    """
+
+    def __init__(self, df):
+        self.total = 0
+        self._status = Counter()
+        self._categories = Counter()
+        self._zones = Counter()
+        self._monthly = Counter()
+        self._starts = Counter()
+        self._finishes = Counter()
+        # Min-heap of Start values and of negated Finish values
+        self._start_heap = []
+        self._finish_heap = []
+        # Month chart order follows the categorical's categories when there is one
+        self._category_order = None
+        self.add(df)
+
+    def add(self, rows):
+        """Count new rows."""
+        # New categories are appended to the table's categorical, so the
+        # newest rows carry the current category order
+        category = rows['Category'] if 'Category' in rows.columns else None
+        if category is not None and isinstance(category.dtype, pd.CategoricalDtype):
+            self._category_order = list(category.cat.categories)
+        self._apply(rows, 1)
+
+    def remove(self, rows):
+        """Stop counting rows that were deleted (pass their values before deletion)."""
+        self._apply(rows, -1)
+
+    def apply_change(self, added=None, removed=None):
+        """
+        Update the aggregates for a change to the table.
+
+        An edit is the old version of the rows in `removed` and the new
+        version in `added`.
+
+        Parameters:
+        added (pandas.DataFrame, optional): Rows added to the table
+        removed (pandas.DataFrame, optional): Rows removed from the table
+        """
+        if removed is not None and len(removed):
+            self.remove(removed)
+        if added is not None and len(added):
+            self.add(added)
+
+    def _apply(self, rows, sign):
+        self.total += sign * len(rows)
+        for name, tally in _tally(rows).items():
+            counter = getattr(self, name)
+            new_keys = []
+            for key, count in tally.items():
+                if key not in counter:
+                    new_keys.append(key)
+                counter[key] += sign * count
+                if counter[key] <= 0:
+                    del counter[key]
+            if sign > 0 and name == '_starts':
+                self._push(self._start_heap, new_keys)
+            elif sign > 0 and name == '_finishes':
+                self._push(self._finish_heap, [-value for value in new_keys])
+
+    @staticmethod
+    def _push(heap, values):
+        if len(values) > len(heap):
+            heap.extend(values)
+            heapq.heapify(heap)
+        else:
+            for value in values:
+                heapq.heappush(heap, value)
+
+    @staticmethod
+    def _peek(heap, live, negated=False):
+        """Top of a heap, dropping values that are no longer in the table."""
+        while heap and (-heap[0] if negated else heap[0]) not in live:
+            heapq.heappop(heap)
+        if not heap:
+            return pd.NaT
+        return pd.Timestamp(-heap[0] if negated else heap[0])
+
+    @property
+    def status_counts(self):
+        """Tasks per entry of STATUSES."""
+        return {status: self._status.get(status, 0) for status in STATUSES}
+
+    @property
+    def category_counts(self):
+        """Tasks per category, largest first."""
+        return _sorted_counts(self._categories)
+
+    @property
+    def zone_counts(self):
+        """Tasks per Trustee_Zone label other than '0', largest first."""
+        return _sorted_counts(self._zones, exclude=('0',))
+
+    @property
+    def earliest_start(self):
+        """First Start (NaT if there is none)."""
+        return self._peek(self._start_heap, self._starts)
+
+    @property
+    def latest_finish(self):
+        """Last Finish (NaT if there is none)."""
+        return self._peek(self._finish_heap, self._finishes, negated=True)
+
+    @property
+    def monthly(self):
+        """Month ('YYYY-MM'), Category and Count of tasks by start month, like groupby(['Month', 'Category'])."""
+        if not self._monthly:
+            return pd.DataFrame({'Month': [], 'Category': [], 'Count': []})
+
+        order = self._category_order or []
+        rank = {category: i for i, category in enumerate(order)}
+        # Categories missing from the categorical's order sort by value after it
+        keys = sorted(self._monthly, key=lambda key: (key[0], rank.get(key[1], len(order)), str(key[1])))
+        months = np.array([month for month, _ in keys], dtype='int64').astype('datetime64[M]')
+        return pd.DataFrame({
+            'Month': np.datetime_as_string(months, unit='M').astype(object),
+            'Category': [category for _, category in keys],
+            'Count': [self._monthly[key] for key in keys]
+        })
+
+    def share(self, count):
+        """Percentage of all tasks, rounded to one decimal (0 for an empty table)."""
+        return round(count / self.total * 100, 1) if self.total else 0
@@ -0,0 +1,128 @@
+# summary_view.py
+from datetime import datetime, timedelta
+
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from interval_index import day_window
+from session_data import task_intervals
+from summary_stats import ProjectSummary
+from task_state import derived
+
+
+def render():
+    """The Project Summary view: progress, distribution and timeline figures."""
+    # All summary figures are computed together, once per version of the table
+    summary = derived('project_summary', ProjectSummary)
+    
+    st.subheader("Project Summary")
+    
+    # Overall progress
+    total_tasks = summary.total
+    completed_tasks = summary.status_counts['Completed']
+    in_progress_tasks = summary.status_counts['In Progress']
+    not_started_tasks = summary.status_counts['Not Started']
+    
+    percentage = summary.share(completed_tasks)
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("Total Tasks", f"{total_tasks}")
+    with col2:
+        st.metric("Completed", f"{completed_tasks}", f"{percentage}%")
+    with col3:
+        st.metric("In Progress", f"{in_progress_tasks}", f"{summary.share(in_progress_tasks)}%")
+    with col4:
+        st.metric("Not Started", f"{not_started_tasks}", f"{summary.share(not_started_tasks)}%")
+    
+    # Categories and zones analysis
+    st.subheader("Task Distribution")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.write("#### By Category")
+        categories = summary.category_counts.rename_axis('Category').reset_index(name='Count')
+        
+        # Create a pie chart for categories
+        fig = px.pie(
+            categories, 
+            values='Count', 
+            names='Category',
+            color='Category',
+            color_discrete_map={
+                'Planning': 'rgb(46, 137, 205)',
+                'Delivery': 'rgb(114, 44, 121)',
+                'Installation': 'rgb(198, 47, 105)',
+                'Issue Resolution': 'rgb(58, 149, 136)',
+                'Revisit': 'rgb(214, 39, 40)',
+                'Closeout': 'rgb(31, 119, 180)'
+            },
+            title="Tasks by Category"
+        )
+        st.plotly_chart(fig, use_container_width=True)
+    
+    with col2:
+        st.write("#### By Trustee Zone")
+        zones = summary.zone_counts.rename_axis('Zone').reset_index(name='Count')
+        
+        if not zones.empty:
+            # Create a bar chart for zones
+            fig = px.bar(
+                zones, 
+                x='Zone', 
+                y='Count', 
+                title="Tasks by Trustee Zone",
+                color_discrete_sequence=['rgb(58, 149, 136)']
+            )
+            st.plotly_chart(fig, use_container_width=True)
+        else:
+            st.write("No zone data available")
+    
+    # Timeline analysis
+    st.subheader("Project Timeline")
+    if summary.total and pd.notna(summary.earliest_start) and pd.notna(summary.latest_finish):
+        earliest_date = summary.earliest_start
+        latest_date = summary.latest_finish
+        
+        project_duration = (latest_date - earliest_date).days
+        
+        today = datetime.now().date()
+        active_next_30_days = task_intervals().count(*day_window(today, today + timedelta(days=30)))
+        
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Project Start", earliest_date.strftime('%Y-%m-%d'))
+        with col2:
+            st.metric("Project End", latest_date.strftime('%Y-%m-%d'))
+        with col3:
+            st.metric("Duration", f"{project_duration} days")
+        with col4:
+            st.metric("Active Next 30 Days", f"{active_next_30_days}")
+            
+        # Monthly progress chart
+        st.subheader("Monthly Task Distribution")
+        
+        # Tasks by start month and category
+        monthly_tasks = summary.monthly
+        
+        # Create a grouped bar chart
+        fig = px.bar(
+            monthly_tasks,
+            x='Month',
+            y='Count',
+            color='Category',
+            color_discrete_map={
+                'Planning': 'rgb(46, 137, 205)',
+                'Delivery': 'rgb(114, 44, 121)',
+                'Installation': 'rgb(198, 47, 105)',
+                'Issue Resolution': 'rgb(58, 149, 136)',
+                'Revisit': 'rgb(214, 39, 40)',
+                'Closeout': 'rgb(31, 119, 180)'
+            },
+            title="Tasks by Month and Category"
+        )
+        
+        st.plotly_chart(fig, use_container_width=True)
@@ -0,0 +1,75 @@
+# task_lookup.py
+import numpy as np
+
+# Most tasks a picker lists at once; searching narrows down the rest
+PICKER_LIMIT = 50
+
+
+class TaskLookup:
+    """
+    Find tasks by ID or by name without scanning the table.
+
+    Task IDs are the table's index, so ID -> row position goes through the
+    index's hash table, which pandas builds once per version of the table.
+    Task names are lower-cased once so pickers can search them case-insensitively
+    and list only the first matches. The matches of the last search are
+    kept: while the user keeps typing, each search text contains the one
+    before it, so only the previous matches need to be checked again.
+
+    Parameters:
+    df (pandas.DataFrame): The task table, indexed by task ID
+    """
+
+    # Task table columns the lookup is built from
+    COLUMNS = ('Task_ID', 'Task')
+
+    def __init__(self, df):
+        self.ids = df.index
+        self.names = df['Task'].astype(str).str.lower().to_numpy(dtype=object)
+        # (text, positions) of the last name search; every name contains ''
+        self._last = ('', np.arange(len(self.names)))
+
+    def __len__(self):
+        return len(self.ids)
+
+    def position(self, task_id):
+        """Row position of a task ID (KeyError if there is no such task)."""
+        return self.ids.get_loc(task_id)
+
+    def positions(self, task_ids):
+        """Row positions of the task IDs that exist, in the given order."""
+        positions = self.ids.get_indexer(task_ids)
+        return positions[positions >= 0]
+
+    def search(self, text, limit=PICKER_LIMIT):
+        """
+        Find tasks whose name contains `text`, or whose ID is `text`.
+
+        Parameters:
+        text (str): Search text (case-insensitive); empty matches every task
+        limit (int): Most positions to return
+
+        Returns:
+        tuple: (numpy.ndarray, int) Positions of the first matches in table
+            order (an exact ID match first) and the number of matches
+        """
+        text = text.strip().lower()
+        if not text:
+            return np.arange(min(limit, len(self.ids))), len(self.ids)
+
+        found = self._names_containing(text)
+        if text.lstrip('#').isdigit():
+            by_id = self.positions([int(text.lstrip('#'))])
+            found = np.concatenate([by_id, found[~np.isin(found, by_id)]])
+        return found[:limit], len(found)
+
+    def _names_containing(self, text):
+        """Positions of the names containing text, narrowed from the last search when it contains that one."""
+        last_text, last_found = self._last
+        if text == last_text:
+            return last_found
+        candidates = last_found if last_text in text else np.arange(len(self.names))
+        names = self.names[candidates]
+        found = candidates[np.fromiter((text in name for name in names), dtype=bool, count=len(names))]
+        self._last = (text, found)
+        return found
@@ -0,0 +1,54 @@
+# task_pages.py
+import numpy as np
+
+# Rows per page offered by the data editor
+PAGE_SIZES = [50, 100, 250, 500]
+
+# Columns the data editor can sort by
+SORT_COLUMNS = ['Task', 'Start', 'Finish', 'Completion_pct', 'Category', 'Trustee_Zone', 'Resource']
+
+
+def sort_order(df, column):
+    """
+    Row positions of df ordered by one column, missing values last.
+
+    The sort is stable, so rows with equal values keep their table order.
+    Columns that mix numbers and text are sorted by their text.
+
+    Parameters:
+    df (pandas.DataFrame): The task table
+    column (str): Column to sort by
+
+    Returns:
+    numpy.ndarray: Row positions in sorted order
+    """
+    values = df[column].reset_index(drop=True)
+    try:
+        ordered = values.sort_values(kind='stable', na_position='last')
+    except TypeError:
+        ordered = values.astype(str).where(values.notna()).sort_values(kind='stable', na_position='last')
+    return ordered.index.to_numpy()
+
+
+def select_page(mask, order, page, page_size, descending=False):
+    """
+    Pick one page of the rows selected by a filter mask.
+
+    Parameters:
+    mask (numpy.ndarray): Boolean mask of the rows that pass the filters
+    order (numpy.ndarray, optional): Row positions in sort order (None keeps table order)
+    page (int): Page number, starting at 1
+    page_size (int): Rows per page
+    descending (bool): Reverse the sort order
+
+    Returns:
+    tuple: (numpy.ndarray, int, int) Row positions of the page, number of
+        matching rows and number of pages
+    """
+    positions = np.flatnonzero(mask) if order is None else order[mask[order]]
+    if descending:
+        positions = positions[::-1]
+    n_rows = len(positions)
+    n_pages = max(1, -(-n_rows // page_size))
+    page = min(max(page, 1), n_pages)
+    return positions[(page - 1) * page_size:page * page_size], n_rows, n_pages
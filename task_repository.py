@@ -0,0 +1,188 @@
+# task_repository.py
+import os
+import threading
+from collections import namedtuple
+
+import pandas as pd
+
+from task_schema import apply_task_schema, concat_tasks, drop_rows
+from task_store import TASK_ID, next_row_key, open_task_store
+
+# One write to the repository: the version it was applied to, the new
+# version and table, and the rows it added and removed (an edit is both).
+# columns lists the columns edited in place, or is None when rows were
+# added or deleted.
+Commit = namedtuple('Commit', ['base_version', 'version', 'tasks', 'added', 'removed', 'columns'])
+
+
+class TaskRepository:
+    """
+    Process-wide home of the task table, shared by every session.
+
+    The repository holds one typed snapshot of the table per version. A
+    snapshot is never modified: every write builds the next version from
+    copies of the columns it changes (see update_tasks), so unchanged
+    columns stay shared and sessions still reading an older version are
+    unaffected, whether or not pandas' copy-on-write mode is on. The table is parsed from the
+    store once per process, so N sessions cost one copy of the data and
+    one parse.
+
+    Writes are serialized by a lock: each one is applied to the latest
+    version and written to the store before the next starts. Task IDs for
+    new rows are assigned inside the lock, so two sessions adding tasks at
+    the same time never get the same ID. Changes made to the store by
+    another process are picked up the next time the version is read.
+
+    Parameters:
+    store (TaskStore): The task store the snapshots are loaded from and written to
+    """
+
+    def __init__(self, store):
+        self.store = store
+        self._lock = threading.RLock()
+        self._version = 0
+        self._tasks = None
+        self._signature = None
+
+    def _current(self):
+        """Latest (version, table), reloading it if the store changed on disk. Call with the lock held."""
+        signature = self.store.signature()
+        if self._tasks is None or signature != self._signature:
+            self._tasks = apply_task_schema(self.store.load())
+            self._signature = signature
+            self._version += 1
+        return self._version, self._tasks
+
+    def initialize(self, default_tasks):
+        """
+        Store default tasks if the store is still empty.
+
+        Parameters:
+        default_tasks (callable): Returns the table to start from
+        """
+        with self._lock:
+            if not self.store.exists():
+                self.replace_all(default_tasks())
+
+    def version(self):
+        """Return the latest version number."""
+        with self._lock:
+            return self._current()[0]
+
+    def snapshot(self):
+        """
+        Return the latest version of the task table.
+
+        Returns:
+        tuple: (int, pandas.DataFrame) Version number and the typed table,
+            which must not be modified
+        """
+        with self._lock:
+            return self._current()
+
+    def _commit(self, base_version, tasks, added=None, removed=None, columns=None):
+        """Publish tasks as the next version. Call with the lock held, after writing the store."""
+        self._tasks = tasks
+        self._signature = self.store.signature()
+        self._version += 1
+        return Commit(base_version, self._version, tasks, added, removed, columns)
+
+    def replace_all(self, df):
+        """
+        Replace the whole table (e.g. with converted or uploaded data).
+
+        Parameters:
+        df (pandas.DataFrame): The new task table
+
+        Returns:
+        Commit: The write
+        """
+        with self._lock:
+            return self._commit(self._version, apply_task_schema(self.store.replace_all(df)))
+
+    def append(self, rows):
+        """
+        Add new tasks, numbered after the latest task ID.
+
+        Parameters:
+        rows (pandas.DataFrame): The new tasks; their IDs are assigned here
+
+        Returns:
+        Commit: The write; commit.added holds the rows with their task IDs
+        """
+        with self._lock:
+            base_version, tasks = self._current()
+            start = next_row_key(tasks)
+            ids = pd.RangeIndex(start, start + len(rows))
+            rows = rows.set_axis(ids).assign(**{TASK_ID: ids.to_numpy(dtype='int64')})
+            self.store.append(rows)
+            updated = concat_tasks(tasks, rows)
+            return self._commit(base_version, updated, added=updated.loc[ids])
+
+    def delete(self, keys):
+        """
+        Remove tasks by ID; IDs that no longer exist are ignored.
+
+        Parameters:
+        keys (list): Task IDs to remove
+
+        Returns:
+        Commit: The write
+        """
+        with self._lock:
+            base_version, tasks = self._current()
+            positions = tasks.index.get_indexer(pd.Index(keys).unique())
+            positions = positions[positions >= 0]
+            removed = tasks.iloc[positions]
+            self.store.delete(removed.index)
+            return self._commit(base_version, drop_rows(tasks, positions), removed=removed)
+
+    def apply_changes(self, changes):
+        """
+        Apply row-level editor changes to the latest version and store them.
+
+        The changes may have been made on an older version: edits and
+        deletions of tasks that were deleted since are dropped, and added
+        rows get IDs after the latest task ID.
+
+        Parameters:
+        changes (ChangeSet): The changes
+
+        Returns:
+        Commit: The write
+        """
+        with self._lock:
+            base_version, tasks = self._current()
+            changes = changes.rebase(tasks)
+            updated = changes.apply(tasks)
+            changes.save(self.store, updated)
+            return self._commit(
+                base_version,
+                updated,
+                added=changes.added_rows(updated),
+                removed=changes.removed_rows(tasks),
+                columns=changes.columns
+            )
+
+
+# Repositories shared by every session, keyed by store path
+_repositories = {}
+_repositories_lock = threading.Lock()
+
+
+def get_task_repository(path, import_csv=None):
+    """
+    Return the process-wide repository for the task store at `path`.
+
+    Parameters:
+    path (str): Path of the task store (see open_task_store)
+    import_csv (str, optional): CSV file to import into a database (see open_task_store)
+
+    Returns:
+    TaskRepository: The shared repository
+    """
+    key = os.path.abspath(path)
+    with _repositories_lock:
+        if key not in _repositories:
+            _repositories[key] = TaskRepository(open_task_store(path, import_csv=import_csv))
+        return _repositories[key]
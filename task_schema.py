@@ -0,0 +1,190 @@
+# task_schema.py
+import numpy as np
+import pandas as pd
+
+# Task categories in display order
+CATEGORIES = [
+    "Planning", "Delivery", "Installation",
+    "Issue Resolution", "Revisit", "Closeout"
+]
+
+DATE_COLUMNS = ['Start', 'Finish']
+# Text columns with few distinct values, stored once per value as categoricals
+CATEGORICAL_COLUMNS = ['Category', 'Resource', 'Notes', 'Predecessors']
+
+
+def _zone_column(zones):
+    """
+    Trustee zones as int8 when every zone is a whole number.
+
+    Missing zones become 0, the zone used for non-school tasks. Sheets that
+    label some zones with text (e.g. 'Closed') keep their values unchanged.
+    """
+    if zones.dtype == 'int8':
+        return zones
+    numeric = pd.to_numeric(zones, errors='coerce')
+    if numeric.notna().sum() != zones.notna().sum():
+        return zones
+    numeric = numeric.fillna(0)
+    if not ((numeric % 1 == 0) & numeric.between(-128, 127)).all():
+        return zones
+    return numeric.astype('int8')
+
+
+def _completion_column(completion):
+    """Completion percentages as int8 when every value is a whole number from 0 to 100."""
+    if completion.dtype == 'int8':
+        return completion
+    numeric = pd.to_numeric(completion, errors='coerce')
+    if numeric.isna().any() or not ((numeric % 1 == 0) & numeric.between(0, 100)).all():
+        return completion
+    return numeric.astype('int8')
+
+
+def _categorical(values, leading=()):
+    """Categorical column whose categories start with `leading`, then the other values in order."""
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        return values
+    observed = pd.unique(values.dropna())
+    categories = list(leading) + [v for v in observed if v not in set(leading)]
+    return pd.Series(pd.Categorical(values, categories=categories), index=values.index, name=values.name)
+
+
+def apply_task_schema(df):
+    """
+    Return the task table with explicit column types.
+
+    Start/Finish become datetime64, Category, Resource, Notes and
+    Predecessors become categoricals, and Trustee_Zone and Completion_pct
+    become int8 (see _zone_column and _completion_column). Tables without a
+    Predecessors column get an empty one. Other columns are left as they
+    are. The input frame is not modified.
+
+    Parameters:
+    df (pandas.DataFrame): The task table
+
+    Returns:
+    pandas.DataFrame: The typed task table
+    """
+    df = df.copy(deep=False)
+    for date_col in DATE_COLUMNS:
+        if date_col in df.columns and not pd.api.types.is_datetime64_any_dtype(df[date_col]):
+            df[date_col] = pd.to_datetime(df[date_col])
+    if 'Category' in df.columns:
+        df['Category'] = _categorical(df['Category'], leading=CATEGORIES)
+    if 'Predecessors' not in df.columns:
+        df['Predecessors'] = ''
+    df['Predecessors'] = df['Predecessors'].fillna('')
+    for col in ['Resource', 'Notes', 'Predecessors']:
+        if col in df.columns:
+            df[col] = _categorical(df[col])
+    if 'Completion_pct' in df.columns:
+        df['Completion_pct'] = _completion_column(df['Completion_pct'])
+    if 'Trustee_Zone' in df.columns:
+        df['Trustee_Zone'] = _zone_column(df['Trustee_Zone'])
+    return df
+
+
+def _align(df, rows):
+    """
+    Prepare rows to be stored in a typed task table.
+
+    New values in categorical columns are added to the table's categories,
+    and the other columns of `rows` are cast to the table's types. A table
+    column that cannot hold the new values (e.g. text in an int8 zone
+    column) becomes object.
+
+    Returns:
+    tuple: (pandas.DataFrame, pandas.DataFrame) The table and the rows
+    """
+    df = df.copy(deep=False)
+    rows = rows.copy()
+    for col in rows.columns.intersection(df.columns):
+        dtype = df[col].dtype
+        if isinstance(dtype, pd.CategoricalDtype):
+            new_values = [v for v in pd.unique(rows[col].dropna()) if v not in dtype.categories]
+            if new_values:
+                df[col] = df[col].cat.add_categories(new_values)
+            rows[col] = pd.Categorical(rows[col], categories=df[col].cat.categories)
+        elif dtype != rows[col].dtype:
+            try:
+                cast = rows[col].astype(dtype)
+            except (ValueError, TypeError):
+                cast = None
+            if cast is not None and (cast.eq(rows[col]) | rows[col].isna()).all():
+                rows[col] = cast
+            else:
+                df[col] = df[col].astype(object)
+                rows[col] = rows[col].astype(object)
+    return df, rows
+
+
+def concat_tasks(df, rows):
+    """
+    Append rows to a typed task table without losing its column types.
+
+    New values in categorical columns are added to the categories, and the
+    other columns of `rows` are cast to the table's types where possible.
+
+    Parameters:
+    df (pandas.DataFrame): The typed task table
+    rows (pandas.DataFrame): Rows to append
+
+    Returns:
+    pandas.DataFrame: The combined table
+    """
+    df, rows = _align(df, rows)
+    return pd.concat([df, rows])
+
+
+def drop_rows(df, positions):
+    """
+    Remove rows of a task table by position.
+
+    The rows to keep are taken by position, so unlike DataFrame.drop the
+    row keys are not looked up again or compared with the index.
+
+    Parameters:
+    df (pandas.DataFrame): The task table
+    positions (numpy.ndarray): Row positions to remove
+
+    Returns:
+    pandas.DataFrame: The remaining rows, in table order
+    """
+    keep = np.ones(len(df), dtype=bool)
+    keep[positions] = False
+    return df.take(np.flatnonzero(keep))
+
+
+def update_tasks(df, rows):
+    """
+    Overwrite cells of a typed task table without losing its column types.
+
+    Only the columns present in `rows` are written, for the rows whose keys
+    are in its index. Rows keep their position in the table. The written
+    columns are copied first, so the input table is never modified, with
+    or without pandas' copy-on-write mode; the other columns are shared.
+
+    Parameters:
+    df (pandas.DataFrame): The typed task table
+    rows (pandas.DataFrame): New values, indexed by row key
+
+    Returns:
+    pandas.DataFrame: The updated table
+    """
+    df, rows = _align(df, rows)
+    for col in rows.columns.intersection(df.columns):
+        column = df[col].copy()
+        column.loc[rows.index] = rows[col]
+        df[col] = column
+    return df
+
+
+def editable(df):
+    """Return the table with categorical columns as plain values, for st.data_editor."""
+    columns = {
+        col: df[col].astype(object)
+        for col in CATEGORICAL_COLUMNS
+        if col in df.columns and isinstance(df[col].dtype, pd.CategoricalDtype)
+    }
+    return df.assign(**columns) if columns else df
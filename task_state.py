@@ -0,0 +1,108 @@
+# task_state.py
+import streamlit as st
+
+
+def get_tasks():
+    """Return this session's task table."""
+    return st.session_state.tasks_data
+
+
+def tasks_version():
+    """Return the version of the task table this session is showing (0 before the first)."""
+    return st.session_state.get('tasks_version', 0)
+
+
+def set_tasks(df, added=None, removed=None, columns=None, version=None, base_version=None):
+    """
+    Replace this session's task table.
+
+    Every change to the table goes through here so that values derived from
+    it (see derived) are rebuilt for the new version. When the change is
+    described by the rows it added and removed (an edit is both), cached
+    values with an apply_change(added, removed) method are updated in place
+    and kept instead of being rebuilt. When `columns` is given the change
+    only edited those columns in place, and cached values that do not
+    depend on them are kept as they are.
+
+    Parameters:
+    df (pandas.DataFrame): The new task table
+    added (pandas.DataFrame, optional): Rows that are new in df
+    removed (pandas.DataFrame, optional): Rows of the old table that are not in df
+    columns (list, optional): Columns edited in place; rows were neither added nor deleted
+    version (int, optional): Version number of df (default: the next number)
+    base_version (int, optional): Version the change was applied to. Cached
+        values are only updated when it is the version this session showed.
+    """
+    old_version = tasks_version()
+    st.session_state.tasks_data = df
+    st.session_state.tasks_version = old_version + 1 if version is None else version
+
+    if added is None and removed is None and columns is None:
+        return
+    if base_version is not None and base_version != old_version:
+        return
+    cache = st.session_state.get('derived_cache', {})
+    for name, (cached_version, value, depends_on, key) in list(cache.items()):
+        if cached_version != old_version:
+            continue
+        if columns is not None and depends_on is not None and not set(columns) & set(depends_on):
+            cache[name] = (tasks_version(), value, depends_on, key)
+        elif (added is not None or removed is not None) and hasattr(value, 'apply_change'):
+            value.apply_change(added=added, removed=removed)
+            cache[name] = (tasks_version(), value, depends_on, key)
+
+
+def adopt_commit(commit):
+    """Show the table written by a TaskRepository commit in this session."""
+    set_tasks(
+        commit.tasks,
+        added=commit.added,
+        removed=commit.removed,
+        columns=commit.columns,
+        version=commit.version,
+        base_version=commit.base_version
+    )
+
+
+def sync_tasks(repository):
+    """
+    Point this session at the latest version in a TaskRepository.
+
+    Parameters:
+    repository (TaskRepository): The shared task repository
+
+    Returns:
+    bool: True if the session was showing an older version, i.e. the table
+        was changed by another session since this one last ran
+    """
+    version, df = repository.snapshot()
+    old_version = tasks_version()
+    if version == old_version and 'tasks_data' in st.session_state:
+        return False
+    set_tasks(df, version=version)
+    return old_version != 0
+
+
+def derived(name, build, columns=None, key=None):
+    """
+    Return a value computed from the task table, rebuilt only when the table changes.
+
+    Parameters:
+    name (str): Name of the cached value
+    build (callable): Computes the value from the task table
+    columns (list, optional): Columns the value depends on. In-place edits
+        of other columns keep it; None means it depends on every column.
+    key (hashable, optional): Anything else the value depends on, e.g.
+        today's date. A different key rebuilds the value in place of the
+        old one, so each name holds one cached value.
+
+    Returns:
+    The cached result of build(get_tasks()) for the current version and key
+    """
+    cache = st.session_state.setdefault('derived_cache', {})
+    version = tasks_version()
+    entry = cache.get(name)
+    if entry is None or entry[0] != version or entry[3] != key:
+        entry = (version, build(get_tasks()), columns, key)
+        cache[name] = entry
+    return entry[1]
@@ -0,0 +1,371 @@
+# task_store.py
+import os
+import sqlite3
+from contextlib import closing
+
+import numpy as np
+import pandas as pd
+
+from task_schema import DATE_COLUMNS
+
+# Column holding each task's unique, persistent ID. The ID is also the
+# task's row key (the DataFrame index) in the app and in every store.
+TASK_ID = 'Task_ID'
+
+# Columns persisted for every task and their SQLite column types.
+# Start and Finish are stored as integer nanoseconds since the Unix epoch.
+# Trustee_Zone has no declared type because sheets mix numbers and text.
+TASK_COLUMNS = {
+    'Task': 'TEXT',
+    'Resource': 'TEXT',
+    'Start': 'INTEGER',
+    'Duration': 'NUMERIC',
+    'Finish': 'INTEGER',
+    'Completion_pct': 'NUMERIC',
+    'Trustee_Zone': '',
+    'Category': 'TEXT',
+    'Notes': 'TEXT',
+    'Predecessors': 'TEXT'
+}
+
+
+def read_tasks_csv(source):
+    """
+    Read a task table from CSV, parsing the Start and Finish dates.
+
+    Parameters:
+    source (str or file-like): Path or buffer of the CSV file
+
+    Returns:
+    pandas.DataFrame: The task table
+    """
+    df = pd.read_csv(source)
+    for date_col in DATE_COLUMNS:
+        if date_col in df.columns:
+            df[date_col] = pd.to_datetime(df[date_col])
+    return df
+
+
+def with_row_keys(df):
+    """
+    Return df indexed by its task IDs, with a matching Task_ID first column.
+
+    IDs come from the Task_ID column when the table has one, otherwise from
+    the index. Rows that already have a valid, unique ID keep it. Rows added
+    without one (for example new rows from st.data_editor) get IDs after the
+    largest existing ID. A table without a Task_ID column whose index is out
+    of order is numbered in row order.
+    """
+    has_ids = TASK_ID in df.columns
+    if has_ids:
+        keys = pd.to_numeric(df[TASK_ID], errors='coerce').set_axis(np.arange(len(df)))
+    elif df.index.dtype == 'int64' and df.index.is_unique and df.index.is_monotonic_increasing:
+        keys = None
+    else:
+        keys = pd.to_numeric(pd.Series(df.index, dtype=object), errors='coerce')
+
+    if keys is not None:
+        valid = keys.notna() & (keys % 1 == 0) & ~keys.duplicated()
+        if not valid.all():
+            start = int(keys[valid].max()) + 1 if valid.any() else 0
+            keys = keys.where(valid)
+            keys[~valid] = np.arange(start, start + int((~valid).sum()))
+        if not has_ids and not keys.is_monotonic_increasing:
+            keys = pd.Series(np.arange(len(df)))
+        keys = keys.astype('int64').to_numpy()
+        if not (df.index.dtype == 'int64' and np.array_equal(df.index.to_numpy(), keys)):
+            df = df.set_axis(keys, axis=0)
+    return with_task_ids(df)
+
+
+def with_task_ids(df):
+    """Return df with a Task_ID first column equal to its index (the row keys)."""
+    if TASK_ID in df.columns and df.columns[0] == TASK_ID and np.array_equal(df[TASK_ID].to_numpy(), df.index.to_numpy()):
+        return df
+    ids = pd.Series(df.index.to_numpy(dtype='int64'), index=df.index, name=TASK_ID)
+    return pd.concat([ids, df.drop(columns=TASK_ID, errors='ignore')], axis=1)
+
+
+def _file_signature(path):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return (None, None)
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def next_row_key(df):
+    """Return the key for a row appended after the rows of df."""
+    return int(df.index.max()) + 1 if len(df) else 0
+
+
+class TaskStore:
+    """
+    Persistent storage for the task table.
+
+    The DataFrame index holds the row keys (task IDs), so single rows can be appended,
+    updated or deleted without rewriting the whole table. Backends implement
+    exists, load, replace_all, append, update and delete.
+    """
+
+    def exists(self):
+        raise NotImplementedError
+
+    def signature(self):
+        """Return a value that changes whenever the stored table changes on disk."""
+        raise NotImplementedError
+
+    def load(self):
+        """Return the stored task table, indexed by row key."""
+        raise NotImplementedError
+
+    def replace_all(self, df):
+        """Replace the stored table with df and return it with row keys."""
+        raise NotImplementedError
+
+    def append(self, rows):
+        """Store new rows, indexed by their (new) row keys."""
+        raise NotImplementedError
+
+    def update(self, rows):
+        """Overwrite the stored rows whose keys are in the index of rows (all task columns)."""
+        raise NotImplementedError
+
+    def delete(self, keys):
+        """Remove the rows with the given keys."""
+        raise NotImplementedError
+
+
+class CsvTaskStore(TaskStore):
+    """
+    Task store backed by a single CSV file.
+
+    Every change rewrites the whole file. This is the original gantt_data.csv
+    format and is kept for compatibility.
+
+    Parameters:
+    path (str): Path of the CSV file
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._frame = None
+
+    def exists(self):
+        return os.path.exists(self.path)
+
+    def signature(self):
+        return _file_signature(self.path)
+
+    def load(self):
+        self._frame = with_row_keys(read_tasks_csv(self.path))
+        return self._frame
+
+    def _current(self):
+        if self._frame is None:
+            self.load()
+        return self._frame
+
+    def _write(self, df):
+        self._frame = df
+        df.to_csv(self.path, index=False)
+        return df
+
+    def replace_all(self, df):
+        return self._write(with_row_keys(df))
+
+    def append(self, rows):
+        self._write(pd.concat([self._current(), with_task_ids(rows)]))
+
+    def update(self, rows):
+        df = self._current().copy()
+        rows = rows.drop(columns=TASK_ID, errors='ignore')
+        df.loc[rows.index, rows.columns] = rows
+        self._write(df)
+
+    def delete(self, keys):
+        self._write(self._current().drop(index=keys, errors='ignore'))
+
+
+class SQLiteTaskStore(TaskStore):
+    """
+    Task store backed by a SQLite database.
+
+    Each task is one row keyed by its task ID (row_key), so adding, editing
+    or deleting a task writes only that row. Dates are stored as integers and
+    come back as datetime64 columns without string parsing.
+
+    A CSV file can be named as the source of the table: whenever it is
+    newer than its last import (see import_csv), its tasks replace the
+    stored ones.
+
+    Parameters:
+    path (str): Path of the database file
+    table (str): Name of the task table
+    source_csv (str, optional): CSV file to import the tasks from
+    """
+
+    def __init__(self, path, table='tasks', source_csv=None):
+        self.path = path
+        self.table = table
+        self.source_csv = source_csv
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.execute('PRAGMA journal_mode=WAL')
+        return conn
+
+    def exists(self):
+        if not os.path.exists(self.path):
+            return False
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT name FROM sqlite_master WHERE type='table' AND name=?", (self.table,)
+            ).fetchone()
+        return row is not None
+
+    def signature(self):
+        # Committed changes may still sit in the write-ahead log. A newer
+        # source CSV changes the table too, as load imports it
+        signature = _file_signature(self.path) + _file_signature(self.path + '-wal')
+        if self.source_csv:
+            signature += _file_signature(self.source_csv)
+        return signature
+
+    def _create_table(self, conn):
+        columns = ', '.join(f'"{name}" {sql_type}'.strip() for name, sql_type in TASK_COLUMNS.items())
+        conn.execute(f'CREATE TABLE IF NOT EXISTS "{self.table}" (row_key INTEGER PRIMARY KEY, {columns})')
+        # Databases created before a column was added get it now
+        existing = {row[1] for row in conn.execute(f'PRAGMA table_info("{self.table}")')}
+        for name, sql_type in TASK_COLUMNS.items():
+            if name not in existing:
+                conn.execute(f'ALTER TABLE "{self.table}" ADD COLUMN "{name}" {sql_type}'.strip())
+
+    @staticmethod
+    def _records(rows):
+        """Convert rows to tuples of plain Python values for sqlite3."""
+        columns = [rows.index.to_numpy(dtype='int64').tolist()]
+        for name in TASK_COLUMNS:
+            if name not in rows.columns:
+                columns.append([None] * len(rows))
+            elif name in DATE_COLUMNS:
+                dates = pd.to_datetime(rows[name])
+                nanos = dates.to_numpy(dtype='datetime64[ns]').view('int64')
+                columns.append(np.where(dates.isna(), None, nanos).tolist())
+            else:
+                values = rows[name].astype(object)
+                columns.append(values.where(values.notna(), None).tolist())
+        return list(zip(*columns))
+
+    def _insert(self, conn, rows, verb='INSERT'):
+        names = ', '.join(f'"{name}"' for name in TASK_COLUMNS)
+        marks = ', '.join('?' * (len(TASK_COLUMNS) + 1))
+        conn.executemany(
+            f'{verb} INTO "{self.table}" (row_key, {names}) VALUES ({marks})',
+            self._records(rows)
+        )
+
+    @property
+    def _import_table(self):
+        return f'{self.table}_import'
+
+    def _imported_mtime(self):
+        """
+        Modification time (ns) of the source CSV when it was last imported.
+
+        A database that has never recorded an import (one created before
+        imports were recorded) counts its own last write instead.
+        """
+        with closing(self._connect()) as conn:
+            marker = conn.execute(
+                "SELECT name FROM sqlite_master WHERE type='table' AND name=?", (self._import_table,)
+            ).fetchone()
+            row = conn.execute(f'SELECT mtime_ns FROM "{self._import_table}"').fetchone() if marker else None
+        if row is not None:
+            return row[0]
+        return max(_file_signature(name)[0] or 0 for name in (self.path, self.path + '-wal'))
+
+    def import_csv(self):
+        """
+        Import the source CSV if it is newer than its last import.
+
+        An empty database always imports it. Otherwise the CSV replaces the
+        stored tasks only when it was modified after it was last imported,
+        for example by the converter CLI (which writes gantt_data.csv by
+        default) or by copying a file over it. Edits made in the app since
+        the last import are then replaced.
+
+        Returns:
+        bool: Whether the CSV was imported
+        """
+        if not self.source_csv:
+            return False
+        mtime = _file_signature(self.source_csv)[0]
+        if mtime is None or (self.exists() and mtime <= self._imported_mtime()):
+            return False
+
+        df = with_row_keys(read_tasks_csv(self.source_csv))
+        with closing(self._connect()) as conn, conn:
+            self._replace(conn, df)
+            conn.execute(f'CREATE TABLE IF NOT EXISTS "{self._import_table}" (mtime_ns INTEGER)')
+            conn.execute(f'DELETE FROM "{self._import_table}"')
+            conn.execute(f'INSERT INTO "{self._import_table}" (mtime_ns) VALUES (?)', (mtime,))
+        return True
+
+    def load(self):
+        self.import_csv()
+        with closing(self._connect()) as conn:
+            df = pd.read_sql_query(f'SELECT * FROM "{self.table}" ORDER BY row_key', conn, index_col='row_key')
+        df.index.name = None
+        for date_col in DATE_COLUMNS:
+            df[date_col] = pd.to_datetime(df[date_col], unit='ns')
+        return with_task_ids(df)
+
+    def _replace(self, conn, df):
+        self._create_table(conn)
+        conn.execute(f'DELETE FROM "{self.table}"')
+        self._insert(conn, df)
+
+    def replace_all(self, df):
+        df = with_row_keys(df)
+        with closing(self._connect()) as conn, conn:
+            self._replace(conn, df)
+        return df
+
+    def append(self, rows):
+        with closing(self._connect()) as conn, conn:
+            self._create_table(conn)
+            self._insert(conn, rows)
+
+    def update(self, rows):
+        with closing(self._connect()) as conn, conn:
+            self._create_table(conn)
+            self._insert(conn, rows, verb='INSERT OR REPLACE')
+
+    def delete(self, keys):
+        keys = [(int(key),) for key in keys]
+        with closing(self._connect()) as conn, conn:
+            conn.executemany(f'DELETE FROM "{self.table}" WHERE row_key = ?', keys)
+
+
+def open_task_store(path, import_csv=None):
+    """
+    Open the task store at `path`, choosing the backend from the file extension.
+
+    '.csv' files use CsvTaskStore; anything else is a SQLite database. A
+    database imports the tasks of `import_csv` when it is created, and again
+    whenever that file is newer than its last import.
+
+    Parameters:
+    path (str): Path of the store
+    import_csv (str, optional): CSV file to import into a database
+
+    Returns:
+    TaskStore: The opened store
+    """
+    if path.lower().endswith('.csv'):
+        return CsvTaskStore(path)
+
+    store = SQLiteTaskStore(path, source_csv=import_csv)
+    store.import_csv()
+    return store
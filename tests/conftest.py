@@ -0,0 +1,70 @@
+# tests/conftest.py
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from data_converter import build_gantt_frame
+from task_repository import TaskRepository
+from task_store import open_task_store
+
+
+@pytest.fixture(params=[True, False], ids=['copy_on_write', 'no_copy_on_write'])
+def copy_on_write(request):
+    """Run a test with pandas' copy-on-write mode on and off."""
+    with pd.option_context('mode.copy_on_write', request.param):
+        yield request.param
+
+
+def _project_sheet(schools, status='Not Started', deployment=None):
+    """A 'Project status' sheet listing schools in zone 1, all deployed on one date (or undated)."""
+    n = len(schools)
+    return pd.DataFrame({
+        'Sites': schools,
+        'UPS Replacement Status': [status] * n,
+        'Trustee Zones': [1] * n,
+        'Notes': [''] * n,
+        'Deployment Date': [deployment] * n
+    })
+
+
+@pytest.fixture
+def project_sheet():
+    """Builds 'Project status' sheets: project_sheet(schools, status='Not Started', deployment=None)."""
+    return _project_sheet
+
+
+@pytest.fixture
+def project_tasks(project_sheet):
+    """Builds the converted task table of a project with n undated schools: project_tasks(n)."""
+    def project_tasks(n_schools):
+        sheet = project_sheet([f"School {i}" for i in range(n_schools)])
+        return build_gantt_frame(sheet, None, None, date(2025, 3, 10))
+    return project_tasks
+
+
+@pytest.fixture
+def repository(tmp_path, project_tasks):
+    """A repository over a new SQLite store holding the tasks of 20 schools."""
+    repository = TaskRepository(open_task_store(str(tmp_path / 'tasks.db')))
+    repository.replace_all(project_tasks(20))
+    return repository
+
+
+def _task_table(*tasks):
+    """Task table from (task, resource, start, finish, predecessors) tuples, indexed by task ID."""
+    df = pd.DataFrame(tasks, columns=['Task', 'Resource', 'Start', 'Finish', 'Predecessors'])
+    df['Start'] = pd.to_datetime(df['Start'])
+    df['Finish'] = pd.to_datetime(df['Finish'])
+    df['Duration'] = (df['Finish'] - df['Start']).dt.days
+    df['Completion_pct'] = 0
+    df['Category'] = 'Delivery'
+    df['Notes'] = ''
+    df.insert(0, 'Task_ID', range(len(df)))
+    return df
+
+
+@pytest.fixture
+def task_table():
+    """Builds small task tables: task_table((task, resource, start, finish, predecessors), ...)."""
+    return _task_table
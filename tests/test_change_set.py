@@ -0,0 +1,64 @@
+# tests/test_change_set.py
+import pandas as pd
+import pytest
+
+from change_set import ChangeSet
+from task_repository import TaskRepository
+from task_schema import editable
+from task_store import next_row_key
+
+NEW_TASK = {
+    'Task': 'New School: Delivery', 'Resource': 'Delivery Team', 'Start': '2025-04-01T00:00:00',
+    'Duration': 1, 'Finish': '2025-04-02T00:00:00', 'Completion_pct': 0, 'Trustee_Zone': 3,
+    'Category': 'Delivery', 'Notes': 'added in the editor', 'Predecessors': ''
+}
+
+
+def editor_result(shown, state):
+    """
+    What st.data_editor returns for the frame it was given and its widget state.
+
+    Like the editor, this applies the edited cells, then the deletions, and
+    appends the added rows only while the index is still a RangeIndex.
+    """
+    result = shown.copy()
+    for position, cells in state['edited_rows'].items():
+        for col, value in cells.items():
+            result.loc[position, col] = value
+    result = result.drop(index=state['deleted_rows'])
+    if isinstance(result.index, pd.RangeIndex):
+        added = pd.DataFrame(state['added_rows'], columns=result.columns)
+        added['Start'] = pd.to_datetime(added['Start'])
+        added['Finish'] = pd.to_datetime(added['Finish'])
+        result = pd.concat([result, added.set_axis(pd.RangeIndex(len(result), len(result) + len(added)))])
+    return result
+
+
+@pytest.mark.parametrize('deleted_rows', [[], [2]], ids=['add', 'add_and_delete'])
+def test_rows_added_in_the_editor_are_saved(repository, deleted_rows):
+    _, tasks = repository.snapshot()
+    # A page of the table whose task IDs are not its positions
+    page = tasks.iloc[[5, 7, 8, 11]]
+    state = {
+        'edited_rows': {0: {'Notes': 'edited'}},
+        'added_rows': [NEW_TASK, dict(NEW_TASK, Task='Other School: Delivery')],
+        'deleted_rows': deleted_rows
+    }
+
+    shown = editable(page).reset_index(drop=True)
+    changes = ChangeSet.from_editor(state, page.index, editor_result(shown, state), next_row_key(tasks))
+    commit = repository.apply_changes(changes)
+
+    saved = commit.tasks
+    assert len(saved) == len(tasks) + 2 - len(deleted_rows)
+    assert saved.loc[page.index[0], 'Notes'] == 'edited'
+    assert (page.index[2] in saved.index) == (not deleted_rows)
+    added = saved[saved['Task'].isin(['New School: Delivery', 'Other School: Delivery'])]
+    assert added.index.tolist() == [next_row_key(tasks), next_row_key(tasks) + 1]
+    assert added['Task_ID'].tolist() == added.index.tolist()
+    assert (added['Start'] == pd.Timestamp('2025-04-01')).all()
+    assert added['Trustee_Zone'].tolist() == [3, 3]
+
+    # The rows are in the store too, not just in the published snapshot
+    reloaded = TaskRepository(repository.store).snapshot()[1]
+    assert reloaded['Task'].isin(['New School: Delivery', 'Other School: Delivery']).sum() == 2
@@ -0,0 +1,40 @@
+# tests/test_conversion_cache.py
+from datetime import date
+
+import pandas as pd
+
+from conversion_cache import ConversionCache
+
+
+def test_key_depends_on_conversion_date():
+    data = b'workbook bytes'
+    assert ConversionCache.key(data, date(2025, 3, 10)) == ConversionCache.key(data, date(2025, 3, 10))
+    assert ConversionCache.key(data, date(2025, 3, 10)) != ConversionCache.key(data, date(2025, 3, 11))
+    assert ConversionCache.key(data, date(2025, 3, 10)) != ConversionCache.key(b'other bytes', date(2025, 3, 10))
+
+
+def test_same_workbook_is_converted_again_on_another_day(tmp_path):
+    data = b'workbook bytes'
+    first = pd.DataFrame({'Start': [pd.Timestamp('2025-03-10')]})
+
+    # As the upload does: look the workbook up, and store the conversion on a miss
+    cache = ConversionCache(cache_dir=str(tmp_path))
+    assert cache.get(cache.key(data, date(2025, 3, 10))) is None
+    cache.put(cache.key(data, date(2025, 3, 10)), first)
+    pd.testing.assert_frame_equal(cache.get(cache.key(data, date(2025, 3, 10))), first)
+
+    # A fresh cache over the same directory reads the disk store, keyed per day
+    cache = ConversionCache(cache_dir=str(tmp_path))
+    pd.testing.assert_frame_equal(cache.get(cache.key(data, date(2025, 3, 10))), first)
+    assert cache.get(cache.key(data, date(2025, 3, 11))) is None
+
+
+def test_cached_tables_are_copies(tmp_path):
+    cache = ConversionCache(cache_dir=str(tmp_path))
+    df = pd.DataFrame({'Notes': ['a']})
+    cache.put('key', df)
+    df.loc[0, 'Notes'] = 'changed'
+
+    cached = cache.get('key')
+    cached.loc[0, 'Notes'] = 'changed again'
+    assert cache.get('key')['Notes'].tolist() == ['a']
@@ -0,0 +1,76 @@
+# tests/test_data_converter.py
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from data_converter import build_gantt_frame, merge_region_tables, write_tasks
+
+TODAY = date(2025, 3, 10)
+
+
+@pytest.fixture
+def region(project_sheet):
+    """Converts a project sheet of schools into one region's task table."""
+    return lambda schools, **kwargs: build_gantt_frame(project_sheet(schools, **kwargs), None, None, TODAY)
+
+
+def test_merge_keeps_one_copy_of_schools_at_different_positions(region):
+    merged = merge_region_tables([('r1', region(['A'])), ('r2', region(['B', 'A', 'C']))])
+
+    tasks = merged['Task'].value_counts()
+    assert tasks['A: Delivery'] == 1
+    assert tasks['A: Installation'] == 1
+    assert {'B: Delivery', 'C: Delivery'} <= set(tasks.index)
+    assert (merged['Category'] == 'Planning').sum() == 3
+    assert (merged['Category'] == 'Closeout').sum() == 2
+    assert merged['Task_ID'].tolist() == list(range(len(merged)))
+
+
+def test_merge_of_regions_of_different_sizes_keeps_planning_and_closeout_once(region):
+    sizes = [1, 4, 2, 7, 3, 5]
+    tables = [(f"r{i}", region([f"S{i}-{j}" for j in range(n)])) for i, n in enumerate(sizes)]
+    merged = merge_region_tables(tables)
+
+    assert (merged['Category'] == 'Planning').sum() == 3
+    assert (merged['Category'] == 'Closeout').sum() == 2
+    assert (merged['Category'] == 'Delivery').sum() == sum(sizes)
+    assert merged['Category'].iloc[:3].eq('Planning').all()
+    assert merged['Category'].iloc[-2:].eq('Closeout').all()
+
+
+def test_merge_prefers_the_most_complete_copy_of_a_school(region):
+    merged = merge_region_tables([('r1', region(['X', 'A'])), ('r2', region(['A'], status='Done', deployment=pd.Timestamp('2025-02-03')))])
+
+    school = merged[merged['Task'].str.startswith('A:')]
+    assert len(school) == 2
+    assert school['Completion_pct'].eq(100).all()
+    assert school['Region'].eq('r2').all()
+
+
+def test_merge_keeps_repeats_within_one_region(region):
+    merged = merge_region_tables([('r1', region(['A', 'A'])), ('r2', region(['B', 'A']))])
+
+    assert (merged['Task'] == 'A: Delivery').sum() == 2
+
+
+def test_undated_tasks_past_the_last_storable_date_raise_a_clear_error(project_sheet):
+    sheet = project_sheet([f"School {i}" for i in range(10)])
+
+    with pytest.raises(ValueError, match='Deployment Date'):
+        build_gantt_frame(sheet, None, None, date(2262, 4, 1))
+
+
+def test_parquet_output_keeps_missing_values_null(region, tmp_path):
+    pytest.importorskip('pyarrow')
+    df = region(['A', 'B'])
+    df['Trustee_Zone'] = [1, 'Zone 2', None] + [3] * (len(df) - 3)
+    df['Notes'] = [None, float('nan')] + ['note'] * (len(df) - 2)
+    path = str(tmp_path / 'tasks.parquet')
+
+    write_tasks(df, path)
+    written = pd.read_parquet(path)
+
+    assert written['Trustee_Zone'].isna().tolist()[:4] == [False, False, True, False]
+    assert written['Trustee_Zone'].dropna().tolist()[:3] == ['1', 'Zone 2', '3']
+    assert written['Notes'].isna().tolist()[:3] == [True, True, False]
@@ -0,0 +1,96 @@
+# tests/test_dependency_graph.py
+import numpy as np
+import pandas as pd
+import pytest
+
+from dependency_graph import MILESTONES, CriticalPath, infer_dependencies, task_dependencies
+from scheduler import Scheduler
+
+
+def days(dates):
+    """Days from 2023-10-02 of datetime64 values."""
+    return ((np.asarray(dates, dtype='datetime64[ns]') - np.datetime64('2023-10-02')) // np.timedelta64(1, 'D')).tolist()
+
+
+@pytest.fixture
+def diamond(task_table):
+    # A comes first; B and C follow it, and D waits for both. B is the longer branch
+    return task_table(
+        ('A: Delivery', 'Team A', '2023-10-02', '2023-10-04', ''),
+        ('B: Delivery', 'Team B', '2023-10-04', '2023-10-07', '0'),
+        ('C: Delivery', 'Team C', '2023-10-04', '2023-10-05', '0'),
+        ('D: Delivery', 'Team D', '2023-10-07', '2023-10-08', '1, 2')
+    )
+
+
+def test_forward_and_backward_passes(diamond):
+    cpm = CriticalPath(diamond)
+
+    assert days(cpm.early_start) == [0, 2, 2, 5]
+    assert days(cpm.early_finish) == [2, 5, 3, 6]
+    assert days(cpm.late_start) == [0, 2, 4, 5]
+    assert days(cpm.late_finish) == [2, 5, 5, 6]
+    assert cpm.total_float.tolist() == [0, 0, 2, 0]
+    assert cpm.critical.tolist() == [True, True, False, True]
+    assert cpm.chain().tolist() == [0, 1, 3]
+    assert cpm.project_finish == np.datetime64('2023-10-08')
+
+
+def test_a_later_planned_start_delays_the_forward_pass(diamond):
+    # C is planned two days later, which uses up its float
+    diamond.loc[2, ['Start', 'Finish']] = [pd.Timestamp('2023-10-06'), pd.Timestamp('2023-10-07')]
+    cpm = CriticalPath(diamond)
+
+    assert days(cpm.early_start)[2] == 4
+    assert cpm.total_float[2] == 0
+    assert cpm.critical.tolist() == [True, True, True, True]
+
+
+def test_tasks_in_and_after_a_cycle_get_no_dates(task_table):
+    df = task_table(
+        ('A: Delivery', 'Team A', '2023-10-02', '2023-10-03', '2'),
+        ('B: Delivery', 'Team B', '2023-10-03', '2023-10-04', '0'),
+        ('C: Delivery', 'Team C', '2023-10-04', '2023-10-05', '1'),
+        ('D: Delivery', 'Team D', '2023-10-05', '2023-10-06', '2'),
+        ('E: Delivery', 'Team E', '2023-10-02', '2023-10-09', '')
+    )
+    cpm = CriticalPath(df)
+
+    assert cpm.in_cycle.tolist() == [True, True, True, True, False]
+    assert np.isnat(cpm.early_start[:4]).all()
+    assert np.isnan(cpm.total_float[:4]).all()
+    assert cpm.critical.tolist() == [False, False, False, False, True]
+    assert cpm.chain().tolist() == [4]
+
+
+def test_a_cycle_through_the_inferred_school_order(task_table):
+    # The Delivery is listed as waiting for its own school's Installation
+    df = task_table(
+        ('A: Delivery', 'Delivery Team', '2023-10-02', '2023-10-03', '1'),
+        ('A: Installation', 'Installation Team', '2023-10-03', '2023-10-04', '')
+    ).assign(Category=['Delivery', 'Installation'])
+
+    assert CriticalPath(df).in_cycle.all()
+    with pytest.raises(ValueError, match='cycle'):
+        Scheduler().schedule(df, start=pd.Timestamp('2023-10-02'))
+
+
+def test_planning_and_closeout_go_through_milestones(project_tasks):
+    df = project_tasks(50)
+    category = df['Category'].astype(str).to_numpy()
+    planning = (category == 'Planning').sum()
+    closeout = (category == 'Closeout').sum()
+    middle = len(df) - planning - closeout
+    installations = (category == 'Installation').sum()
+
+    preds, succs = infer_dependencies(df)
+    # Linear: each task has one edge to or from a milestone
+    assert len(preds) == planning + 2 * middle + closeout + (closeout - 1) + installations
+    assert set(preds[preds >= len(df)]) | set(succs[succs >= len(df)]) == set(range(len(df), len(df) + MILESTONES))
+
+    # Every middle task still waits for all of Planning, and Closeout for all of them
+    cpm = CriticalPath(df, task_dependencies(df))
+    is_middle = (category != 'Planning') & (category != 'Closeout')
+    assert (cpm.early_start[is_middle] >= cpm.early_finish[category == 'Planning'].max()).all()
+    assert (cpm.early_start[category == 'Closeout'] >= cpm.early_finish[is_middle].max()).all()
+    assert (cpm.chain() < len(df)).all()
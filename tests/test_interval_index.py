@@ -0,0 +1,66 @@
+# tests/test_interval_index.py
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from interval_index import TaskIntervals, day_window, tasks_active_in_window
+
+
+def random_tasks(rng, n):
+    """Tasks of random length, a few shorter than a day, some undated, with a few long ones."""
+    start = pd.Timestamp('2025-01-01') + pd.to_timedelta(6 * rng.integers(0, 90 * 4, n), unit='h')
+    hours = np.where(rng.random(n) < 0.05, 24 * rng.integers(30, 120, n), 6 * rng.integers(0, 10 * 4, n))
+    df = pd.DataFrame({'Task': [f"Task {i}" for i in range(n)], 'Start': start,
+                       'Finish': start + pd.to_timedelta(hours, unit='h')})
+    df.loc[rng.random(n) < 0.1, 'Start'] = pd.NaT
+    df.loc[rng.random(n) < 0.1, 'Finish'] = pd.NaT
+    return df.set_index(pd.Index(rng.permutation(n) + 100))
+
+
+def brute_force_active(df, window_start, window_end):
+    """Row positions of the tasks starting before window_end and finishing on or after window_start."""
+    return [position for position, task in enumerate(df.itertuples())
+            if task.Start < window_end and task.Finish >= window_start]
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_overlapping_matches_a_scan_of_every_task(seed):
+    rng = np.random.default_rng(seed)
+    df = random_tasks(rng, 300)
+    intervals = TaskIntervals.from_frame(df)
+
+    windows = [(pd.Timestamp('2025-01-01') + pd.Timedelta(days=int(first)), int(length))
+               for first, length in zip(rng.integers(-10, 120, 30), rng.integers(0, 20, 30))]
+    for first, length in windows:
+        window_start, window_end = first, first + pd.Timedelta(days=length)
+        expected = brute_force_active(df, window_start, window_end)
+        found = intervals.overlapping(window_start.to_datetime64(), window_end.to_datetime64())
+
+        assert found.tolist() == expected
+        assert np.flatnonzero(intervals.mask(window_start.to_datetime64(), window_end.to_datetime64())).tolist() == expected
+        assert intervals.count(window_start.to_datetime64(), window_end.to_datetime64()) == len(expected)
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_tasks_active_in_window_matches_a_scan_of_every_task(seed):
+    rng = np.random.default_rng(seed)
+    df = random_tasks(rng, 200)
+    intervals = TaskIntervals.from_frame(df)
+
+    for first in range(0, 100, 7):
+        start_date = date(2025, 1, 1) + timedelta(days=first)
+        end_date = start_date + timedelta(days=int(rng.integers(0, 30)))
+        window_start, window_end = (pd.Timestamp(bound) for bound in day_window(start_date, end_date))
+        expected = df.iloc[brute_force_active(df, window_start, window_end)]
+
+        pd.testing.assert_frame_equal(tasks_active_in_window(df, start_date, end_date), expected)
+        pd.testing.assert_frame_equal(tasks_active_in_window(df, start_date, end_date, intervals), expected)
+
+
+def test_an_empty_index_finds_nothing():
+    intervals = TaskIntervals(np.array(['NaT'], dtype='datetime64[ns]'), np.array(['2025-01-02'], dtype='datetime64[ns]'))
+
+    assert intervals.overlapping(np.datetime64('2024-01-01'), np.datetime64('2026-01-01')).tolist() == []
+    assert not intervals.mask(np.datetime64('2024-01-01'), np.datetime64('2026-01-01')).any()
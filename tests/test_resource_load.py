@@ -0,0 +1,100 @@
+# tests/test_resource_load.py
+import numpy as np
+import pandas as pd
+import pytest
+
+from resource_load import ResourceLoad
+
+RESOURCES = ['Delivery Team', 'Installation Team', 'Technical Team']
+CAPACITIES = {'Installation Team': 2}
+
+
+def random_tasks(rng, n):
+    """Tasks on random resources, some without length, some ending mid-day, some undated."""
+    # Six-hour steps, so that many tasks start or finish at midnight
+    start = pd.Timestamp('2025-01-01') + pd.to_timedelta(6 * rng.integers(0, 60 * 4, n), unit='h')
+    finish = start + pd.to_timedelta(6 * rng.integers(0, 10 * 4, n), unit='h')
+    df = pd.DataFrame({'Resource': rng.choice(RESOURCES, n), 'Start': start, 'Finish': finish})
+    df.loc[rng.random(n) < 0.1, 'Start'] = pd.NaT
+    df.loc[rng.random(n) < 0.1, 'Finish'] = pd.NaT
+    return df
+
+
+def booked_days(task):
+    """Days a task occupies, counted one by one."""
+    day = task.Start.normalize()
+    days = [day]
+    while day + pd.Timedelta(days=1) < task.Finish:
+        day += pd.Timedelta(days=1)
+        days.append(day)
+    return days
+
+
+def brute_force_load(df):
+    """{(resource, day): tasks} over every dated task."""
+    load = {}
+    for task in df.dropna(subset=['Start', 'Finish']).itertuples():
+        for day in booked_days(task):
+            load[task.Resource, day] = load.get((task.Resource, day), 0) + 1
+    return load
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_load_matches_a_day_by_day_count(seed):
+    df = random_tasks(np.random.default_rng(seed), 200)
+    load = ResourceLoad(df)
+    expected = brute_force_load(df)
+
+    days = pd.DatetimeIndex(load.days)
+    assert days[0] == min(day for _, day in expected)
+    assert days[-1] == max(day for _, day in expected)
+    for row, resource in enumerate(load.resources):
+        assert load.load[row].tolist() == [expected.get((resource, day), 0) for day in days]
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_overallocations_match_a_day_by_day_scan(seed):
+    df = random_tasks(np.random.default_rng(seed), 60)
+    load = ResourceLoad(df)
+    counts = brute_force_load(df)
+    days = pd.DatetimeIndex(load.days)
+
+    expected = []
+    for resource in load.resources:
+        crews = CAPACITIES.get(resource, 1)
+        tasks = [counts.get((resource, day), 0) for day in days] + [0]
+        first = None
+        for position, count in enumerate(tasks):
+            if count > crews and first is None:
+                first = position
+            elif count <= crews and first is not None:
+                run = tasks[first:position]
+                expected.append((days[first], resource, days[position - 1], len(run), max(run), crews))
+                first = None
+    expected.sort(key=lambda run: (run[0], run[1]))
+
+    runs = load.overallocations(CAPACITIES)
+    assert len(runs)
+    assert list(zip(runs['From'], runs['Resource'], runs['To'], runs['Days'], runs['Peak Tasks'], runs['Crews'])) == expected
+    assert runs['Days'].sum() == load.overallocated(CAPACITIES).sum()
+
+
+@pytest.mark.parametrize('seed', range(3))
+def test_tasks_between_matches_the_booked_days(seed):
+    df = random_tasks(np.random.default_rng(seed), 100)
+    load = ResourceLoad(df)
+    first_day, last_day = pd.Timestamp('2025-01-20'), pd.Timestamp('2025-01-24')
+
+    for resource in load.resources:
+        expected = [position for position, task in enumerate(df.itertuples())
+                    if task.Resource == resource and not pd.isna(task.Start) and not pd.isna(task.Finish)
+                    and any(first_day <= day <= last_day for day in booked_days(task))]
+        assert load.tasks_between(resource, first_day.to_datetime64(), last_day.to_datetime64()).tolist() == expected
+
+
+def test_a_table_without_dates_has_no_load():
+    df = pd.DataFrame({'Resource': ['Delivery Team'], 'Start': [pd.NaT], 'Finish': [pd.NaT]})
+    load = ResourceLoad(df)
+
+    assert load.load.shape == (1, 0)
+    assert load.overallocations().empty
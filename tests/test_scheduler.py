@@ -0,0 +1,139 @@
+# tests/test_scheduler.py
+import pandas as pd
+import pytest
+
+from change_set import ChangeSet
+from scheduler import Rescheduler, Scheduler
+
+
+def editor_changes(df, edited_rows):
+    """ChangeSet of a data editor showing all of df, with the given edited cells."""
+    edited_df = df.reset_index(drop=True)
+    for position, cells in edited_rows.items():
+        for col, value in cells.items():
+            edited_df.loc[position, col] = value
+    state = {'edited_rows': edited_rows, 'added_rows': [], 'deleted_rows': []}
+    return ChangeSet.from_editor(state, df.index, edited_df, len(df))
+
+
+def test_only_rows_with_an_edited_start_or_duration_get_a_new_finish(task_table):
+    df = task_table(
+        ('A: Delivery', 'Team A', '2023-10-06', '2023-10-10', ''),
+        ('B: Delivery', 'Team B', '2023-10-02', '2023-10-03', '')
+    )
+    # A's Finish was set by hand, so its bar is longer than its Duration
+    df.loc[0, 'Duration'] = 1
+    changes, _ = Rescheduler(df).shift(df, editor_changes(df, {0: {'Notes': 'call first'}, 1: {'Duration': 3}}))
+
+    assert changes.edited.loc[0, 'Finish'] == pd.Timestamp('2023-10-10')
+    assert changes.edited.loc[0, 'Notes'] == 'call first'
+    assert changes.edited.loc[1, 'Finish'] == pd.Timestamp('2023-10-05')
+
+
+def test_an_edited_duration_counts_working_days(task_table):
+    df = task_table(
+        ('A: Delivery', 'Team A', '2023-10-06', '2023-10-07', ''),
+        ('B: Delivery', 'Team B', '2023-10-11', '2023-10-12', '0')
+    )
+    changes, pushed = Rescheduler(df).shift(df, editor_changes(df, {0: {'Duration': 3}}))
+
+    # Friday, Monday and Tuesday are worked
+    assert changes.edited.loc[0, 'Finish'] == pd.Timestamp('2023-10-11')
+    assert pushed.empty
+
+    holidays = Scheduler(holidays=['2023-10-09'])
+    changes, pushed = Rescheduler(df).shift(df, editor_changes(df, {0: {'Duration': 3}}), holidays)
+    assert changes.edited.loc[0, 'Finish'] == pd.Timestamp('2023-10-12')
+    assert pushed.tolist() == [1]
+    assert changes.edited.loc[1, ['Start', 'Finish']].tolist() == [pd.Timestamp('2023-10-12'), pd.Timestamp('2023-10-13')]
+
+
+def test_a_moved_task_keeps_its_length_and_pushes_its_successors(task_table):
+    df = task_table(
+        ('A: Delivery', 'Team A', '2023-10-02', '2023-10-05', ''),
+        ('B: Delivery', 'Team B', '2023-10-05', '2023-10-06', '0'),
+        ('C: Delivery', 'Team C', '2023-10-20', '2023-10-21', '1')
+    )
+    changes, pushed = Rescheduler(df).shift(df, editor_changes(df, {0: {'Start': pd.Timestamp('2023-10-04')}}))
+
+    assert changes.edited.loc[0, 'Finish'] == pd.Timestamp('2023-10-07')
+    # B slips two days; C has enough slack
+    assert pushed.tolist() == [1]
+    assert changes.edited.loc[1, ['Start', 'Finish']].tolist() == [pd.Timestamp('2023-10-07'), pd.Timestamp('2023-10-08')]
+    assert changes.cells.loc[1, ['Start', 'Finish']].all()
+
+
+def test_dates_are_read_when_shifting_not_when_the_rescheduler_is_built(task_table):
+    before = task_table(
+        ('A: Delivery', 'Team A', '2023-10-02', '2023-10-05', ''),
+        ('B: Delivery', 'Team B', '2023-10-03', '2023-10-04', '0')
+    )
+    rescheduler = Rescheduler(before)
+    assert not set(Rescheduler.COLUMNS) & {'Start', 'Finish', 'Duration'}
+
+    # B started before A finished, so A could not push it; once B is moved after A, it can
+    after = before.assign(Start=pd.to_datetime(['2023-10-02', '2023-10-05']),
+                          Finish=pd.to_datetime(['2023-10-05', '2023-10-06']))
+    changes, pushed = rescheduler.shift(after, editor_changes(after, {0: {'Start': pd.Timestamp('2023-10-03')}}))
+    assert pushed.tolist() == [1]
+    assert changes.edited.loc[1, 'Start'] == pd.Timestamp('2023-10-06')
+
+
+@pytest.fixture
+def unscheduled(task_table):
+    """Builds tables of tasks that have not started, from (resource, duration, predecessors) tuples."""
+    def unscheduled(*tasks):
+        df = task_table(*[(f"S{i}: Delivery", resource, None, None, predecessors)
+                          for i, (resource, _, predecessors) in enumerate(tasks)])
+        return df.assign(Duration=[duration for _, duration, _ in tasks])
+    return unscheduled
+
+
+def test_each_crew_works_one_task_at_a_time(unscheduled):
+    df = unscheduled(*[('Crew', 2, '')] * 4)
+    monday = pd.Timestamp('2023-10-02')
+
+    one_crew = Scheduler().schedule(df, start=monday)
+    assert one_crew['Start'].dt.strftime('%a %d').tolist() == ['Mon 02', 'Wed 04', 'Fri 06', 'Tue 10']
+
+    two_crews = Scheduler({'Crew': 2}).schedule(df, start=monday)
+    assert two_crews['Start'].dt.strftime('%a %d').tolist() == ['Mon 02', 'Mon 02', 'Wed 04', 'Wed 04']
+    assert two_crews['Finish'].max() == pd.Timestamp('2023-10-06')
+
+
+def test_tasks_start_after_their_predecessors_finish(unscheduled):
+    # Listed before the tasks they wait for, on crews of their own
+    df = unscheduled(('Crew C', 1, '1, 2'), ('Crew A', 3, ''), ('Crew B', 1, '1'))
+    scheduled = Scheduler().schedule(df, start=pd.Timestamp('2023-10-02'))
+
+    assert scheduled.loc[1, ['Start', 'Finish']].tolist() == [pd.Timestamp('2023-10-02'), pd.Timestamp('2023-10-05')]
+    assert scheduled.loc[2, 'Start'] == scheduled.loc[1, 'Finish']
+    assert scheduled.loc[0, 'Start'] == pd.Timestamp('2023-10-06')
+
+
+def test_weekends_and_holidays_are_not_worked(unscheduled):
+    df = unscheduled(('Crew', 2, ''))
+
+    # Saturday start: work starts on Monday
+    scheduled = Scheduler().schedule(df, start=pd.Timestamp('2023-10-07'))
+    assert scheduled.loc[0, ['Start', 'Finish']].tolist() == [pd.Timestamp('2023-10-09'), pd.Timestamp('2023-10-11')]
+
+    # Friday, then Tuesday after the Monday holiday
+    scheduled = Scheduler(holidays=['2023-10-09']).schedule(df, start=pd.Timestamp('2023-10-06'))
+    assert scheduled.loc[0, ['Start', 'Finish']].tolist() == [pd.Timestamp('2023-10-06'), pd.Timestamp('2023-10-11')]
+
+    # A six-day week
+    scheduled = Scheduler(weekmask='Mon Tue Wed Thu Fri Sat').schedule(df, start=pd.Timestamp('2023-10-06'))
+    assert scheduled.loc[0, 'Finish'] == pd.Timestamp('2023-10-09')
+
+
+def test_started_tasks_keep_their_dates_and_cycles_are_reported(unscheduled):
+    df = unscheduled(('Crew', 2, ''), ('Crew', 1, '0'))
+    df.loc[0, ['Start', 'Finish', 'Completion_pct']] = [pd.Timestamp('2023-10-02'), pd.Timestamp('2023-10-10'), 50]
+    scheduled = Scheduler().schedule(df, start=pd.Timestamp('2023-10-02'))
+
+    assert scheduled.loc[0, ['Start', 'Finish']].tolist() == [pd.Timestamp('2023-10-02'), pd.Timestamp('2023-10-10')]
+    assert scheduled.loc[1, 'Start'] == pd.Timestamp('2023-10-10')
+
+    with pytest.raises(ValueError, match='cycle'):
+        Scheduler().schedule(unscheduled(('Crew', 1, '1'), ('Crew', 1, '0')), start=pd.Timestamp('2023-10-02'))
@@ -0,0 +1,78 @@
+# tests/test_summary_stats.py
+import numpy as np
+import pandas as pd
+import pytest
+
+from change_set import ChangeSet
+from summary_stats import ProjectSummary
+from task_repository import TaskRepository
+from task_schema import CATEGORIES
+from task_store import open_task_store
+
+# Values the random changes draw from, including a category and a zone the table does not have yet
+RANDOM_CATEGORIES = CATEGORIES + ['Survey', 'Audit']
+RANDOM_ZONES = [0, 1, 2, 3, 7]
+RANDOM_COMPLETION = [0, 30, 50, 100]
+
+
+def assert_same_summary(summary, expected):
+    assert summary.total == expected.total
+    assert summary.status_counts == expected.status_counts
+    assert summary.category_counts.to_dict() == expected.category_counts.to_dict()
+    assert summary.zone_counts.to_dict() == expected.zone_counts.to_dict()
+    assert summary.earliest_start is expected.earliest_start or summary.earliest_start == expected.earliest_start
+    assert summary.latest_finish is expected.latest_finish or summary.latest_finish == expected.latest_finish
+    pd.testing.assert_frame_equal(summary.monthly, expected.monthly)
+
+
+def random_values(rng, n):
+    start = pd.Timestamp('2025-01-01') + pd.to_timedelta(rng.integers(0, 200, n), unit='D')
+    duration = rng.integers(1, 5, n)
+    return {
+        'Category': rng.choice(RANDOM_CATEGORIES, n),
+        'Trustee_Zone': rng.choice(RANDOM_ZONES, n),
+        'Completion_pct': rng.choice(RANDOM_COMPLETION, n),
+        'Start': start,
+        'Finish': start + pd.to_timedelta(duration, unit='D')
+    }
+
+
+def random_change(rng, tasks):
+    """A ChangeSet editing, adding and deleting random tasks."""
+    n_edit, n_add, n_delete = (int(rng.integers(0, 4)) for _ in range(3))
+    n_delete = min(n_delete, len(tasks) - 1)
+
+    edit_ids = pd.Index(rng.choice(tasks.index, min(n_edit, len(tasks)), replace=False))
+    columns = list(rng.choice(list(random_values(rng, 0)), int(rng.integers(1, 4)), replace=False))
+    values = random_values(rng, len(edit_ids))
+    edited = pd.DataFrame({col: values[col] for col in columns}, index=edit_ids)
+
+    added = tasks.iloc[:n_add].assign(**random_values(rng, n_add), Task=[f"Added {i}" for i in range(n_add)])
+    added = added.set_axis(pd.RangeIndex(10 ** 6, 10 ** 6 + n_add))
+
+    rest = tasks.index.difference(edit_ids)
+    deleted = pd.Index(rng.choice(rest, min(n_delete, len(rest)), replace=False), dtype='int64')
+    return ChangeSet(edited, added, deleted)
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_deltas_match_full_rebuilds(copy_on_write, tmp_path, project_tasks, seed):
+    rng = np.random.default_rng(seed)
+    repository = TaskRepository(open_task_store(str(tmp_path / 'tasks.db')))
+    repository.replace_all(project_tasks(30))
+
+    _, tasks = repository.snapshot()
+    summary = ProjectSummary(tasks)
+    for _ in range(40):
+        kind = rng.choice(['changes', 'append', 'delete'])
+        if kind == 'append':
+            rows = tasks.iloc[:2].drop(columns='Task_ID').assign(**random_values(rng, 2))
+            commit = repository.append(rows.reset_index(drop=True))
+        elif kind == 'delete':
+            commit = repository.delete(list(rng.choice(tasks.index, 2, replace=False)))
+        else:
+            commit = repository.apply_changes(random_change(rng, tasks))
+
+        summary.apply_change(added=commit.added, removed=commit.removed)
+        tasks = commit.tasks
+        assert_same_summary(summary, ProjectSummary(tasks))
@@ -0,0 +1,28 @@
+# tests/test_task_lookup.py
+from task_lookup import TaskLookup
+
+
+def test_search_matches_a_scan_of_every_name_while_typing(project_tasks):
+    tasks = project_tasks(120)
+    lookup = TaskLookup(tasks)
+    names = tasks['Task'].str.lower().tolist()
+
+    # Typing, deleting and retyping, a repeated search and an unrelated one
+    for text in ['s', 'sc', 'School 1', 'school 10', 'school 10', 'school 1', 'school 11: inst', 'Delivery', '', 'plan']:
+        expected = [position for position, name in enumerate(names) if text.lower() in name]
+        found, n_found = lookup.search(text, limit=len(tasks))
+        assert found.tolist() == expected
+        assert n_found == len(expected)
+
+
+def test_an_id_match_comes_first_and_the_limit_applies(project_tasks):
+    tasks = project_tasks(120)
+    lookup = TaskLookup(tasks)
+
+    # Task 10 is not a school 10 task, so it is listed before the names containing '10'
+    found, n_found = lookup.search('10', limit=3)
+    by_name = [position for position, name in enumerate(tasks['Task'].tolist()) if '10' in name]
+    assert found.tolist() == [lookup.position(10)] + by_name[:2]
+    assert n_found == 1 + len(by_name)
+
+    assert lookup.search('#10')[0].tolist() == [lookup.position(10)]
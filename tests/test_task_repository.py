@@ -0,0 +1,53 @@
+# tests/test_task_repository.py
+import pandas as pd
+import pytest
+
+from change_set import ChangeSet
+
+
+def edit(tasks):
+    ids = tasks.index[[3, 4, 7]]
+    edited = pd.DataFrame({
+        'Completion_pct': [100, 50, 0],
+        'Notes': ['changed', 'a new note', ''],
+        'Start': tasks.loc[ids, 'Start'] + pd.Timedelta(days=2)
+    }, index=ids)
+    return ChangeSet(edited, tasks.iloc[:0], tasks.index[:0])
+
+
+def add(tasks):
+    added = tasks.iloc[:2].assign(Task=['New A', 'New B']).set_axis(pd.RangeIndex(1000, 1002))
+    return ChangeSet(tasks.iloc[:0, :0], added, tasks.index[:0])
+
+
+def edit_add_and_delete(tasks):
+    changes = edit(tasks)
+    return ChangeSet(changes.edited, add(tasks).added, tasks.index[[10]])
+
+
+@pytest.mark.parametrize('make_changes', [edit, add, edit_add_and_delete])
+def test_changes_never_modify_the_published_snapshot(copy_on_write, repository, make_changes):
+    version, before = repository.snapshot()
+    expected = before.copy(deep=True)
+
+    changes = make_changes(before)
+    commit = repository.apply_changes(changes)
+
+    pd.testing.assert_frame_equal(before, expected)
+    assert commit.version > version
+    pd.testing.assert_frame_equal(commit.tasks, changes.rebase(expected).apply(expected))
+    if len(changes.edited):
+        assert commit.tasks.loc[changes.edited.index, 'Notes'].tolist() == ['changed', 'a new note', '']
+
+
+def test_delete_removes_only_existing_ids_and_keeps_the_snapshot(copy_on_write, repository):
+    version, before = repository.snapshot()
+    expected = before.copy(deep=True)
+    ids = [before.index[5], before.index[0], 10 ** 6, before.index[5]]
+
+    commit = repository.delete(ids)
+
+    pd.testing.assert_frame_equal(before, expected)
+    assert commit.removed.index.tolist() == [before.index[5], before.index[0]]
+    pd.testing.assert_frame_equal(commit.tasks, expected.drop(index=before.index[[0, 5]]))
+    assert repository.store.load()['Task_ID'].tolist() == commit.tasks.index.tolist()
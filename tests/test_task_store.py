@@ -0,0 +1,61 @@
+# tests/test_task_store.py
+import os
+
+import pytest
+
+from task_repository import TaskRepository
+from task_store import open_task_store
+
+
+@pytest.fixture
+def write_csv(project_tasks):
+    """Writes a converted project the way the converter CLI does, with a given modification time."""
+    def write_csv(path, n_schools, mtime_ns):
+        df = project_tasks(n_schools)
+        df.to_csv(path, index=False)
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+        return df
+    return write_csv
+
+
+def test_database_reimports_the_csv_only_when_it_is_newer(tmp_path, write_csv):
+    csv, db = str(tmp_path / 'gantt_data.csv'), str(tmp_path / 'gantt_data.db')
+    start = os.stat(tmp_path).st_mtime_ns
+    converted = write_csv(csv, 5, start)
+
+    store = open_task_store(db, import_csv=csv)
+    tasks = store.load()
+    assert len(tasks) == len(converted)
+
+    # Edits made in the app survive a restart while the CSV is unchanged
+    store.delete(tasks.index[:2])
+    assert len(open_task_store(db, import_csv=csv).load()) == len(converted) - 2
+
+    # New converter output replaces them
+    converted = write_csv(csv, 3, start + 10**9)
+    reloaded = open_task_store(db, import_csv=csv).load()
+    assert reloaded['Task'].tolist() == converted['Task'].tolist()
+
+
+def test_repository_picks_up_a_csv_written_while_it_runs(tmp_path, write_csv):
+    csv, db = str(tmp_path / 'gantt_data.csv'), str(tmp_path / 'gantt_data.db')
+    start = os.stat(tmp_path).st_mtime_ns
+    write_csv(csv, 5, start)
+    repository = TaskRepository(open_task_store(db, import_csv=csv))
+    version, _ = repository.snapshot()
+
+    converted = write_csv(csv, 3, start + 10**9)
+    new_version, tasks = repository.snapshot()
+    assert new_version > version
+    assert tasks['Task'].tolist() == converted['Task'].tolist()
+
+
+def test_database_without_an_import_record_keeps_its_newer_edits(tmp_path, write_csv):
+    csv, db = str(tmp_path / 'gantt_data.csv'), str(tmp_path / 'gantt_data.db')
+    start = os.stat(tmp_path).st_mtime_ns
+    # A database written after the CSV, by a version that did not record imports
+    write_csv(csv, 5, start - 10**9)
+    edited = write_csv(str(tmp_path / 'edited.csv'), 2, start)
+    open_task_store(db).replace_all(edited)
+
+    assert len(open_task_store(db, import_csv=csv).load()) == len(edited)
@@ -0,0 +1,44 @@
+# tests/test_timeline_levels.py
+import pandas as pd
+
+from timeline_levels import TimelineLevels
+
+# (task, zone) in an order where zones and schools first appear out of order
+TASKS = [
+    ('Final Documentation', 0), ('School B: Delivery', 8), ('School A: Delivery', 7),
+    ('School C: Delivery', 4), ('School D: Delivery', 10), ('School A: Installation', 7),
+    ('School F: Delivery', 2), ('School E: Delivery', 2), ('School G: Delivery', 'Closed')
+]
+
+
+def task_table():
+    df = pd.DataFrame({
+        'Task': [task for task, _ in TASKS],
+        'Trustee_Zone': [zone for _, zone in TASKS],
+        'Start': pd.date_range('2025-01-01', periods=len(TASKS)),
+        'Completion_pct': 0,
+        'Category': 'Delivery'
+    })
+    return df.assign(Finish=df['Start'] + pd.Timedelta(days=1))
+
+
+def test_zone_bars_come_in_zone_order():
+    bars = TimelineLevels(task_table()).summary('Zone')
+
+    assert bars['Label'].tolist() == [
+        'Zone 0', 'Zone 2', 'Zone 4', 'Zone 7', 'Zone 8', 'Zone 10', 'Zone Closed'
+    ]
+    assert bars['Tasks'].tolist() == [1, 2, 1, 2, 1, 1, 1]
+
+
+def test_school_bars_come_in_zone_then_name_order():
+    df = task_table()
+    levels = TimelineLevels(df)
+    expected = ['Final Documentation', 'School E', 'School F', 'School C', 'School A', 'School B',
+                'School D', 'School G']
+
+    assert levels.summary('School')['Label'].tolist() == expected
+
+    # A filtered summary keeps the same order
+    mask = (df['Trustee_Zone'].astype(str) != '4').to_numpy()
+    assert levels.summary('School', mask)['Label'].tolist() == [s for s in expected if s != 'School C']
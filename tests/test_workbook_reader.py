@@ -0,0 +1,67 @@
+# tests/test_workbook_reader.py
+import io
+from datetime import date, datetime
+
+import pandas as pd
+from openpyxl import Workbook
+from openpyxl.styles import Font
+
+from data_converter import PROJECT_SHEET, build_gantt_frame, convert_ups_data
+from workbook_reader import WorkbookReader
+
+HEADER = ['Sites', 'UPS Replacement Status', 'Trustee Zones', 'Notes', 'Deployment Date']
+
+
+def workbook(rows, formatted_below=0):
+    """Bytes of a workbook with a project sheet and `formatted_below` formatted empty rows under the data."""
+    book = Workbook()
+    sheet = book.active
+    sheet.title = PROJECT_SHEET
+    sheet.append(HEADER)
+    for row in rows:
+        sheet.append(row)
+    for offset in range(1, formatted_below + 1):
+        sheet.cell(row=len(rows) + 1 + offset, column=3).font = Font(bold=True)
+    buffer = io.BytesIO()
+    book.save(buffer)
+    return buffer.getvalue()
+
+
+def read(data):
+    with WorkbookReader(io.BytesIO(data)) as reader:
+        frames = list(reader.iter_frames(PROJECT_SHEET, chunk_size=2))
+    return pd.concat(frames).infer_objects()
+
+
+ROWS = [
+    ['A', 'Not Started', 3, 'x', None],
+    ['B', 'Done', 4, '', datetime(2025, 1, 2)],
+]
+
+
+def test_trailing_formatted_rows_are_dropped_like_read_excel():
+    data = workbook(ROWS, formatted_below=3)
+    expected = pd.read_excel(io.BytesIO(data), sheet_name=PROJECT_SHEET)
+
+    assert len(read(data)) == len(expected) == 2
+
+
+def test_empty_rows_between_data_rows_are_kept():
+    data = workbook([ROWS[0], [None] * 5, [None] * 5, ROWS[1]], formatted_below=2)
+    expected = pd.read_excel(io.BytesIO(data), sheet_name=PROJECT_SHEET)
+
+    rows = read(data)
+    assert len(rows) == len(expected) == 4
+    assert rows['Sites'].isna().tolist() == expected['Sites'].isna().tolist()
+
+
+def test_conversion_matches_read_excel_with_trailing_formatted_rows():
+    data = workbook(ROWS, formatted_below=1)
+    today = date(2025, 3, 10)
+
+    streamed = convert_ups_data(data, save_csv=False, today=today)
+    sheet = pd.read_excel(io.BytesIO(data), sheet_name=PROJECT_SHEET)
+    expected = build_gantt_frame(sheet, None, None, today)
+
+    assert streamed.to_csv(index=False) == expected.to_csv(index=False)
+    assert '3.0' not in streamed.to_csv(index=False)
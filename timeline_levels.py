@@ -0,0 +1,182 @@
+# timeline_levels.py
+import numpy as np
+import pandas as pd
+
+from filter_index import FilterIndex
+
+# Levels of detail, coarsest first
+LEVELS = ('Zone', 'School', 'Task')
+
+# Default number of bars the chart may draw before it switches to a coarser level
+DEFAULT_BAR_BUDGET = 400
+
+DAY = np.timedelta64(1, 'D')
+
+
+def box_window(box):
+    """
+    Days covered by a box selection on a date axis.
+
+    Parameters:
+    box (dict): One entry of a plotly selection's box list; its 'x' holds
+        the two ends as date strings or epoch milliseconds
+
+    Returns:
+    tuple: (datetime.date, datetime.date) First and last day, or None when
+        the box has no x range
+    """
+    ends = box.get('x') or []
+    if len(ends) != 2:
+        return None
+    ends = [pd.to_datetime(end, unit='ms') if isinstance(end, (int, float)) else pd.to_datetime(end) for end in ends]
+    first, last = sorted(ends)
+    return first.date(), last.date()
+
+
+def _zone_key(label):
+    """Sort key of a zone label: no zone first, then numbered zones in numeric order, then named ones."""
+    if label == '':
+        return (0, 0, '')
+    try:
+        return (1, float(label), label)
+    except ValueError:
+        return (2, 0, label)
+
+
+def _ranks(order):
+    """Rank of every position, given the positions in sorted order."""
+    ranks = np.empty(len(order), dtype='int64')
+    ranks[order] = np.arange(len(order))
+    return ranks
+
+
+class TimelineLevels:
+    """
+    Hierarchical Zone > School > Task index for drawing long timelines.
+
+    Zoomed out, the Gantt chart draws one summary bar per Trustee Zone or
+    per school instead of one per task. A summary bar runs from the earliest
+    Start to the latest Finish of its tasks, and its completion is the
+    average completion of its tasks weighted by their length in days.
+
+    The tasks are kept sorted by zone, then school, then Start, so the
+    tasks of every zone and of every school are contiguous. Summary bars
+    for any filter are then a few reduceat passes over the selected tasks
+    in that order, O(n) with no grouping step, and the summaries of the
+    whole table are computed once up front. Zones and schools are labelled
+    as in the FilterIndex, and a school split over two zones gets a bar in
+    each. Bars come in zone order (numbered zones in numeric order, then
+    named ones), and by school name within a zone.
+
+    Parameters:
+    df (pandas.DataFrame): The task table
+    index (FilterIndex, optional): Filter index of df, for its zone and school codes
+    """
+
+    # Task table columns the index is built from
+    COLUMNS = ('Task', 'Trustee_Zone', 'Start', 'Finish', 'Completion_pct')
+
+    def __init__(self, df, index=None):
+        start = df['Start'].to_numpy(dtype='datetime64[ns]')
+        finish = df['Finish'].to_numpy(dtype='datetime64[ns]')
+        self.size = len(df)
+        self.dated = ~np.isnat(start) & ~np.isnat(finish)
+
+        index = FilterIndex(df) if index is None else index
+        zones, schools = index.columns['Trustee_Zone'], index.columns['School']
+
+        # Code 0 is a missing zone or school, so every code is shifted up by one.
+        # The filter index numbers values as they first appear; renumber them
+        # so that codes follow zone order and school names.
+        zone_labels = np.append('', zones.labels).astype(object)
+        school_labels = np.append('', schools.labels).astype(object)
+        zone_order = np.array(sorted(range(len(zone_labels)), key=lambda i: _zone_key(zone_labels[i])), dtype='int64')
+        school_order = np.argsort(school_labels.astype(str), kind='stable')
+        zone_codes = _ranks(zone_order)[zones.codes.astype('int64') + 1]
+        school_codes = _ranks(school_order)[schools.codes.astype('int64') + 1]
+        zone_labels = zone_labels[zone_order]
+        school_labels = school_labels[school_order]
+
+        # Schools within zones: one group per (zone, school) pair, numbered in
+        # (zone, school) order
+        pair_codes, pairs = pd.factorize(zone_codes * len(school_labels) + school_codes, sort=True)
+
+        self._codes = {'Zone': zone_codes, 'School': pair_codes}
+        self._labels = {
+            'Zone': np.array([f"Zone {zone}" if zone else "No zone" for zone in zone_labels], dtype=object),
+            'School': school_labels[pairs % len(school_labels)]
+        }
+        self._zones = {'Zone': zone_labels, 'School': zone_labels[pairs // len(school_labels)]}
+
+        # Hierarchical order: zone, then school, then Start. Both group codes
+        # only grow along it, so every group is one contiguous run.
+        dated = np.flatnonzero(self.dated)
+        self.order = dated[np.lexsort((start[dated], pair_codes[dated]))]
+
+        completion = pd.to_numeric(df['Completion_pct'], errors='coerce').fillna(0).to_numpy(dtype=float)
+        self._start = start
+        self._finish = finish
+        self._weight = np.maximum((finish - start) / DAY, 1.0)
+        self._done = self._weight * completion
+        self._full = {level: self._summarize(level, self.order) for level in LEVELS[:-1]}
+
+    def _summarize(self, level, rows):
+        """Summary bars of one level over the given task positions (in hierarchical order)."""
+        codes = self._codes[level][rows]
+        if not len(rows):
+            return pd.DataFrame({'Label': [], 'Zone': [], 'Start': np.empty(0, dtype='datetime64[ns]'),
+                                 'Finish': np.empty(0, dtype='datetime64[ns]'), 'Completion_pct': [], 'Tasks': []})
+        firsts = np.flatnonzero(np.concatenate([[True], codes[1:] != codes[:-1]]))
+        groups = codes[firsts]
+        return pd.DataFrame({
+            'Label': self._labels[level][groups],
+            'Zone': self._zones[level][groups],
+            'Start': np.minimum.reduceat(self._start[rows], firsts),
+            'Finish': np.maximum.reduceat(self._finish[rows], firsts),
+            'Completion_pct': np.round(
+                np.add.reduceat(self._done[rows], firsts) / np.add.reduceat(self._weight[rows], firsts), 1
+            ),
+            'Tasks': np.diff(np.append(firsts, len(rows)))
+        })
+
+    def _selected(self, mask):
+        """Positions of the selected dated tasks, in hierarchical order."""
+        if mask is None:
+            return self.order
+        return self.order[np.asarray(mask, dtype=bool)[self.order]]
+
+    def count(self, level, mask=None):
+        """Number of bars the level draws for the selected tasks."""
+        rows = self._selected(mask)
+        if level == 'Task' or not len(rows):
+            return len(rows)
+        codes = self._codes[level][rows]
+        return int(np.count_nonzero(codes[1:] != codes[:-1])) + 1
+
+    def choose_level(self, mask=None, budget=DEFAULT_BAR_BUDGET):
+        """
+        The finest level that draws at most `budget` bars for the selected tasks.
+
+        Returns:
+        str: 'Task', 'School' or 'Zone' (Zone when even that is over budget)
+        """
+        for level in reversed(LEVELS[1:]):
+            if self.count(level, mask) <= budget:
+                return level
+        return LEVELS[0]
+
+    def summary(self, level, mask=None):
+        """
+        Summary bars of a level for the selected tasks.
+
+        Parameters:
+        level (str): 'Zone' or 'School'
+        mask (numpy.ndarray, optional): Boolean mask of the tasks to include (default: all)
+
+        Returns:
+        pandas.DataFrame: Label, Zone, Start, Finish, Completion_pct (weighted
+            by task length) and number of Tasks of each bar, in zone order
+        """
+        if mask is None or np.asarray(mask, dtype=bool)[self.order].all():
+            return self._full[level]
+        return self._summarize(level, self._selected(mask))
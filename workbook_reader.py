@@ -0,0 +1,146 @@
+# workbook_reader.py
+import pandas as pd
+from openpyxl import load_workbook
+from openpyxl.cell.cell import ERROR_CODES
+
+# Rows per DataFrame chunk handed to the converter
+DEFAULT_CHUNK_SIZE = 10000
+
+
+def _convert_cell(value):
+    """Convert a cell value the way pandas.read_excel does."""
+    if value is None or (isinstance(value, str) and value in ERROR_CODES):
+        return None
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def _header_names(header_row):
+    """Column names from the header row, using pandas' 'Unnamed: i' and 'name.1' conventions."""
+    names = []
+    seen = {}
+    for i, value in enumerate(header_row):
+        name = f"Unnamed: {i}" if value is None else value
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+        names.append(name)
+    return names
+
+
+class WorkbookReader:
+    """
+    Read-only, single-pass access to the sheets of an .xlsx workbook.
+
+    The workbook is opened once and the sheet names are known up front, so
+    optional sheets can be checked without parsing them. Rows are streamed
+    from openpyxl's read-only mode, so only one chunk of a sheet is held in
+    memory at a time.
+
+    Parameters:
+    source (str or file-like): Path or binary buffer of the .xlsx file
+    """
+
+    def __init__(self, source):
+        self._workbook = load_workbook(source, read_only=True, data_only=True)
+        self.sheet_names = list(self._workbook.sheetnames)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        self._workbook.close()
+
+    def has_sheet(self, sheet_name):
+        return sheet_name in self.sheet_names
+
+    def iter_rows(self, sheet_name):
+        """
+        Stream the rows of a sheet, cut or padded to the width of its header row.
+
+        Empty rows are only yielded once a non-empty row follows them: like
+        pandas.read_excel, trailing rows that only carry formatting are
+        dropped, while empty rows between data rows are kept.
+
+        Parameters:
+        sheet_name (str): Name of the sheet to read
+
+        Yields:
+        list: The header names first, then one list of cell values per row
+        """
+        if not self.has_sheet(sheet_name):
+            raise ValueError(f"Worksheet named '{sheet_name}' not found")
+
+        rows = self._workbook[sheet_name].iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+
+        # Drop trailing empty header cells, as pandas does
+        header = list(header)
+        while header and header[-1] is None:
+            header.pop()
+        width = len(header)
+        yield _header_names(header)
+
+        empty_rows = 0
+        for row in rows:
+            values = [_convert_cell(v) for v in row[:width]]
+            if all(v is None for v in values):
+                empty_rows += 1
+                continue
+            for _ in range(empty_rows):
+                yield [None] * width
+            empty_rows = 0
+            if len(values) < width:
+                values.extend([None] * (width - len(values)))
+            yield values
+
+    def iter_frames(self, sheet_name, columns=None, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Stream a sheet as DataFrame chunks of at most `chunk_size` rows.
+
+        Chunks keep object dtype so every chunk of a column has the same
+        type; callers infer column types over the whole stream if needed.
+
+        Parameters:
+        sheet_name (str): Name of the sheet to read
+        columns (list, optional): Only keep these columns (those the sheet has)
+        chunk_size (int): Maximum rows per chunk
+
+        Yields:
+        pandas.DataFrame: Consecutive row chunks with a running RangeIndex
+        """
+        rows = self.iter_rows(sheet_name)
+        header = next(rows, None)
+        if header is None:
+            return
+
+        if columns is None:
+            positions = list(range(len(header)))
+        else:
+            positions = [i for i, name in enumerate(header) if name in columns]
+        names = [header[i] for i in positions]
+
+        start = 0
+        batch = []
+        for row in rows:
+            batch.append([row[i] for i in positions])
+            if len(batch) >= chunk_size:
+                yield self._frame(batch, names, start)
+                start += len(batch)
+                batch = []
+        if batch:
+            yield self._frame(batch, names, start)
+
+    @staticmethod
+    def _frame(batch, names, start):
+        frame = pd.DataFrame(batch, columns=names, dtype=object)
+        frame.index = pd.RangeIndex(start, start + len(batch))
+        return frame